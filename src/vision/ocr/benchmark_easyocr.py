@@ -0,0 +1,135 @@
+import argparse
+import json
+import time
+from pathlib import Path
+
+from engines.easyocr_batch import batch_settings, readtext_batched
+from engines.raster import get_page_cache, iter_pages
+
+
+# ============================================================
+# EASYOCR THROUGHPUT BENCHMARK
+# ============================================================
+
+def load_pages(pdfs, dpi: int, max_pages: int, colorspace: str):
+    """
+    Pages of every PDF, rendered up front so only OCR is timed.
+    Several PDFs exercise batching across documents.
+    """
+    images = []
+    cache = get_page_cache()
+    for pdf in pdfs:
+        last = min(cache.page_count(str(pdf)), max_pages)
+        for _, img in iter_pages(str(pdf), dpi=dpi, colorspace=colorspace, last_page=last):
+            images.append(img)
+    return images
+
+
+def _prepare(img):
+    return img.gray() if img.channels == 1 else img.array
+
+
+def time_per_page(reader, images):
+    start = time.perf_counter()
+    for img in images:
+        reader.readtext(_prepare(img))
+    return time.perf_counter() - start
+
+
+def time_batched(reader, images, batch_images: int, batch_size: int, workers: int):
+    start = time.perf_counter()
+    readtext_batched(
+        reader, images,
+        batch_images=batch_images,
+        batch_size=batch_size,
+        workers=workers
+    )
+    return time.perf_counter() - start
+
+
+def run_benchmark(pdfs, dpi: int, max_pages: int, colorspace: str,
+                  batch_images_grid, batch_size_grid, workers_grid):
+
+    import easyocr
+    reader = easyocr.Reader(["en"], gpu=False)
+
+    images = load_pages(pdfs, dpi, max_pages, colorspace)
+    print(f"\n⏱ EasyOCR on {len(images)} pages from {len(pdfs)} PDFs @ {dpi} DPI ({colorspace})")
+
+    # warm-up: first call pays for model and kernel initialisation
+    reader.readtext(_prepare(images[0]))
+
+    base_sec = time_per_page(reader, images)
+    base_rate = len(images) / base_sec
+    print(f"Per-page loop           : {base_rate:.2f} images/sec")
+
+    results = [{
+        "mode": "per_page",
+        "images": len(images),
+        "time_sec": round(base_sec, 3),
+        "images_per_sec": round(base_rate, 2),
+        "speedup": 1.0,
+    }]
+
+    for batch_images in batch_images_grid:
+        for batch_size in batch_size_grid:
+            for workers in workers_grid:
+                elapsed = time_batched(reader, images, batch_images, batch_size, workers)
+                rate = len(images) / elapsed
+
+                res = {
+                    "mode": "batched",
+                    "batch_images": batch_images,
+                    "batch_size": batch_size,
+                    "workers": workers,
+                    "images": len(images),
+                    "time_sec": round(elapsed, 3),
+                    "images_per_sec": round(rate, 2),
+                    "speedup": round(base_sec / elapsed, 2),
+                }
+                print(f"Batched {batch_images:>2} img / {batch_size:>3} crops / "
+                      f"{workers} workers: {res['images_per_sec']} images/sec "
+                      f"(speedup {res['speedup']}x)")
+
+                results.append(res)
+
+    best = max(results, key=lambda r: r["images_per_sec"])
+    if best["mode"] == "batched":
+        print(f"\n🚀 Best: OCR_EASYOCR_BATCH={best['batch_images']} "
+              f"OCR_EASYOCR_RECOG_BATCH={best['batch_size']} "
+              f"OCR_EASYOCR_WORKERS={best['workers']}")
+
+    return results
+
+
+# ============================================================
+# ENTRY
+# ============================================================
+
+if __name__ == "__main__":
+    defaults = batch_settings()
+
+    parser = argparse.ArgumentParser("EasyOCR Batched Throughput Benchmark")
+    parser.add_argument("pdfs", nargs="+")
+    parser.add_argument("--dpi", type=int, default=120)
+    parser.add_argument("--max-pages", type=int, default=10, help="Pages per PDF")
+    parser.add_argument("--colorspace", default="gray", choices=["rgb", "gray"])
+    parser.add_argument("--batch-images", type=int, nargs="+", default=[defaults["batch_images"]])
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[defaults["batch_size"]])
+    parser.add_argument("--workers", type=int, nargs="+", default=[defaults["workers"]])
+    parser.add_argument("--output", help="Optional JSON report path")
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        [Path(p) for p in args.pdfs],
+        args.dpi,
+        args.max_pages,
+        args.colorspace,
+        args.batch_images,
+        args.batch_size,
+        args.workers
+    )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n📁 {args.output} saved")
@@ -0,0 +1,159 @@
+import argparse
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+
+from engines.parallel_render import PARALLEL_MIN_PAGES
+from engines.raster import PageRasterCache, iter_pages
+from engines.render import RENDERERS, open_renderer
+
+
+# ============================================================
+# RENDER LATENCY BENCHMARK
+# ============================================================
+
+def benchmark_backend(pdf_path: str, backend: str, dpi: int, max_pages: int, colorspace: str):
+
+    timings = []
+
+    with open_renderer(pdf_path, backend) as renderer:
+        pages = min(renderer.page_count(), max_pages)
+
+        for page_index in range(pages):
+            start = time.perf_counter()
+            renderer.render(page_index, dpi=dpi, colorspace=colorspace)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    timings_sorted = sorted(timings)
+    p95_idx = max(0, int(round(0.95 * len(timings_sorted))) - 1)
+    total_sec = sum(timings) / 1000
+
+    return {
+        "backend": backend,
+        "pages": len(timings),
+        "dpi": dpi,
+        "colorspace": colorspace,
+        "mean_ms": round(statistics.mean(timings), 2),
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings_sorted[p95_idx], 2),
+        "pages_per_sec": round(len(timings) / total_sec, 2) if total_sec else 0,
+    }
+
+
+def run_benchmark(pdf_path: Path, backends, dpi: int, max_pages: int, colorspace: str):
+
+    results = []
+
+    for backend in backends:
+        print(f"\n⏱ {backend} @ {dpi} DPI ({colorspace})")
+
+        try:
+            res = benchmark_backend(str(pdf_path), backend, dpi, max_pages, colorspace)
+        except Exception as e:
+            print(f"⚠ {backend} unavailable: {e}")
+            continue
+
+        print(f"Pages      : {res['pages']}")
+        print(f"Mean (ms)  : {res['mean_ms']}")
+        print(f"P50 (ms)   : {res['p50_ms']}")
+        print(f"P95 (ms)   : {res['p95_ms']}")
+        print(f"Pages/sec  : {res['pages_per_sec']}")
+
+        results.append(res)
+
+    if len(results) == 2:
+        base, other = sorted(results, key=lambda r: r["backend"] != "pdf2image")
+        if other["mean_ms"]:
+            print(f"\n🚀 {other['backend']} speedup vs {base['backend']}: "
+                  f"{round(base['mean_ms'] / other['mean_ms'], 2)}x")
+
+    return results
+
+
+# ============================================================
+# PARALLEL SCALING BENCHMARK
+# ============================================================
+
+def run_scaling(pdf_path: Path, max_workers: int, dpi: int, max_pages: int, colorspace: str):
+
+    with open_renderer(str(pdf_path), "pymupdf") as renderer:
+        pages = list(range(1, min(renderer.page_count(), max_pages) + 1))
+
+    results = []
+    baseline = None
+
+    print(f"\n⏱ Parallel render scaling @ {dpi} DPI ({len(pages)} pages)")
+    print(f"(at most one worker per {PARALLEL_MIN_PAGES} pages and per core; "
+          f"fewer pages render in-process)")
+
+    for workers in range(1, max_workers + 1):
+        # fresh memory-only cache so every run renders every page
+        cache = PageRasterCache(disk_dir="")
+
+        start = time.perf_counter()
+        for _ in iter_pages(
+            str(pdf_path),
+            dpi=dpi,
+            colorspace=colorspace,
+            pages=pages,
+            workers=workers,
+            cache=cache
+        ):
+            pass
+        elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+
+        res = {
+            "workers": workers,
+            "pages": len(pages),
+            "time_sec": round(elapsed, 3),
+            "pages_per_sec": round(len(pages) / elapsed, 2),
+            "speedup": round(baseline / elapsed, 2),
+        }
+        print(f"Workers {workers:>2}: {res['pages_per_sec']} pages/sec "
+              f"(speedup {res['speedup']}x)")
+
+        results.append(res)
+
+    return results
+
+
+# ============================================================
+# ENTRY
+# ============================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("Page Render Latency Benchmark")
+    parser.add_argument("pdf")
+    parser.add_argument("--backends", nargs="+", default=list(RENDERERS.keys()), choices=RENDERERS.keys())
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--colorspace", default="rgb", choices=["rgb", "gray"])
+    parser.add_argument("--scaling", type=int, nargs="?", const=os.cpu_count() or 1,
+                        help="Benchmark parallel rendering with 1..N worker processes")
+    parser.add_argument("--output", help="Optional JSON report path")
+    args = parser.parse_args()
+
+    if args.scaling:
+        results = run_scaling(
+            Path(args.pdf),
+            args.scaling,
+            args.dpi,
+            args.max_pages,
+            args.colorspace
+        )
+    else:
+        results = run_benchmark(
+            Path(args.pdf),
+            args.backends,
+            args.dpi,
+            args.max_pages,
+            args.colorspace
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n📁 {args.output} saved")
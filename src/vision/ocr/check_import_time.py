@@ -0,0 +1,133 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+# ============================================================
+# IMPORT-TIME BUDGET CHECK
+# ============================================================
+# Importing a CLI must not load models or their frameworks; engines
+# are resolved through engines.registry only when chosen.
+
+MODULES = [
+    "run_ocr",
+    "run_fintabnet_benchmark",
+    "doclaynet_benchmark",
+    "benchmark_runner",
+    "engine.text",
+    "engine.textonly",
+    "engine.table",
+]
+
+HEAVY_MODULES = ["torch", "transformers", "docling", "easyocr", "paddleocr"]
+
+# light dependencies of metrics/, stubbed when not installed so the
+# budget is enforced in any environment (heavy modules never are)
+STUB_MODULES = ["jiwer", "rapidfuzz"]
+
+DEFAULT_BUDGET_MS = float(os.getenv("OCR_IMPORT_BUDGET_MS", "1500"))
+
+PROBE = """
+import importlib.abc, importlib.machinery, json, sys, time, types
+
+heavy_modules = json.loads(sys.argv[2])
+stub_modules = json.loads(sys.argv[3])
+stubbed = []
+
+
+class Stub(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return type(name, (), {})
+
+
+class StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    # last on sys.meta_path: only consulted when the real import fails
+    def find_spec(self, fullname, path, target=None):
+        root = fullname.split(".")[0]
+        if root not in stub_modules:
+            return None
+        if fullname == root:
+            stubbed.append(root)
+        return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        return Stub(spec.name)
+
+    def exec_module(self, module):
+        module.__path__ = []
+
+
+sys.meta_path.append(StubFinder())
+
+start = time.perf_counter()
+try:
+    __import__(sys.argv[1])
+except ModuleNotFoundError as e:
+    # a missing heavy module means it was imported eagerly
+    root = (e.name or "").split(".")[0]
+    if root not in heavy_modules:
+        raise
+    print(json.dumps({"ms": None, "heavy": [root], "stubbed": stubbed}))
+    sys.exit(0)
+elapsed = time.perf_counter() - start
+heavy = [m for m in heavy_modules if m in sys.modules]
+print(json.dumps({"ms": round(elapsed * 1000, 1), "heavy": heavy, "stubbed": stubbed}))
+"""
+
+
+def measure(module: str, cwd: Path = Path(__file__).resolve().parent) -> dict:
+    """
+    Import `module` in a fresh interpreter. Returns {"ms", "heavy",
+    "stubbed"} or {"error": last traceback line}.
+    """
+    # fresh interpreter per module, so nothing is already imported
+    proc = subprocess.run(
+        [
+            sys.executable, "-c", PROBE, module,
+            json.dumps(HEAVY_MODULES), json.dumps(STUB_MODULES)
+        ],
+        cwd=cwd, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def over_budget(report: dict, budget_ms: float = DEFAULT_BUDGET_MS) -> bool:
+    return bool(report["heavy"]) or report["ms"] > budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time budget for the OCR CLIs")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    args = parser.parse_args()
+
+    failed = False
+    stubbed = set()
+
+    for module in args.modules:
+        report = measure(module)
+        print(json.dumps({"module": module, **report}))
+
+        stubbed.update(report.get("stubbed", []))
+        if "error" in report or over_budget(report, args.budget_ms):
+            failed = True
+
+    if stubbed:
+        print(f"⚠ Stubbed, not installed: {', '.join(sorted(stubbed))}")
+
+    if failed:
+        print(f"❌ Import-time budget ({args.budget_ms:.0f} ms, no model frameworks) exceeded")
+        sys.exit(1)
+
+    print(f"✅ All imports within {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ from typing import Dict
 
 
 from metrics.accuracy import accuracy_report
+from engines.docling_cache import enable_docling_cache
+from engines.registry import load_engine
 
 
 # -----------------------------
@@ -87,13 +89,10 @@ def run_doclaynet_benchmark(dataset_dir: Path, engine_name: str):
         print(f"❌ Unknown engine: {engine_name}")
         return
 
-    import importlib
+    # same PDFs every run: reuse conversions when only metrics changed
+    enable_docling_cache()
 
-    module_path, class_name = ENGINES[engine_name].rsplit(".", 1)
-    module = importlib.import_module(module_path)
-    engine_class = getattr(module, class_name)
-
-    engine = engine_class()
+    engine = load_engine(ENGINES[engine_name])()
 
     aggregator = BenchmarkAggregator()
 
@@ -5,8 +5,7 @@ from pathlib import Path
 from engines.classifier import LayoutClassifier
 from engines.text import run_paddle_ocr, evaluate_text
 from engines.table import run_table_ocr, evaluate_table
-
-import fitz  # PyMuPDF
+from engines.raster import get_page_cache
 
 
 # ============================================================
@@ -37,11 +36,9 @@ def extract_gt_text(gt_json):
 
 
 def pdf_to_image(pdf_path, page_num=0):
-    doc = fitz.open(pdf_path)
-    pix = doc[page_num].get_pixmap()
-    img_path = f"temp_page_{page_num}.png"
-    pix.save(img_path)
-    return img_path
+    # 72 DPI matches the old get_pixmap() default; the page stays
+    # an in-memory buffer, nothing is written to the CWD
+    return get_page_cache().get(pdf_path, page_num, dpi=72).array
 
 
 # ============================================================
@@ -102,33 +99,33 @@ def run_benchmark(dataset_dir: Path):
 
         pages_processed = 0
 
-        for page_num in range(start_page - 1, end_page):
-
-            image_path = pdf_to_image(str(pdf), page_num)
-
-            regions = classifier.classify(image_path)
-
-            for region in regions:
-
-                # -----------------------------
-                # TEXT REGION → PaddleOCR
-                # -----------------------------
-                if region["type"] == "text":
-                    text = run_paddle_ocr(image_path)
-                    full_text_output += text + "\n"
-
-                # -----------------------------
-                # TABLE REGION → Docling
-                # -----------------------------
-                elif region["type"] == "table":
-                    table_result = run_table_ocr(
-                        str(pdf),
-                        start_page=page_num + 1,
-                        end_page=page_num + 1
-                    )
-
-                    if table_result["success"]:
-                        full_table_markdown += table_result["markdown"] + "\n"
+        # one thumbnail pass; table pages come back with a bbox
+        regions = classifier.classify(str(pdf), start_page, end_page)
+
+        for region in regions:
+
+            page_num = region["page"] - 1
+
+            # -----------------------------
+            # TEXT REGION → PaddleOCR (low DPI page)
+            # -----------------------------
+            if region["label"] == "text":
+                image = pdf_to_image(str(pdf), page_num)
+                text = run_paddle_ocr(image)
+                full_text_output += text + "\n"
+
+            # -----------------------------
+            # TABLE REGION → Docling
+            # -----------------------------
+            elif region["label"] == "table":
+                table_result = run_table_ocr(
+                    str(pdf),
+                    start_page=page_num + 1,
+                    end_page=page_num + 1
+                )
+
+                if table_result["success"]:
+                    full_table_markdown += table_result["markdown"] + "\n"
 
             pages_processed += 1
 
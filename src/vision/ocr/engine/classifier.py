@@ -1,34 +1,74 @@
-from typing import List, Dict
-from pdf2image import convert_from_path
+from typing import Dict, Iterable, List, Optional
 import numpy as np
 import cv2
 
+from engines.raster import get_page_cache
+from engines.render import THUMBNAIL_DPI, pixels_to_clip
+
 
 class LayoutClassifier:
+    """
+    Runs on a thumbnail, rendered directly at `dpi`.
+
+    When the caller renders the same pages for OCR anyway, pass that
+    DPI as `base_dpi` (a multiple of `dpi`): the thumbnail is then
+    downsampled from the OCR render, one decode shared by both.
+    Without such a consumer a higher base only adds decode work.
+
+    Table pages also carry a "bbox" (PDF points, top-left origin)
+    spanning the detected ruling lines, so callers can render just
+    that region at high DPI (see engines.regions).
+    """
+
+    def __init__(
+        self,
+        dpi: int = THUMBNAIL_DPI,
+        base_dpi: Optional[int] = None,
+        colorspace: str = "gray"
+    ):
+        self.dpi = dpi
+        self.base_dpi = base_dpi
+        self.colorspace = colorspace
 
-    def classify(self, pdf_path: str, start_page=None, end_page=None) -> List[Dict]:
+    def classify(
+        self,
+        pdf_path: str,
+        start_page=None,
+        end_page=None,
+        pages: Optional[Iterable[int]] = None
+    ) -> List[Dict]:
+        """
+        One {"page", "label"} per page from start_page to end_page,
+        or only the 1-based `pages` when given.
+        """
+        cache = get_page_cache()
 
-        images = convert_from_path(
-            pdf_path,
-            dpi=120,
-            first_page=start_page,
-            last_page=end_page,
-            poppler_path=r"C:\poppler\Library\bin"
-        )
+        if pages is None:
+            first = start_page or 1
+            last = end_page or cache.page_count(pdf_path)
+            pages = range(first, last + 1)
+
+        # line thresholds were tuned at 120 DPI
+        scale = self.dpi / 120
 
         regions = []
 
-        for i, img in enumerate(images):
+        for page_no in pages:
 
-            img_np = np.array(img)
-            gray = cv2.cvtColor(img_np, cv2.COLOR_BGR2GRAY)
+            page = cache.get(
+                pdf_path, page_no - 1,
+                dpi=self.dpi,
+                colorspace=self.colorspace,
+                derive_from=self.base_dpi
+            )
+            gray = page.gray()
 
             edges = cv2.Canny(gray, 50, 150)
 
             lines = cv2.HoughLinesP(
                 edges, 1, np.pi/180,
-                threshold=100,
-                minLineLength=50,
+                threshold=int(100 * scale),
+                minLineLength=int(50 * scale),
                 maxLineGap=10
             )
 
@@ -47,9 +87,25 @@ class LayoutClassifier:
             else:
                 label = "text"
 
-            regions.append({
-                "page": (start_page or 1) + i,
+            region = {
+                "page": page_no,
                 "label": label
-            })
+            }
+            if label == "table" and lines is not None:
+                region["bbox"] = self._line_bbox(lines, page.dpi)
+
+            regions.append(region)
 
         return regions
+
+    # --------------------------------------------------
+    @staticmethod
+    def _line_bbox(lines: np.ndarray, dpi: int):
+        """
+        Bounding box of Hough segments, in PDF points.
+        """
+        pts = lines.reshape(-1, 4)
+        xs = np.concatenate([pts[:, 0], pts[:, 2]])
+        ys = np.concatenate([pts[:, 1], pts[:, 3]])
+        box = (int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1)
+        return pixels_to_clip(box, dpi)
@@ -3,14 +3,16 @@
 
 import time
 import logging
-import threading
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Sequence
 
-from PyPDF2 import PdfReader, PdfWriter
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
+from engines.converter_pool import ConverterOptions, ConverterPool, get_converter_pool
+from engines.docling_cache import DoclingResultCache
+from engines.docling_chunks import convert_jobs
+from engines.document import PdfDocument, open_document
+from engines.page_dedup import plan_pages, skip_report
+from engines.progress import ProgressCallback, ProgressTracker
 
 
 # -----------------------------
@@ -23,52 +25,32 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# -----------------------------
-# PDF validation
-# -----------------------------
-def is_valid_pdf(pdf_path: str) -> bool:
-    try:
-        PdfReader(pdf_path)
-        return True
-    except Exception:
-        return False
-
-
-def has_embedded_text(pdf_path: str) -> bool:
-    try:
-        reader = PdfReader(pdf_path)
-        for page in reader.pages[:3]:
-            if page.extract_text():
-                return True
-        return False
-    except Exception:
-        return False
-
-
-# -----------------------------
-# PDF Split Helper
-# -----------------------------
-def create_temp_pdf(original_path: Path, start_page: int, end_page: int) -> Path:
-    reader = PdfReader(str(original_path))
-    writer = PdfWriter()
-
-    for i in range(start_page - 1, end_page):
-        writer.add_page(reader.pages[i])
-
-    temp_path = original_path.parent / f"__temp_{original_path.name}"
-
-    with open(temp_path, "wb") as f:
-        writer.write(f)
-
-    return temp_path
-
-
 # -----------------------------
 # Docling OCR Engine
 # -----------------------------
 class OCREngine:
 
-    def __init__(self):
+    def __init__(
+        self,
+        skip_duplicates: bool = True,
+        table_mode: str = "accurate",
+        pool: Optional[ConverterPool] = None,
+        workers: Optional[int] = None,
+        result_cache: Optional[DoclingResultCache] = None
+    ):
+        # blank and repeated pages are dropped before conversion
+        self.skip_duplicates = skip_duplicates
+        self.table_mode = table_mode
+
+        # long documents are converted in page chunks on this many
+        # worker processes (None: OCR_DOCLING_WORKERS, else in-process)
+        self.workers = workers
+
+        # converted chunks are reused across runs (None: shared cache)
+        self.result_cache = result_cache
+
+        # warm converters are shared across engines and threads
+        self.pool = pool or get_converter_pool()
         logger.info("Docling OCR Engine initialized")
 
     def _clean_text(self, text: str) -> str:
@@ -77,22 +59,21 @@ class OCREngine:
         text = re.sub(r"\s+", " ", text)
         return text.strip()
 
-    def _create_converter(self, force_ocr: bool = False):
-
-        pipeline_options = PdfPipelineOptions()
-
-        pipeline_options.do_ocr = force_ocr
-        pipeline_options.do_table_structure = True
-        pipeline_options.table_structure_options.do_cell_matching = True
-        pipeline_options.enable_remote_services = False
+    def _converter_options(self, force_ocr: bool = False) -> ConverterOptions:
+        return ConverterOptions(
+            do_ocr=force_ocr,
+            do_table_structure=True,
+            table_mode=self.table_mode,
+            do_cell_matching=True
+        )
 
-        return DocumentConverter(
-            allowed_formats=[InputFormat.PDF],
-            format_options={
-                InputFormat.PDF: PdfFormatOption(
-                    pipeline_options=pipeline_options
-                )
-            }
+    def prewarm(self):
+        """
+        Load both converters (text layer and OCR) ahead of the first
+        document, e.g. at service or benchmark start-up.
+        """
+        self.pool.prewarm(
+            [self._converter_options(False), self._converter_options(True)]
         )
 
     # -----------------------------
@@ -101,9 +82,11 @@ class OCREngine:
     def process_pdf(
         self,
         pdf_path: str,
-        progress_cb: Optional[Callable[[str], None]] = None,
+        progress_cb: Optional[ProgressCallback] = None,
         start_page: Optional[int] = None,
-        end_page: Optional[int] = None
+        end_page: Optional[int] = None,
+        document: Optional[PdfDocument] = None,
+        pages: Optional[Sequence[int]] = None
     ) -> Dict[str, Any]:
 
         pdf_path = Path(pdf_path).expanduser().resolve()
@@ -111,7 +94,12 @@ class OCREngine:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        if not is_valid_pdf(str(pdf_path)):
+        # parsed once; validity, page count and text layer come from here
+        own_document = document is None
+        if own_document:
+            document = open_document(str(pdf_path))
+
+        if not document.valid:
             return {
                 "success": False,
                 "error": "Invalid or corrupted PDF",
@@ -124,74 +112,86 @@ class OCREngine:
             logger.info(msg)
 
         try:
-            reader = PdfReader(str(pdf_path))
-            total_pages = len(reader.pages)
+            total_pages = document.page_count
 
             notify(f"PDF loaded successfully ({total_pages} pages detected)")
 
-            # -----------------------------
-            # Split PDF if needed
-            # -----------------------------
-            temp_pdf = pdf_path
-
             if start_page and end_page:
                 if start_page < 1 or end_page > total_pages:
                     raise ValueError("Invalid page range")
 
                 notify(f"Processing pages {start_page}-{end_page}")
-                temp_pdf = create_temp_pdf(pdf_path, start_page, end_page)
 
-            notify("OCR started — processing pages")
+            # explicit selection (e.g. engines.statement_locator) wins
+            if pages is not None:
+                pages = sorted(set(pages))
+                if not pages or pages[0] < 1 or pages[-1] > total_pages:
+                    raise ValueError("Invalid page selection")
 
-            # -----------------------------
-            # Progress simulation
-            # -----------------------------
-            progress = {"page": 0}
-            stop_flag = {"done": False}
+                notify(f"Processing {len(pages)} selected pages")
+            else:
+                pages = list(range(start_page or 1, (end_page or total_pages) + 1))
 
-            pages_to_process = (
-                end_page - start_page + 1
-                if start_page and end_page
-                else total_pages
-            )
+            requested = len(pages)
+            requested_pages = pages
 
-            def progress_simulator():
-                while not stop_flag["done"] and progress["page"] < pages_to_process:
-                    time.sleep(1.5)
-                    progress["page"] += 1
-                    notify(f"Processing page {progress['page']} of {pages_to_process}")
+            plan = None
+            if self.skip_duplicates:
+                plan = plan_pages(str(pdf_path), pages, document=document)
+                pages = plan["process"]
+                if not pages:
+                    raise ValueError("All selected pages are blank or duplicates")
 
-            t = threading.Thread(target=progress_simulator, daemon=True)
-            t.start()
+            notify("OCR started — processing pages")
 
             # -----------------------------
             # Run Docling
             # -----------------------------
             start_time = time.time()
 
-            embedded = has_embedded_text(str(temp_pdf))
-            notify(f"Embedded text detected: {embedded}")
-
-            converter = self._create_converter(force_ocr=not embedded)
-            result = converter.convert(str(temp_pdf))
+            # real completions (per chunk) with rate and ETA
+            tracker = ProgressTracker(len(pages), progress_cb, stage="convert")
+
+            # per-page triage (text layer + image area, no raster)
+            kinds = Counter(document.page_kind(p) for p in pages)
+            notify(f"Page triage: {dict(kinds)}")
+
+            # contiguous runs sharing an OCR decision; chunks come
+            # back in page order, numbered as in the source PDF
+            jobs = [
+                (self._converter_options(force_ocr=needs_ocr), list(range(run_start, run_end + 1)))
+                for needs_ocr, run_start, run_end in document.ocr_runs(pages=pages)
+            ]
+
+            docs = convert_jobs(
+                str(pdf_path), jobs,
+                document=document,
+                workers=self.workers,
+                pool=self.pool,
+                cache=self.result_cache,
+                notify=notify,
+                progress=tracker
+            )
 
             elapsed = round(time.time() - start_time, 2)
 
-            stop_flag["done"] = True
-            t.join()
+            notify("OCR completed successfully")
 
-            # Clean temp file
-            if temp_pdf != pdf_path and temp_pdf.exists():
-                temp_pdf.unlink()
+            # duplicate pages reuse their original's results
+            duplicate_of = plan["duplicate_of"] if plan else {}
 
-            notify("OCR completed successfully")
+            def source(p):
+                return duplicate_of.get(p, p)
 
-            doc = result.document
+            doc_of = {p: doc for doc in docs for p in doc.pages}
+            output_pages = [p for p in requested_pages if source(p) in doc_of]
 
             # =============================
             # TEXT (KEEP ORIGINAL)
             # =============================
-            raw_text = doc.export_to_text()
+            raw_text = "\n".join(
+                doc_of[source(p)].export_to_text(page_no=source(p)) for p in output_pages
+            )
 
             # minimal cleaning (SAFE)
             import re
@@ -202,10 +202,21 @@ class OCREngine:
             # =============================
             tables_output = []
 
-            for i, table in enumerate(doc.tables):
+            tables_by_page = {}
+            for doc in docs:
+                for table in doc.tables:
+                    page_no = table.prov[0].page_no if table.prov else None
+                    tables_by_page.setdefault(page_no, []).append(table)
+
+            tables = [(None, t) for t in tables_by_page.get(None, [])]
+            for p in output_pages:
+                tables += [(p, t) for t in tables_by_page.get(source(p), [])]
+
+            for i, (page_no, table) in enumerate(tables):
 
                 table_dict = {
                     "table_id": i,
+                    "page": page_no,
                     "rows": []
                 }
 
@@ -233,8 +244,12 @@ class OCREngine:
                 "text": raw_text,                     # 🔥 keep original
                 "cleaned_text": cleaned_text,         # 🔥 optional
                 "tables": tables_output,              # 🔥 IMPORTANT
-                "markdown": doc.export_to_markdown(), # 🔥 structure
-                "pages": pages_to_process,
+                "markdown": "\n\n".join(
+                    doc_of[source(p)].export_to_markdown(page_no=source(p)) for p in output_pages
+                ),
+                "pages": requested,
+                "page_kinds": dict(kinds),
+                "skipped": skip_report(plan, elapsed / len(pages)) if plan else None,
                 "time_sec": elapsed
             }
         
@@ -245,4 +260,8 @@ class OCREngine:
                 "error": str(e)
             }
 
+        finally:
+            if own_document:
+                document.close()
+
 
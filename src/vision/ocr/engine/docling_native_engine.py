@@ -1,12 +1,15 @@
 import time
 import logging
+from collections import Counter
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional
 
-from PyPDF2 import PdfReader
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
+from engines.converter_pool import ConverterOptions, ConverterPool, get_converter_pool
+from engines.docling_cache import DoclingResultCache
+from engines.docling_chunks import convert_jobs, merge_documents
+from engines.document import PdfDocument, open_document
+from engines.progress import ProgressCallback, ProgressTracker
 
 
 # --------------------------------------------------
@@ -19,28 +22,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# --------------------------------------------------
-# Helpers
-# --------------------------------------------------
-def is_valid_pdf(path: str) -> bool:
-    try:
-        PdfReader(path)
-        return True
-    except Exception:
-        return False
-
-
-def has_embedded_text(path: str) -> bool:
-    try:
-        reader = PdfReader(path)
-        for page in reader.pages[:3]:
-            if page.extract_text():
-                return True
-        return False
-    except Exception:
-        return False
-
-
 # --------------------------------------------------
 # Engine
 # --------------------------------------------------
@@ -52,32 +33,46 @@ class DoclingNativeEngine:
     - RapidOCR → text
     - TableFormer → tables
     - Layout model → structure
+
+    The engine holds no per-request state: options are frozen values
+    resolved per call and converters come from a shared pool keyed
+    by option set, so one instance can serve concurrent requests.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        options: Optional[ConverterOptions] = None,
+        pool: Optional[ConverterPool] = None,
+        workers: Optional[int] = None,
+        result_cache: Optional[DoclingResultCache] = None
+    ):
         logger.info("Initializing Docling Native Engine")
 
-        opts = PdfPipelineOptions()
-
-        # Smart OCR decision handled dynamically later
-        opts.do_ocr = True
+        # Defaults for every request; OCR is decided per page later
+        self.options = options or ConverterOptions(
+            do_table_structure=True,
+            do_cell_matching=True
+        )
 
-        # Enable table extraction
-        opts.do_table_structure = True
-        opts.table_structure_options.do_cell_matching = True
+        self.pool = pool or get_converter_pool()
 
-        # Local only (secure)
-        opts.enable_remote_services = False
+        # page-chunk worker processes for long documents
+        self.workers = workers
 
-        self.converter = DocumentConverter(
-            allowed_formats=[InputFormat.PDF],
-            format_options={
-                InputFormat.PDF: PdfFormatOption(pipeline_options=opts)
-            }
-        )
+        # converted chunks are reused across runs (None: shared cache)
+        self.result_cache = result_cache
 
         logger.info("Docling Native Engine ready")
 
+    def prewarm(self):
+        """
+        Build the text-layer and OCR converters before the first request.
+        """
+        self.pool.prewarm([
+            replace(self.options, do_ocr=False),
+            replace(self.options, do_ocr=True)
+        ])
+
     # --------------------------------------------------
     def _clean(self, text: str) -> str:
         import re
@@ -88,15 +83,27 @@ class DoclingNativeEngine:
     def process_pdf(
         self,
         pdf_path: str,
-        progress_cb: Optional[Callable[[str], None]] = None
+        progress_cb: Optional[ProgressCallback] = None,
+        document: Optional[PdfDocument] = None,
+        options: Optional[ConverterOptions] = None,
+        ocr: Optional[bool] = None
     ) -> Dict[str, Any]:
+        """
+        `options` overrides the engine defaults for this request only.
+        `ocr` forces OCR on (True) or off (False) for every page;
+        None decides per page from the text layer.
+        """
 
         pdf_path = Path(pdf_path).resolve()
 
         if not pdf_path.exists():
             raise FileNotFoundError(pdf_path)
 
-        if not is_valid_pdf(str(pdf_path)):
+        own_document = document is None
+        if own_document:
+            document = open_document(str(pdf_path))
+
+        if not document.valid:
             return {"success": False, "error": "Invalid PDF"}
 
         def notify(msg):
@@ -105,36 +112,48 @@ class DoclingNativeEngine:
                 progress_cb(msg)
 
         try:
-            reader = PdfReader(str(pdf_path))
-            pages = len(reader.pages)
+            pages = document.page_count
 
             notify(f"Loaded PDF ({pages} pages)")
 
             start = time.time()
 
-            embedded = has_embedded_text(str(pdf_path))
-            notify(f"Embedded text detected: {embedded}")
+            base = options or self.options
 
-            # If embedded text exists → disable OCR for speed
-            if embedded:
-                self.converter.format_to_options[
-                    InputFormat.PDF
-                ].pipeline_options.do_ocr = False
+            # Per-page triage → OCR only runs of scanned / mixed pages
+            if ocr is None:
+                runs = document.ocr_runs()
             else:
-                self.converter.format_to_options[
-                    InputFormat.PDF
-                ].pipeline_options.do_ocr = True
-
-            # ---- Run Docling ----
-            result = self.converter.convert(str(pdf_path))
+                runs = [(ocr, 1, pages)]
+            kinds = dict(Counter(info["kind"] for info in document.triage()))
+            notify(f"Page triage: {kinds}")
+
+            jobs = [
+                (replace(base, do_ocr=needs_ocr), list(range(run_start, run_end + 1)))
+                for needs_ocr, run_start, run_end in runs
+            ]
+
+            # ---- Run Docling (page chunks, in page order) ----
+            docs = convert_jobs(
+                str(pdf_path), jobs,
+                document=document,
+                workers=self.workers,
+                pool=self.pool,
+                cache=self.result_cache,
+                notify=notify,
+                progress=ProgressTracker(pages, progress_cb, stage="convert")
+            )
 
             elapsed = round(time.time() - start, 2)
 
             notify("Extraction finished")
 
-            text = result.document.export_to_text()
-            markdown = result.document.export_to_markdown()
-            data = result.document.export_to_dict()
+            # chunks already carry source page numbers
+            merged = merge_documents(docs)
+
+            text = merged.export_to_text()
+            markdown = merged.export_to_markdown()
+            data = merged.export_to_dict()
 
             return {
                 "success": True,
@@ -142,6 +161,7 @@ class DoclingNativeEngine:
                 "markdown": markdown,
                 "data": data,
                 "pages": pages,
+                "page_kinds": kinds,
                 "time_sec": elapsed
             }
 
@@ -151,3 +171,7 @@ class DoclingNativeEngine:
                 "success": False,
                 "error": str(e)
             }
+
+        finally:
+            if own_document:
+                document.close()
@@ -1,5 +1,6 @@
 from typing import List, Dict
-import numpy as np
+
+from engines.page_image import as_page_image, axis_std, mean_abs_diff
 
 
 class LayoutClassifier:
@@ -17,23 +18,21 @@ class LayoutClassifier:
 
         for i, img in enumerate(images):
 
-            img_np = np.array(img)
-
-            # grayscale
-            gray = img_np.mean(axis=2)
+            # grayscale (uint8 view / memoized luma, no float copy)
+            gray = as_page_image(img).gray()
 
             # -----------------------------
             # FEATURES
             # -----------------------------
 
             # horizontal variation (tables → low)
-            horizontal_var = np.std(gray, axis=1).mean()
+            horizontal_var = axis_std(gray, axis=1).mean()
 
             # vertical variation (tables → structured)
-            vertical_var = np.std(gray, axis=0).mean()
+            vertical_var = axis_std(gray, axis=0).mean()
 
             # edge density (tables → more lines)
-            edges = np.abs(np.diff(gray, axis=1)).mean()
+            edges = mean_abs_diff(gray)
 
             # -----------------------------
             # DECISION (IMPROVED)
@@ -52,13 +51,16 @@ class LayoutClassifier:
     
 
 
-import easyocr
-import numpy as np
 import re
+from functools import lru_cache
 from metrics.accuracy import accuracy_report
+from engines.page_image import as_page_image
 
-# initialize once
-reader = easyocr.Reader(['en'], gpu=False)
+# initialize once, on first use: importing easyocr pulls in torch
+@lru_cache(maxsize=1)
+def get_reader():
+    import easyocr
+    return easyocr.Reader(['en'], gpu=False)
 
 
 # -----------------------------
@@ -66,10 +68,11 @@ reader = easyocr.Reader(['en'], gpu=False)
 # -----------------------------
 def run_easyocr(image):
 
-    # convert PIL → numpy
-    image_np = np.array(image)
+    # PageImage buffer → numpy (no copy); gray renders go in 2-D
+    page = as_page_image(image)
+    image_np = page.gray() if page.channels == 1 else page.array
 
-    results = reader.readtext(image_np)
+    results = get_reader().readtext(image_np)
 
     texts = []
 
@@ -111,11 +114,10 @@ import argparse
 import json
 from pathlib import Path
 
-from pdf2image import convert_from_path
-
 from engines.classifier import LayoutClassifier
 from engines.text import run_easyocr, evaluate_text
 from engines.table import run_table_pipeline
+from engines.raster import get_page_cache
 
 
 def normalize(text: str):
@@ -189,13 +191,13 @@ def run_pipeline(dataset_dir: Path):
         # =============================
         # LOAD IMAGES FIRST (IMPORTANT)
         # =============================
-        images = convert_from_path(
-            str(pdf),
-            dpi=120,
-            first_page=start_page,
-            last_page=end_page,
-            poppler_path=r"C:\poppler\Library\bin"
-        )
+        cache = get_page_cache()
+        last_page = end_page or cache.page_count(str(pdf))
+
+        images = [
+            cache.get(str(pdf), page_index, dpi=120)
+            for page_index in range(start_page - 1, last_page)
+        ]
 
         # =============================
         # CLASSIFICATION (ON LIMITED IMAGES)
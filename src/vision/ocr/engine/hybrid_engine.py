@@ -2,21 +2,14 @@
 import time
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-import numpy as np
-import fitz  # PyMuPDF
-import pytesseract
-from PIL import Image
-
-from PyPDF2 import PdfReader
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-
-
-# ---- SET YOUR TESSERACT PATH HERE ----
-pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+from engines.classifier import LayoutClassifier
+from engines.document import PdfDocument, open_document
+from engines.layout_pass import run_layout_pass
+from engines.raster import get_page_cache, iter_pages
+from engines.regions import render_regions
+from engines.tesseract_pool import TesseractPool, get_tesseract_pool
 
 
 logger = logging.getLogger(__name__)
@@ -30,96 +23,150 @@ class HybridOCREngine:
         Docling → layout + tables
         Tesseract → paragraph text
 
-    Routing logic:
-        table page → Docling OCR
-        text page → Tesseract OCR
+    Every page goes through one Docling layout pass; OCR runs once,
+    and only where the text layer is unusable:
+
+        native page        → text layer (no OCR)
+        scanned table page → Docling OCR (fills the table cells)
+        scanned text page  → Tesseract OCR
+
+    Table pages Docling could not read fall back to Tesseract on
+    the table regions only, clipped and rendered at table_dpi.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        render_workers: int = 1,
+        table_dpi: int = 300,
+        workers: Optional[int] = None,
+        tesseract_pool: Optional[TesseractPool] = None
+    ):
         logger.info("Initializing Hybrid OCR Engine")
 
-        opts = PdfPipelineOptions()
-        opts.do_ocr = True
-        opts.do_table_structure = True
-        opts.table_structure_options.do_cell_matching = True
-        opts.enable_remote_services = False
+        self.render_workers = render_workers
+        self.table_dpi = table_dpi
 
-        self.converter = DocumentConverter(
-            allowed_formats=[InputFormat.PDF],
-            format_options={
-                InputFormat.PDF: PdfFormatOption(pipeline_options=opts)
-            }
-        )
+        # Docling page-chunk workers (see engines.docling_chunks)
+        self.workers = workers
 
-    # --------------------------------------------------
-    def _page_has_table(self, page):
-        for block in getattr(page, "blocks", []):
-            if getattr(block, "label", "") == "table":
-                return True
-        return False
+        # persistent Tesseract recognizers (engines.tesseract_pool)
+        self.tesseract = tesseract_pool or get_tesseract_pool()
 
-    # --------------------------------------------------
-    def _valid_pdf(self, path):
-        try:
-            PdfReader(path)
-            return True
-        except Exception:
-            return False
+        # thumbnail classifier splits scanned pages between the two OCRs
+        self.classifier = LayoutClassifier()
 
     # --------------------------------------------------
-    def process_pdf(self, pdf_path: str) -> Dict[str, Any]:
+    def process_pdf(
+        self,
+        pdf_path: str,
+        document: Optional[PdfDocument] = None
+    ) -> Dict[str, Any]:
 
         pdf_path = Path(pdf_path)
 
         if not pdf_path.exists():
             return {"success": False, "error": "File not found"}
 
-        if not self._valid_pdf(str(pdf_path)):
+        own_document = document is None
+        if own_document:
+            document = open_document(str(pdf_path))
+
+        try:
+            return self._process(pdf_path, document)
+        finally:
+            if own_document:
+                document.close()
+
+    # --------------------------------------------------
+    def _process(self, pdf_path: Path, document: PdfDocument) -> Dict[str, Any]:
+
+        if not document.valid:
             return {"success": False, "error": "Invalid PDF"}
 
         start = time.time()
 
-        reader = PdfReader(str(pdf_path))
-        page_count = len(reader.pages)
+        page_count = document.page_count
+        pages = list(range(1, page_count + 1))
 
-        # ---------- Docling Layout Pass ----------
-        result = self.converter.convert(str(pdf_path))
-        doc = result.document
+        # page renders below reuse the handle's open document
+        get_page_cache().attach(document)
 
-        # ---------- Renderer ----------
-        pdf = fitz.open(str(pdf_path))
+        # ---------- OCR routing (text layer + thumbnails, no OCR) ----------
+        scanned = [i for i in pages if document.needs_ocr(i)]
 
-        pages_text = []
+        # text-layer pages are already routed: only scanned ones are split
+        table_guess = set()
+        if scanned:
+            table_guess = {
+                r["page"]
+                for r in self.classifier.classify(str(pdf_path), pages=scanned)
+                if r["label"] == "table"
+            }
 
-        for i, page in enumerate(doc.pages.values()):
+        docling_ocr = [i for i in scanned if i in table_guess]
+        tesseract_ocr = [i for i in scanned if i not in table_guess]
 
-            # -------- TABLE PAGE → Docling OCR --------
-            if self._page_has_table(page):
-                pages_text.append(page.export_to_text())
-                continue
+        # ---------- Docling Layout Pass (once per page) ----------
+        layout = run_layout_pass(
+            pdf_path, document,
+            pages=pages,
+            ocr_pages=docling_ocr,
+            workers=self.workers
+        )
 
-            # -------- TEXT PAGE → Tesseract OCR --------
-            pix = pdf[i].get_pixmap(dpi=300, alpha=False)
+        pages_text = {}
 
-            img = np.frombuffer(
-                pix.samples,
-                dtype=np.uint8
-            ).reshape(pix.h, pix.w, 3)
+        # table clusters from the layout pass, in PDF points
+        table_boxes = layout.region_boxes(labels=("table",))
 
-            pil_img = Image.fromarray(img)
+        for i in pages:
 
-            text = pytesseract.image_to_string(pil_img, lang="eng")
+            if i in tesseract_ocr:
+                continue
 
-            pages_text.append(text.strip())
+            # -------- text layer / Docling OCR --------
+            text = layout.page_text(i)
+
+            # Docling came back empty → OCR only the table clips
+            if not text and i in table_boxes:
+                _, crops = render_regions(
+                    str(pdf_path), i, table_boxes[i],
+                    dpi=self.table_dpi,
+                    page_dpi=None
+                )
+                text = "\n".join(
+                    clip.text() for _, clip in self.tesseract.imap(enumerate(crops), psm=6)
+                )
+
+            pages_text[i] = text
+
+        # -------- SCANNED TEXT PAGES → Tesseract OCR --------
+        # rendered by the shared cache, optionally across worker processes
+        # and recognized by the pool's workers as they arrive
+        rendered = iter_pages(
+            str(pdf_path),
+            dpi=300,
+            colorspace="gray",
+            pages=tesseract_ocr,
+            workers=self.render_workers
+        )
+
+        # added to the layout pass, so markdown and data carry them too
+        for i, ocr in self.tesseract.imap(rendered, lang="eng"):
+            layout.add_ocr_page(i, ocr, dpi=300)
+            pages_text[i] = layout.page_text(i)
 
         elapsed = round(time.time() - start, 2)
 
         return {
             "success": True,
-            "text": "\n".join(pages_text),
-            "markdown": doc.export_to_markdown(),
-            "data": doc.export_to_dict(),
+            "text": "\n".join(pages_text[i] for i in sorted(pages_text)),
+            "markdown": layout.markdown(),
+            "data": layout.data(),
             "pages": page_count,
+            "ocr_pages": {
+                "docling": docling_ocr,
+                "tesseract": tesseract_ocr
+            },
             "time_sec": elapsed
         }
-
@@ -1,10 +1,16 @@
 import argparse
 import json
 from pathlib import Path
-from pdf2image import convert_from_path
 
-from engines.text import run_easyocr, evaluate_text
+from engines.text import get_reader, results_to_text, evaluate_text
 from engines.table import run_table_pipeline
+from engines.classifier import LayoutClassifier
+from engines.raster import iter_pages
+from engines.docling_cache import enable_docling_cache
+from engines.document import open_document
+from engines.easyocr_batch import readtext_stream
+from engines.layout_pass import run_layout_pass
+from engines.statement_locator import locate_statements, statement_pages
 from metrics.compliance_rules import validate_compliance
 
 
@@ -36,7 +42,10 @@ def extract_gt_text(gt_json):
 # -----------------------------
 # MAIN PIPELINE
 # -----------------------------
-def run_pipeline(dataset_dir: Path):
+def run_pipeline(dataset_dir: Path, render_workers: int = 1):
+
+    # same PDFs every run: reuse conversions when only metrics changed
+    enable_docling_cache()
 
     pdfs = list(dataset_dir.glob("*.pdf"))
 
@@ -46,6 +55,8 @@ def run_pipeline(dataset_dir: Path):
     if limits_file.exists():
         page_limits = json.load(open(limits_file))
 
+    classifier = LayoutClassifier()
+
     for pdf in pdfs:
 
         print("\n====================================")
@@ -63,28 +74,79 @@ def run_pipeline(dataset_dir: Path):
         # -----------------------------
         # PAGE LIMITS
         # -----------------------------
+        # page_limits.json entries override the automatic locator
         limits = page_limits.get(pdf.name, {})
         start_page = limits.get("start_page", 1)
         end_page = limits.get("end_page")
+        table_pages = None
+
+        # the handle is released on skip and on any error below
+        with open_document(str(pdf)) as document:
+            if not document.valid:
+                print(f"⚠ Invalid PDF ({document.error}), skipping")
+                continue
+
+            if not limits:
+                located = locate_statements(document)
+                table_pages = statement_pages(located) or None
+                print(f"📍 Statements: {located or 'not found, using all pages'}")
+
+            pages = list(range(start_page, (end_page or document.page_count) + 1))
+
+            # =============================
+            # SHARED LAYOUT PASS (Docling)
+            # =============================
+            # one pass feeds both pipelines; OCR runs once per page and
+            # only without a usable text layer: Docling on statement
+            # pages (table cells), EasyOCR on the rest
+            statement_set = set(table_pages or pages)
+            scanned = [p for p in pages if document.needs_ocr(p)]
+            easyocr_pages = [p for p in scanned if p not in statement_set]
+
+            # TableFormer where the classifier sees a table, and always on
+            # the statement pages the financial metrics are scored on
+            classified = {
+                r["page"]
+                for r in classifier.classify(str(pdf), pages[0], pages[-1])
+                if r["label"] == "table"
+            } | statement_set
+
+            print("\n--- LAYOUT PASS (Docling) ---")
+            print(f"Table pages: {len(classified & set(pages))} of {len(pages)}")
+
+            layout = run_layout_pass(
+                pdf, document,
+                pages=pages,
+                ocr_pages=[p for p in scanned if p in statement_set],
+                table_pages=classified
+            )
 
         # =============================
-        # TEXT PIPELINE (EasyOCR)
+        # TEXT PIPELINE (text layer + EasyOCR)
         # =============================
         print("\n--- TEXT OCR (EasyOCR) ---")
 
-        images = convert_from_path(
+        page_texts = {
+            p: layout.page_text(p) for p in pages if p not in easyocr_pages
+        }
+
+        # pages go to EasyOCR in micro-batches as they are rendered
+        rendered = iter_pages(
             str(pdf),
             dpi=120,
-            first_page=start_page,
-            last_page=end_page,
-            poppler_path=r"C:\poppler\Library\bin"
+            colorspace="gray",
+            pages=easyocr_pages,
+            workers=render_workers
         )
 
+        for page_no, results in readtext_stream(get_reader(), rendered):
+            print(f"Processed page {page_no}")
+            page_texts[page_no] = results_to_text(results)
+
         text_output = ""
 
-        for i, img in enumerate(images):
-            print(f"Processing page {start_page + i}")
-            out = run_easyocr(img)
+        for page_no in pages:
+            out = page_texts.get(page_no, "")
 
             if len(out.strip()) > 5:
                 text_output += out + "\n"
@@ -107,7 +169,9 @@ def run_pipeline(dataset_dir: Path):
             str(pdf),
             gt_json,
             start_page=start_page,
-            end_page=end_page
+            end_page=end_page,
+            pages=table_pages,
+            layout=layout
         )
 
         fin = table["financial"]
@@ -146,6 +210,7 @@ def run_pipeline(dataset_dir: Path):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser("Dual OCR Pipeline")
     parser.add_argument("--dataset", required=True)
+    parser.add_argument("--render-workers", type=int, default=1)
     args = parser.parse_args()
 
-    run_pipeline(Path(args.dataset))
+    run_pipeline(Path(args.dataset), render_workers=args.render_workers)
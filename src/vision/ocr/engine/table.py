@@ -1,17 +1,38 @@
-from engines.docling_engine import OCREngine
+from functools import lru_cache
 from metrics.accuracy_financial_new import financial_accuracy_report
 import re
 
-engine = OCREngine()
 
+@lru_cache(maxsize=1)
+def get_engine():
+    # Docling is imported and its engine built on the first table run
+    from engines.docling_engine import OCREngine
+    return OCREngine()
 
-def run_table_pipeline(pdf_path, gt_json, start_page=None, end_page=None):
 
-    result = engine.process_pdf(
-        pdf_path,
-        start_page=start_page,
-        end_page=end_page
-    )
+def run_table_pipeline(
+    pdf_path, gt_json, start_page=None, end_page=None, pages=None,
+    layout=None, table_pages=None
+):
+
+    # reuse a layout pass the caller already ran (engines.layout_pass)
+    if layout is not None:
+        if pages is None:
+            pages = range(start_page or 1, (end_page or max(layout.pages)) + 1)
+        result = {
+            "success": True,
+            "markdown": layout.markdown(pages),
+            "text": layout.text(pages)
+        }
+    else:
+        # table_pages (LayoutClassifier) → table-only Docling mode
+        result = get_engine().process_pdf(
+            pdf_path,
+            start_page=start_page,
+            end_page=end_page,
+            pages=pages,
+            table_pages=table_pages
+        )
 
     if not result["success"]:
         raise Exception("Docling OCR failed")
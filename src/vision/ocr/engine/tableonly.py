@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional, Callable
 
 import numpy as np
 
-from PyPDF2 import PdfReader, PdfWriter
+from engines.native_text_engine import NativeTextEngine
 
 # ============================================================
 # LOGGING
@@ -126,26 +126,17 @@ def validate_compliance(gt_json, ocr_text):
 # OCR ENGINE (SIMPLIFIED DOC OCR)
 # ============================================================
 class OCREngine:
+    """
+    Text-layer extraction via NativeTextEngine (PyMuPDF words with
+    coordinates) instead of PyPDF2 extract_text.
+    """
 
     def __init__(self):
         logger.info("OCR Engine initialized")
-        self.reader = easyocr.Reader(['en'], gpu=False)
+        self.engine = NativeTextEngine()
 
     def process_pdf(self, pdf_path: str):
-
-        reader = PdfReader(pdf_path)
-        text = ""
-
-        for page in reader.pages:
-            page_text = page.extract_text() or ""
-            text += page_text + "\n"
-
-        return {
-            "success": True,
-            "text": text,
-            "pages": len(reader.pages),
-            "time_sec": 1
-        }
+        return self.engine.process_pdf(pdf_path)
 
 # ============================================================
 # HELPER
@@ -1,17 +1,38 @@
-import easyocr
-import numpy as np
+from functools import lru_cache
 import re
 from metrics.accuracy import accuracy_report
+from engines.page_image import as_page_image
+from engines.easyocr_batch import readtext_batched
 
-reader = easyocr.Reader(['en'], gpu=False)
+@lru_cache(maxsize=1)
+def get_reader():
+    # built on first use: importing easyocr pulls in torch
+    import easyocr
+    return easyocr.Reader(['en'], gpu=False)
 
 
 def run_easyocr(image):
-    image_np = np.array(image)
-    results = reader.readtext(image_np)
+    page = as_page_image(image)
+    image_np = page.gray() if page.channels == 1 else page.array
+    results = get_reader().readtext(image_np)
 
-    text = " ".join([res[1] for res in results])
-    return text
+    return results_to_text(results)
+
+
+def run_easyocr_batch(images, **kwargs):
+    """
+    run_easyocr over many images (pages, or crops from several
+    documents) in detector/recognizer micro-batches. Returns one
+    text per image, in order.
+    """
+    return [
+        results_to_text(results)
+        for results in readtext_batched(get_reader(), images, **kwargs)
+    ]
+
+
+def results_to_text(results):
+    return " ".join([res[1] for res in results])
 
 
 def preprocess_text(text: str):
@@ -1,13 +1,14 @@
+from functools import lru_cache
 from typing import List, Dict
-import numpy as np
-import easyocr
 import re
 import argparse
 import json
 from pathlib import Path
-from pdf2image import convert_from_path
 
 from metrics.accuracy import accuracy_report
+from engines.raster import get_page_cache, iter_pages
+from engines.page_image import as_page_image, axis_std, mean_abs_diff
+from engines.easyocr_batch import readtext_batched
 
 
 # =========================================================
@@ -16,6 +17,10 @@ from metrics.accuracy import accuracy_report
 class LayoutClassifier:
     """
     Fast heuristic classifier (image-based)
+
+    Thresholds were tuned on 120 DPI renders: classify the OCR_DPI
+    page itself. Input is rendered gray (luminance) rather than the
+    channel mean of an RGB render; the two differ only on colour.
     """
 
     def classify_images(self, images, start_page=1) -> List[Dict]:
@@ -24,15 +29,13 @@ class LayoutClassifier:
 
         for i, img in enumerate(images):
 
-            img_np = np.array(img)
-
-            # grayscale
-            gray = img_np.mean(axis=2)
+            # grayscale (uint8 view / memoized luma, no float copy)
+            gray = as_page_image(img).gray()
 
             # FEATURES
-            horizontal_var = np.std(gray, axis=1).mean()
-            vertical_var = np.std(gray, axis=0).mean()
-            edges = np.abs(np.diff(gray, axis=1)).mean()
+            horizontal_var = axis_std(gray, axis=1).mean()
+            vertical_var = axis_std(gray, axis=0).mean()
+            edges = mean_abs_diff(gray)
 
             # DECISION
             if horizontal_var < 15 and edges > 5:
@@ -48,16 +51,43 @@ class LayoutClassifier:
         return regions
 
 
+# =========================================================
+# RENDERING
+# =========================================================
+OCR_DPI = 120        # EasyOCR, and the classifier on the same render
+COLORSPACE = "gray"  # both stages only use luminance
+
+
 # =========================================================
 # OCR
 # =========================================================
-reader = easyocr.Reader(['en'], gpu=False)
+@lru_cache(maxsize=1)
+def get_reader():
+    # built on first use: importing easyocr pulls in torch
+    import easyocr
+    return easyocr.Reader(['en'], gpu=False)
 
 
 def run_easyocr(image):
-    image_np = np.array(image)
-    results = reader.readtext(image_np)
+    page = as_page_image(image)
+    image_np = page.gray() if page.channels == 1 else page.array
+    results = get_reader().readtext(image_np)
+
+    return results_to_text(results)
 
+
+def run_easyocr_batch(images, **kwargs) -> List[str]:
+    """
+    run_easyocr over many pages in detector/recognizer
+    micro-batches. Returns one text per image, in order.
+    """
+    return [
+        results_to_text(results)
+        for results in readtext_batched(get_reader(), images, **kwargs)
+    ]
+
+
+def results_to_text(results) -> str:
     texts = []
 
     for (bbox, text, confidence) in results:
@@ -213,75 +243,86 @@ def run_pipeline(dataset_dir: Path):
         start_page = limits.get("start_page", 1)
         end_page = limits.get("end_page", None)
 
-        # LOAD IMAGES
-        images = convert_from_path(
-            str(pdf),
-            dpi=120,
-            first_page=start_page,
-            last_page=end_page,
-            poppler_path=r"C:\poppler\Library\bin"  # adjust if needed
-        )
-
-        # CLASSIFICATION
-        print("\n🔍 Running Layout Classification...")
-        regions = classifier.classify_images(images, start_page)
+        cache = get_page_cache()
 
-        text_regions = [r for r in regions if r["label"] == "text"]
-
-        print(f"Text Regions: {len(text_regions)}")
+        if end_page is None:
+            end_page = cache.page_count(str(pdf))
 
-        # TEXT OCR
-        print("\n--- TEXT OCR ---")
+        # CLASSIFICATION + TEXT OCR (streamed page by page)
+        print("\n🔍 Running Layout Classification + TEXT OCR...")
 
         text_output = ""
         page_outputs = []
+        text_regions = []
+        ocr_queue = []
 
-        # limit for speed
-        text_regions = text_regions[:10]
+        for page_no, image in iter_pages(
+            str(pdf),
+            dpi=OCR_DPI,
+            colorspace=COLORSPACE,
+            first_page=start_page,
+            last_page=end_page
+        ):
+            region = classifier.classify_images([image], page_no)[0]
 
-        for region in text_regions:
-            page_idx = region["page"] - start_page
+            if region["label"] != "text":
+                continue
 
-            if 0 <= page_idx < len(images):
-                image = images[page_idx]
+            text_regions.append(region)
 
-                print(f"Processing page {region['page']}")
+            # limit for speed
+            if len(text_regions) <= 10:
+                ocr_queue.append((region["page"], image))
 
-                extracted = run_easyocr(image)
+        # text pages are recognized together, in EasyOCR micro-batches
+        print(f"Processing pages {[p for p, _ in ocr_queue]}")
 
-                if len(extracted.strip()) > 5:
-                    text_output += extracted + "\n"
+        extracted_pages = run_easyocr_batch([img for _, img in ocr_queue])
 
-                    lines = extracted.split("\n")
+        for (page_no, _), extracted in zip(ocr_queue, extracted_pages):
 
-                    blocks = []
+            if len(extracted.strip()) > 5:
+                text_output += extracted + "\n"
 
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
+                lines = extracted.split("\n")
 
-                        blocks.append({
-                            "type": classify_line(line),
-                            "text": line
-                        })
+                blocks = []
 
-                    page_outputs.append({
-                        "page": region["page"],
-                        "blocks": blocks
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    blocks.append({
+                        "type": classify_line(line),
+                        "text": line
                     })
 
+                page_outputs.append({
+                    "page": page_no,
+                    "blocks": blocks
+                })
+
+        print(f"Text Regions: {len(text_regions)}")
 
         # fallback
         if not text_output.strip():
             print("⚠ No text detected, running fallback OCR...")
-            for i, img in enumerate(images[:5]):
-                extracted = run_easyocr(img)
+            fallback = list(iter_pages(
+                str(pdf),
+                dpi=OCR_DPI,
+                colorspace=COLORSPACE,
+                first_page=start_page,
+                last_page=min(start_page + 4, end_page)
+            ))
+
+            extracted_pages = run_easyocr_batch([img for _, img in fallback])
 
+            for (page_no, _), extracted in zip(fallback, extracted_pages):
                 text_output += extracted + "\n"
 
                 page_outputs.append({
-                    "page": start_page + i,
+                    "page": page_no,
                     "text": extracted
                 })
 
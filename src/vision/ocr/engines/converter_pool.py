@@ -0,0 +1,199 @@
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Pipeline configuration
+# -----------------------------
+TABLE_MODES = ("accurate", "fast")   # TableFormer modes
+
+
+@dataclass(frozen=True)
+class ConverterOptions:
+    """
+    Everything that decides how a DocumentConverter is built.
+
+    Frozen and hashable: one value identifies one warm converter in
+    the pool, and can be shared between threads without copying.
+    """
+    do_ocr: bool = False
+    do_table_structure: bool = True
+    table_mode: str = "accurate"
+    do_cell_matching: bool = True
+
+    def __post_init__(self):
+        if self.table_mode not in TABLE_MODES:
+            raise ValueError(f"Unknown table mode: {self.table_mode}")
+
+    def pipeline_options(self):
+        from docling.datamodel.pipeline_options import (
+            PdfPipelineOptions, TableFormerMode
+        )
+
+        options = PdfPipelineOptions()
+        options.do_ocr = self.do_ocr
+        options.do_table_structure = self.do_table_structure
+        options.table_structure_options.do_cell_matching = self.do_cell_matching
+        options.table_structure_options.mode = (
+            TableFormerMode.FAST if self.table_mode == "fast"
+            else TableFormerMode.ACCURATE
+        )
+        options.enable_remote_services = False
+        return options
+
+    def label(self) -> str:
+        ocr = "ocr" if self.do_ocr else "text-layer"
+        tables = self.table_mode if self.do_table_structure else "no-tables"
+        return f"{ocr}/{tables}"
+
+
+# -----------------------------
+# Warm converter pool
+# -----------------------------
+def default_converters() -> int:
+    """
+    OCR_DOCLING_CONVERTERS env var, else one converter per core: the
+    most concurrent conversions the machine can usefully run.
+    """
+    env_converters = os.getenv("OCR_DOCLING_CONVERTERS")
+    if env_converters:
+        return max(1, int(env_converters))
+    return os.cpu_count() or 1
+
+
+class _Entry:
+    def __init__(self):
+        self.idle: List = []      # built converters not in use
+        self.count = 0            # built or being built
+        self.cond = threading.Condition()
+
+
+class ConverterPool:
+    """
+    Warm DocumentConverters keyed by ConverterOptions.
+
+    Building a converter loads the layout and TableFormer models, so
+    converters are built once (lazily, or up front through prewarm())
+    and reused by every engine and thread.
+
+    Docling does not document its pipelines as re-entrant, so a
+    converter converts one document at a time. Concurrent requests
+    for the same configuration each get their own converter, built on
+    demand, up to `per_config` (env OCR_DOCLING_CONVERTERS, default
+    one per core). Only requests beyond the cap wait for a converter
+    to come back; a serial caller never builds more than one.
+    """
+
+    def __init__(self, per_config: Optional[int] = None):
+        self.per_config = max(1, per_config or default_converters())
+        self._entries: Dict[ConverterOptions, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, options: ConverterOptions) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(options)
+            if entry is None:
+                entry = self._entries[options] = _Entry()
+            return entry
+
+    @contextmanager
+    def checkout(self, options: ConverterOptions):
+        """
+        Exclusive use of a warm converter for `options`.
+        """
+        entry = self._entry(options)
+
+        with entry.cond:
+            while not entry.idle and entry.count >= self.per_config:
+                entry.cond.wait()
+
+            converter = entry.idle.pop() if entry.idle else None
+            if converter is None:
+                entry.count += 1
+
+        if converter is None:
+            try:
+                converter = self._build(options)
+            except Exception:
+                with entry.cond:
+                    entry.count -= 1
+                    entry.cond.notify()
+                raise
+
+        try:
+            yield converter
+        finally:
+            with entry.cond:
+                entry.idle.append(converter)
+                entry.cond.notify()
+
+    def convert(self, options: ConverterOptions, source):
+        """
+        Convert `source` (path or DocumentStream) with a warm
+        converter for `options`. Returns Docling's ConversionResult.
+        """
+        with self.checkout(options) as converter:
+            return converter.convert(source)
+
+    def prewarm(self, options: Iterable[ConverterOptions]):
+        """
+        Startup hook: build converters and load their models before
+        the first document arrives.
+        """
+        from docling.datamodel.base_models import InputFormat
+
+        for opts in options:
+            start = time.time()
+            with self.checkout(opts) as converter:
+                converter.initialize_pipeline(InputFormat.PDF)
+            logger.info(f"Pre-warmed {opts.label()} converter in {time.time() - start:.2f}s")
+
+    def warm(self) -> List[ConverterOptions]:
+        with self._lock:
+            return [o for o, e in self._entries.items() if e.count]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _build(self, options: ConverterOptions):
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+        from docling.datamodel.base_models import InputFormat
+
+        start = time.time()
+        converter = DocumentConverter(
+            allowed_formats=[InputFormat.PDF],
+            format_options={
+                InputFormat.PDF: PdfFormatOption(
+                    pipeline_options=options.pipeline_options()
+                )
+            }
+        )
+        logger.info(f"Built {options.label()} converter in {time.time() - start:.2f}s")
+        return converter
+
+
+# -----------------------------
+# Shared pool
+# -----------------------------
+_default_pool: Optional[ConverterPool] = None
+_default_lock = threading.Lock()
+
+
+def get_converter_pool() -> ConverterPool:
+    """
+    Shared pool used by all Docling engines.
+    """
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = ConverterPool()
+        return _default_pool
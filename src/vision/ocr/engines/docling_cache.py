@@ -0,0 +1,259 @@
+import os
+import gzip
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from engines.converter_pool import ConverterOptions
+from engines.raster import pdf_digest
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DISK_BYTES = 2 * 1024 * 1024 * 1024   # total size of cached documents
+
+# bump when the stored layout or renumbering changes
+CACHE_VERSION = 1
+
+
+def _docling_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("docling")
+    except Exception:
+        return "unknown"
+
+
+def default_cache_dir() -> Path:
+    """
+    Per-user location for enable_docling_cache(): cached documents
+    hold full report content, so not a shared temp directory.
+    """
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "ai-frc" / "docling"
+
+
+def _page_spec(pages: Sequence[int]) -> str:
+    """
+    Compact page selection: [1, 2, 3, 7] → "1-3,7".
+    """
+    spans: List[List[int]] = []
+    for p in pages:
+        if spans and p == spans[-1][1] + 1:
+            spans[-1][1] = p
+        else:
+            spans.append([p, p])
+    return ",".join(f"{a}-{b}" if a != b else str(a) for a, b in spans)
+
+
+# -----------------------------
+# Docling result cache
+# -----------------------------
+class DoclingResultCache:
+    """
+    Content-addressed on-disk cache of converted Docling documents.
+
+    Keyed by (PDF content hash, page selection, ConverterOptions,
+    Docling version), so re-running a benchmark after changing only
+    metrics code skips conversion. Documents are stored as gzipped
+    JSON; the cache is an LRU bounded by total file size, tracked by
+    an in-memory index (a hit also refreshes the file's mtime, so
+    the order survives restarts).
+
+    Opt-in: enabled by cache_dir or env OCR_DOCLING_CACHE_DIR, and
+    for the benchmark loops by enable_docling_cache().
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: int = DEFAULT_DISK_BYTES
+    ):
+        if cache_dir is None:
+            cache_dir = os.getenv("OCR_DOCLING_CACHE_DIR", "")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_bytes = max_bytes
+
+        self._files: "OrderedDict[str, int]" = OrderedDict()   # file name → size, LRU first
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._version = _docling_version()
+
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+            # one scan at start-up; the index is kept current afterwards
+            files = []
+            for p in self.cache_dir.glob("*.json.gz"):
+                try:
+                    st = p.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((st.st_mtime, p.name, st.st_size))
+
+            for _, name, size in sorted(files):
+                self._files[name] = size
+                self._bytes += size
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_dir is not None
+
+    # --------------------------------------------------
+    def key(self, pdf_path: str, pages: Sequence[int], options: ConverterOptions) -> str:
+        raw = "|".join([
+            pdf_digest(pdf_path),
+            _page_spec(pages),
+            repr(options),
+            self._version,
+            str(CACHE_VERSION),
+        ])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json.gz"
+
+    # --------------------------------------------------
+    def get_dict(
+        self,
+        pdf_path: str,
+        pages: Sequence[int],
+        options: ConverterOptions
+    ) -> Optional[Dict]:
+        if not self.enabled:
+            return None
+
+        path = self._path(self.key(pdf_path, pages, options))
+
+        with self._lock:
+            if path.name not in self._files:
+                self.misses += 1
+                return None
+            self._files.move_to_end(path.name)
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            self._forget(path.name)
+            return None
+        except Exception:
+            logger.warning(f"Dropping unreadable Docling cache file: {path}")
+            path.unlink(missing_ok=True)
+            self._forget(path.name)
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def _forget(self, name: str):
+        with self._lock:
+            self._bytes -= self._files.pop(name, 0)
+            self.misses += 1
+
+    def get(self, pdf_path: str, pages: Sequence[int], options: ConverterOptions):
+        """
+        Cached DoclingDocument for this page selection, or None.
+        """
+        data = self.get_dict(pdf_path, pages, options)
+        if data is None:
+            return None
+
+        from docling_core.types.doc import DoclingDocument
+        return DoclingDocument.model_validate(data)
+
+    def put_dict(
+        self,
+        pdf_path: str,
+        pages: Sequence[int],
+        options: ConverterOptions,
+        data: Dict
+    ):
+        if not self.enabled:
+            return
+
+        path = self._path(self.key(pdf_path, pages, options))
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+        size = tmp.stat().st_size
+        os.replace(tmp, path)
+
+        with self._lock:
+            self._bytes += size - self._files.pop(path.name, 0)
+            self._files[path.name] = size
+            over = self._bytes > self.max_bytes
+
+        if over:
+            self._trim()
+
+    def put(self, pdf_path: str, pages: Sequence[int], options: ConverterOptions, doc):
+        self.put_dict(pdf_path, pages, options, doc.export_to_dict())
+
+    # --------------------------------------------------
+    def clear(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            for p in self.cache_dir.glob("*.json.gz"):
+                p.unlink(missing_ok=True)
+            self._files.clear()
+            self._bytes = 0
+
+    def _trim(self):
+        # least recently used first, straight from the index
+        victims = []
+        with self._lock:
+            while self._bytes > self.max_bytes and len(self._files) > 1:
+                name, size = self._files.popitem(last=False)
+                self._bytes -= size
+                victims.append(name)
+
+        for name in victims:
+            (self.cache_dir / name).unlink(missing_ok=True)
+
+
+# -----------------------------
+# Process-wide cache
+# -----------------------------
+_default_cache: Optional[DoclingResultCache] = None
+_default_lock = threading.Lock()
+
+
+def get_docling_cache() -> DoclingResultCache:
+    """
+    Shared cache used by all Docling engines (disabled unless
+    OCR_DOCLING_CACHE_DIR is set or enable_docling_cache() ran).
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = DoclingResultCache()
+        return _default_cache
+
+
+def enable_docling_cache(cache_dir: Optional[str] = None) -> DoclingResultCache:
+    """
+    Turn the shared cache on for this process: for loops that convert
+    the same PDFs run after run (benchmarks, evaluations). Uses
+    cache_dir, else OCR_DOCLING_CACHE_DIR, else default_cache_dir().
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None or not _default_cache.enabled:
+            _default_cache = DoclingResultCache(
+                cache_dir or os.getenv("OCR_DOCLING_CACHE_DIR") or str(default_cache_dir())
+            )
+        return _default_cache
@@ -0,0 +1,318 @@
+import os
+import re
+import atexit
+import logging
+import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from engines.converter_pool import ConverterOptions, ConverterPool, get_converter_pool
+from engines.docling_cache import DoclingResultCache, get_docling_cache
+from engines.document import PdfDocument
+from engines.pdf_stream import page_subset_bytes, page_subset_stream
+from engines.progress import ProgressTracker
+
+
+logger = logging.getLogger(__name__)
+
+
+CHUNK_PAGES = 20            # pages per Docling job
+PARALLEL_MIN_PAGES = 40     # below this the worker start-up is not worth it
+
+# (options, source pages) for one Docling job, pages 1-based and sorted
+Job = Tuple[ConverterOptions, List[int]]
+
+
+def default_workers() -> int:
+    """
+    OCR_DOCLING_WORKERS env var, else 1 (in-process).
+
+    Every worker process loads its own Docling model stack, so
+    multi-process conversion is opt-in rather than sized to the cores.
+    """
+    env_workers = os.getenv("OCR_DOCLING_WORKERS")
+    if env_workers:
+        return max(1, int(env_workers))
+    return 1
+
+
+# -----------------------------
+# Job planning
+# -----------------------------
+def plan_chunks(jobs: Sequence[Job], chunk_pages: int = CHUNK_PAGES) -> List[Job]:
+    """
+    Split each job into chunks of at most `chunk_pages` pages,
+    keeping page order.
+    """
+    chunks: List[Job] = []
+    for options, pages in jobs:
+        for i in range(0, len(pages), chunk_pages):
+            chunks.append((options, list(pages[i:i + chunk_pages])))
+    return chunks
+
+
+# -----------------------------
+# Page numbering
+# -----------------------------
+def renumber_pages(doc, pages: Sequence[int]):
+    """
+    Map the page numbers of a Docling document converted from a page
+    subset (1..len(pages)) back to the source pages, in place.
+    """
+    if list(pages) == list(range(1, len(pages) + 1)):
+        return doc
+
+    page_map = {i + 1: p for i, p in enumerate(pages)}
+
+    for item, _ in doc.iterate_items(with_groups=True, traverse_pictures=True):
+        for prov in getattr(item, "prov", None) or []:
+            prov.page_no = page_map.get(prov.page_no, prov.page_no)
+
+    renumbered = {}
+    for page_no, page in doc.pages.items():
+        page.page_no = page_map.get(page_no, page_no)
+        renumbered[page.page_no] = page
+    doc.pages = renumbered
+
+    return doc
+
+
+_REF = re.compile(r"^#/(\w+)/(\d+)$")
+
+
+def _shift_refs(node, offsets: Dict[str, int]):
+    """
+    Add offsets[kind] to every "#/<kind>/<i>" reference in an
+    exported document, in place.
+    """
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in ("$ref", "self_ref") and isinstance(value, str):
+                m = _REF.match(value)
+                if m and m.group(1) in offsets:
+                    node[key] = f"#/{m.group(1)}/{int(m.group(2)) + offsets[m.group(1)]}"
+            else:
+                _shift_refs(value, offsets)
+    elif isinstance(node, list):
+        for value in node:
+            _shift_refs(value, offsets)
+
+
+def merge_documents(docs: Sequence):
+    """
+    One DoclingDocument from per-chunk documents (already renumbered),
+    in chunk order; None for no documents.
+
+    Item lists (texts, tables, pictures, groups, ...) are concatenated
+    and every reference into them (self_ref, parent, children,
+    captions, footnotes) is shifted past the items of earlier chunks,
+    so table and item ids stay unique and reading order follows pages.
+    """
+    if not docs:
+        return None
+    if len(docs) == 1:
+        return docs[0]
+
+    from docling_core.types.doc import DoclingDocument
+
+    merged = docs[0].export_to_dict()
+
+    for doc in docs[1:]:
+        data = doc.export_to_dict()
+        lists = [key for key, value in data.items() if isinstance(value, list)]
+
+        _shift_refs(data, {key: len(merged.get(key, [])) for key in lists})
+
+        for key in lists:
+            merged.setdefault(key, []).extend(data[key])
+        for root in ("body", "furniture"):
+            merged[root]["children"].extend(data[root]["children"])
+        merged["pages"].update(data["pages"])
+
+    return DoclingDocument.model_validate(merged)
+
+
+# -----------------------------
+# Worker processes
+# -----------------------------
+def _init_worker(threads: int, prewarm: Sequence[ConverterOptions]):
+    # must precede the first torch import in this process
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+
+    try:
+        get_converter_pool().prewarm(prewarm)
+    except Exception:
+        logger.exception("Docling worker pre-warm failed")
+
+
+def _convert_chunk(pdf_path: str, options: ConverterOptions, pages: List[int]) -> dict:
+    """
+    Worker entry point: convert one page chunk with this process's
+    warm converter. Returns the renumbered document as a dict.
+    """
+    import io
+    from docling.datamodel.base_models import DocumentStream
+
+    stream = DocumentStream(
+        name=f"chunk_p{pages[0]}-{pages[-1]}.pdf",
+        stream=io.BytesIO(page_subset_bytes(pdf_path, pages=pages))
+    )
+    doc = get_converter_pool().convert(options, stream).document
+    return renumber_pages(doc, pages).export_to_dict()
+
+
+# workers -> (pool, option sets its workers were pre-warmed with)
+_executors: Dict[int, Tuple[ProcessPoolExecutor, frozenset]] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor(workers: int, prewarm: Sequence[ConverterOptions]) -> ProcessPoolExecutor:
+    """
+    Process pool kept for the life of the parent, so workers and
+    their loaded models survive from one document to the next.
+
+    A call needing option sets the workers were not pre-warmed with
+    replaces the pool with one pre-warmed for both old and new sets,
+    so no chunk builds its converter cold inside a worker.
+    """
+    with _executors_lock:
+        pool, warm = _executors.get(workers, (None, frozenset()))
+        needed = warm | frozenset(prewarm)
+
+        if pool is None or needed != warm:
+            if pool is not None:
+                logger.info("Restarting Docling workers to pre-warm new option sets")
+                pool.shutdown(wait=True)
+
+            threads = max(1, (os.cpu_count() or 1) // workers)
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(threads, tuple(needed))
+            )
+            _executors[workers] = (pool, needed)
+        return pool
+
+
+@atexit.register
+def shutdown_workers():
+    with _executors_lock:
+        for pool, _ in _executors.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _executors.clear()
+
+
+# -----------------------------
+# Conversion
+# -----------------------------
+def convert_jobs(
+    pdf_path: str,
+    jobs: Sequence[Job],
+    document: Optional[PdfDocument] = None,
+    workers: Optional[int] = None,
+    chunk_pages: int = CHUNK_PAGES,
+    pool: Optional[ConverterPool] = None,
+    notify: Optional[Callable[[str], None]] = None,
+    progress: Optional[ProgressTracker] = None,
+    cache: Optional[DoclingResultCache] = None
+) -> List:
+    """
+    Convert page jobs with Docling and return one DoclingDocument per
+    chunk, in page order, numbered as in the source PDF.
+
+    Short documents and workers=1 run in this process on `pool`
+    (default: the shared converter pool), one conversion per job.
+    Otherwise jobs are split into `chunk_pages` chunks converted
+    concurrently in worker processes, each holding its own warm
+    converters. Chunks found in `cache` (default: the shared result
+    cache) are not converted at all. `progress` gets a page_done()
+    as each chunk completes.
+    """
+    pdf_path = str(pdf_path)
+    notify = notify or logger.info
+    cache = cache or get_docling_cache()
+
+    workers = workers or default_workers()
+    if sum(len(pages) for _, pages in jobs) < PARALLEL_MIN_PAGES:
+        workers = 1
+
+    # chunks only pay off spread across workers; in-process, every
+    # subset PDF would be extra work for no parallelism
+    if workers > 1:
+        chunks = plan_chunks(jobs, chunk_pages)
+    else:
+        chunks = [(options, list(pages)) for options, pages in jobs]
+    docs = [None] * len(chunks)
+
+    todo = []
+    for i, (options, pages) in enumerate(chunks):
+        docs[i] = cache.get(pdf_path, pages, options)
+        if docs[i] is None:
+            todo.append(i)
+        elif progress:
+            progress.page_done(pages[-1], pages=len(pages), stage="cache")
+
+    if len(todo) < len(chunks):
+        notify(f"Docling cache: reused {len(chunks) - len(todo)} of {len(chunks)} chunks")
+    if not todo:
+        return docs
+
+    n_pages = sum(len(chunks[i][1]) for i in todo)
+    if n_pages < PARALLEL_MIN_PAGES:
+        workers = 1
+
+    if workers <= 1:
+        pool = pool or get_converter_pool()
+        for i in todo:
+            options, pages = chunks[i]
+            if document is not None and pages == list(range(1, document.page_count + 1)):
+                source = pdf_path
+            else:
+                source = page_subset_stream(pdf_path, pages=pages, document=document)
+
+            doc = pool.convert(options, source).document
+            docs[i] = renumber_pages(doc, pages)
+            _store(cache, pdf_path, pages, options, docs[i].export_to_dict())
+
+            if progress:
+                progress.page_done(pages[-1], pages=len(pages))
+        return docs
+
+    from docling_core.types.doc import DoclingDocument
+
+    prewarm = list(dict.fromkeys(options for options, _ in jobs))
+
+    notify(
+        f"Converting {n_pages} pages in {len(todo)} chunks "
+        f"on {min(workers, len(todo))} workers"
+    )
+
+    executor = _executor(workers, prewarm)
+    futures = {
+        executor.submit(_convert_chunk, pdf_path, *chunks[i]): i
+        for i in todo
+    }
+
+    # events in completion order, documents in page order
+    for fut in as_completed(futures):
+        i = futures[fut]
+        options, pages = chunks[i]
+
+        data = fut.result()
+        _store(cache, pdf_path, pages, options, data)
+        docs[i] = DoclingDocument.model_validate(data)
+
+        if progress:
+            progress.page_done(pages[-1], pages=len(pages))
+
+    return docs
+
+
+def _store(cache: DoclingResultCache, pdf_path: str, pages, options, data: dict):
+    # a full or read-only cache must not fail the conversion
+    try:
+        cache.put_dict(pdf_path, pages, options, data)
+    except OSError as e:
+        logger.warning(f"Docling cache write failed: {e}")
@@ -1,16 +1,17 @@
 import time
 import logging
-import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Sequence
 
-from PyPDF2 import PdfReader
-from docling.document_converter import DocumentConverter
-from docling.datamodel.base_models import InputFormat
-from docling.document_converter import PdfFormatOption
-from docling.datamodel.pipeline_options import PdfPipelineOptions
 import os
 
+from engines.converter_pool import ConverterOptions, ConverterPool, get_converter_pool
+from engines.docling_cache import DoclingResultCache
+from engines.docling_chunks import convert_jobs, merge_documents
+from engines.document import PdfDocument, open_document
+from engines.layout_pass import run_layout_pass
+from engines.progress import ProgressCallback, ProgressTracker
+
 
 # -----------------------------
 # Logging
@@ -22,40 +23,44 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# -----------------------------
-# PDF validation
-# -----------------------------
-def is_valid_pdf(pdf_path: str) -> bool:
-    try:
-        PdfReader(pdf_path)
-        return True
-    except Exception:
-        return False
-
-
 # -----------------------------
 # Docling OCR Engine
 # -----------------------------
 class OCREngine:
 
-    def __init__(self, **kwargs):
-        pipeline_options = PdfPipelineOptions()
-        pipeline_options.do_ocr = True
-        pipeline_options.do_table_structure = True
-        pipeline_options.table_structure_options.do_cell_matching = True
-        pipeline_options.enable_remote_services = False
-
-        self.converter = DocumentConverter(
-            allowed_formats=[InputFormat.PDF],
-            format_options={
-                InputFormat.PDF: PdfFormatOption(
-                    pipeline_options=pipeline_options
-                )
-            }
+    def __init__(
+        self,
+        table_mode: str = "accurate",
+        pool: Optional[ConverterPool] = None,
+        workers: Optional[int] = None,
+        result_cache: Optional[DoclingResultCache] = None,
+        **kwargs
+    ):
+        self.options = ConverterOptions(
+            do_ocr=True,
+            do_table_structure=True,
+            table_mode=table_mode,
+            do_cell_matching=True
         )
 
+        # built on first use (or prewarm()) and shared across engines
+        self.pool = pool or get_converter_pool()
+
+        # long documents are split into page chunks converted on this
+        # many worker processes (None: OCR_DOCLING_WORKERS, else in-process)
+        self.workers = workers
+
+        # converted chunks are reused across runs (None: shared cache)
+        self.result_cache = result_cache
+
         logger.info("Docling OCR Engine initialized")
 
+    def prewarm(self):
+        """
+        Load the converter's models before the first document.
+        """
+        self.pool.prewarm([self.options])
+
     # -----------------------------
     # Main OCR method
     # 
@@ -68,8 +73,24 @@ class OCREngine:
         self,
         pdf_path: str,
         output_dir: Optional[str] = None,
-        progress_cb: Optional[Callable[[str], None]] = None
+        progress_cb: Optional[ProgressCallback] = None,
+        document: Optional[PdfDocument] = None,
+        start_page: Optional[int] = None,
+        end_page: Optional[int] = None,
+        pages: Optional[Sequence[int]] = None,
+        table_pages: Optional[Sequence[int]] = None
     ) -> Dict[str, Any]:
+        """
+        `pages` (1-based, e.g. from engines.statement_locator) or
+        start_page..end_page restrict conversion to a page selection,
+        handed to Docling as in-memory PDFs. Page numbers in the
+        result refer to the source PDF.
+
+        `table_pages` (e.g. LayoutClassifier "table" pages) switches
+        to table-only mode: TableFormer runs on those pages only and
+        the other pages take the text-layer path, with OCR only where
+        the page is scanned (see engines.layout_pass).
+        """
 
         pdf_path = Path(pdf_path).expanduser().resolve()
         
@@ -77,7 +98,11 @@ class OCREngine:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        if not is_valid_pdf(str(pdf_path)):
+        own_document = document is None
+        if own_document:
+            document = open_document(str(pdf_path))
+
+        if not document.valid:
             logger.error(f"Invalid or corrupted PDF: {pdf_path}")
             return {
                 "success": False,
@@ -91,36 +116,60 @@ class OCREngine:
             logger.info(msg)
 
         try:
-            reader = PdfReader(str(pdf_path))
-            total_pages = len(reader.pages)
+            notify(f"PDF loaded successfully ({document.page_count} pages detected)")
 
-            notify(f"PDF loaded successfully ({total_pages} pages detected)")
-            notify("OCR started — processing pages")
+            # ---- Page selection ----
+            if pages is None and (start_page or end_page):
+                pages = range(start_page or 1, (end_page or document.page_count) + 1)
+
+            if pages is not None:
+                pages = sorted(set(pages))
+                if not pages or pages[0] < 1 or pages[-1] > document.page_count:
+                    raise ValueError("Invalid page selection")
 
-            # ---- Progress simulation ----
-            progress = {"page": 0}
-            stop_flag = {"done": False}
+                notify(f"Processing {len(pages)} selected pages")
+            else:
+                pages = list(range(1, document.page_count + 1))
 
-            def progress_simulator():
-                while not stop_flag["done"] and progress["page"] < total_pages:
-                    time.sleep(1.5)
-                    progress["page"] += 1
-                    notify(f"Processing page {progress['page']} of {total_pages}")
+            total_pages = len(pages)
 
-            t = threading.Thread(target=progress_simulator, daemon=True)
-            t.start()
+            notify("OCR started — processing pages")
 
             start = time.time()
-            result = self.converter.convert(str(pdf_path))
-            elapsed = round(time.time() - start, 2)
 
-            stop_flag["done"] = True
-            t.join()
+            if table_pages is not None:
+                layout = run_layout_pass(
+                    pdf_path, document,
+                    pages=pages,
+                    table_pages=table_pages,
+                    options=self.options,
+                    workers=self.workers,
+                    pool=self.pool,
+                    cache=self.result_cache,
+                    progress_cb=progress_cb,
+                    notify=notify
+                )
+                markdown = layout.markdown()
+                plain_text = layout.text()
+            else:
+                docs = convert_jobs(
+                    str(pdf_path), [(self.options, pages)],
+                    document=document,
+                    workers=self.workers,
+                    pool=self.pool,
+                    cache=self.result_cache,
+                    notify=notify,
+                    # real completions per chunk, with rate and ETA
+                    progress=ProgressTracker(total_pages, progress_cb, stage="convert")
+                )
+                # one document, numbered as the source PDF
+                merged = merge_documents(docs)
+                markdown = merged.export_to_markdown()
+                plain_text = merged.export_to_text()
 
-            notify("OCR completed successfully")
+            elapsed = round(time.time() - start, 2)
 
-            markdown = result.document.export_to_markdown()
-            plain_text = result.document.export_to_text()
+            notify("OCR completed successfully")
 
             return {
                 "success": True,
@@ -137,3 +186,7 @@ class OCREngine:
                 "error": str(e),
                 "pdf": str(pdf_path)
             }
+
+        finally:
+            if own_document:
+                document.close()
@@ -0,0 +1,205 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Page triage
+# -----------------------------
+NATIVE = "native"      # born-digital, text layer is enough
+SCANNED = "scanned"    # no usable text layer, image content
+MIXED = "mixed"        # text layer plus significant image area
+
+MIN_TEXT_CHARS = 20           # below this the text layer is ignored
+MIN_IMAGE_COVERAGE = 0.05     # image share worth OCR on a textless page
+MIXED_IMAGE_COVERAGE = 0.20   # image share that makes a text page mixed
+
+
+# -----------------------------
+# Opened document handle
+# -----------------------------
+class PdfDocument:
+    """
+    A PDF parsed once and shared by every stage of a pipeline.
+
+    Carries what engines used to re-derive with separate PdfReader
+    passes:
+
+    - valid / error   → open + structure check
+    - page_count
+    - text_chars()    → per-page text-layer size (lazy, memoized)
+    - page_kind()     → native / scanned / mixed triage per page
+    - renderer()      → PyMuPDF renderer over the same open document
+
+    Invalid files do not raise; `valid` is False and `error` says
+    why. PyMuPDF is not thread-safe, so page access is serialized
+    through `lock`.
+    """
+
+    def __init__(self, pdf_path: str):
+        self.path = Path(pdf_path).expanduser().resolve()
+        self.doc: Optional[fitz.Document] = None
+        self.error: Optional[str] = None
+        self.page_count = 0
+        self.lock = threading.RLock()
+
+        self._page_info: Dict[int, Dict] = {}
+        self._renderer = None
+
+        try:
+            doc = fitz.open(str(self.path))
+            if not doc.is_pdf:
+                raise ValueError("not a PDF")
+            if doc.needs_pass:
+                raise ValueError("encrypted PDF")
+            if len(doc) == 0:
+                raise ValueError("PDF has no pages")
+
+            self.doc = doc
+            self.page_count = len(doc)
+
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            logger.warning(f"Invalid PDF {self.path}: {self.error}")
+
+    # --------------------------------------------------
+    @property
+    def valid(self) -> bool:
+        return self.doc is not None
+
+    # --------------------------------------------------
+    def page_info(self, page_no: int) -> Dict:
+        """
+        Text-layer and image statistics of page `page_no` (1-based),
+        read from the content stream without rasterizing:
+
+        {"page", "kind", "chars", "text_coverage", "image_coverage"}
+        """
+        info = self._page_info.get(page_no)
+        if info is not None:
+            return info
+
+        with self.lock:
+            page = self.doc[page_no - 1]
+            rect = page.rect
+            blocks = page.get_text("blocks")
+            images = page.get_image_info()
+
+        area = abs(rect) or 1.0
+
+        chars = 0
+        text_area = 0.0
+        for b in blocks:
+            if b[6] != 0:
+                continue
+            chars += len("".join(b[4].split()))
+            text_area += abs(fitz.Rect(b[:4]) & rect)
+
+        image_area = sum(abs(fitz.Rect(img["bbox"]) & rect) for img in images)
+
+        text_coverage = min(1.0, text_area / area)
+        image_coverage = min(1.0, image_area / area)
+
+        if chars < MIN_TEXT_CHARS:
+            kind = SCANNED if image_coverage >= MIN_IMAGE_COVERAGE else NATIVE
+        elif image_coverage >= MIXED_IMAGE_COVERAGE:
+            kind = MIXED
+        else:
+            kind = NATIVE
+
+        info = {
+            "page": page_no,
+            "kind": kind,
+            "chars": chars,
+            "text_coverage": round(text_coverage, 3),
+            "image_coverage": round(image_coverage, 3),
+        }
+        self._page_info[page_no] = info
+        return info
+
+    def text_chars(self, page_no: int) -> int:
+        """
+        Non-whitespace characters in the text layer of page
+        `page_no` (1-based). 0 for scanned pages.
+        """
+        return self.page_info(page_no)["chars"]
+
+    def has_text_layer(self, page_no: int) -> bool:
+        return self.text_chars(page_no) > 0
+
+    def page_kind(self, page_no: int) -> str:
+        return self.page_info(page_no)["kind"]
+
+    def needs_ocr(self, page_no: int) -> bool:
+        return self.page_kind(page_no) != NATIVE
+
+    def triage(self, pages: Optional[Iterable[int]] = None) -> List[Dict]:
+        """
+        page_info() for `pages` (default: every page).
+        """
+        pages = range(1, self.page_count + 1) if pages is None else pages
+        return [self.page_info(p) for p in pages]
+
+    def ocr_runs(
+        self,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+        pages: Optional[Iterable[int]] = None
+    ) -> List[Tuple[bool, int, int]]:
+        """
+        Split first_page..last_page (or an explicit `pages` selection)
+        into contiguous runs that share an OCR decision:
+        [(needs_ocr, start, end), ...], 1-based and inclusive, in
+        page order. Gaps in a selection always start a new run.
+        """
+        if pages is None:
+            pages = range(first_page, (last_page or self.page_count) + 1)
+
+        runs: List[Tuple[bool, int, int]] = []
+
+        for p in sorted(pages):
+            ocr = self.needs_ocr(p)
+            if runs and runs[-1][0] == ocr and runs[-1][2] == p - 1:
+                runs[-1] = (ocr, runs[-1][1], p)
+            else:
+                runs.append((ocr, p, p))
+
+        return runs
+
+    # --------------------------------------------------
+    def renderer(self):
+        """
+        PyMuPDF renderer reusing this handle's open document.
+        """
+        if self._renderer is None:
+            from engines.render import PyMuPDFRenderer
+            self._renderer = PyMuPDFRenderer(
+                str(self.path), doc=self.doc, lock=self.lock
+            )
+        return self._renderer
+
+    # --------------------------------------------------
+    def close(self):
+        if self.doc is not None:
+            self.doc.close()
+            self.doc = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        state = f"{self.page_count} pages" if self.valid else f"invalid: {self.error}"
+        return f"PdfDocument({self.path.name}, {state})"
+
+
+def open_document(pdf_path: str) -> PdfDocument:
+    return PdfDocument(pdf_path)
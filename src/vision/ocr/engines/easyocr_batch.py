@@ -0,0 +1,119 @@
+import os
+import logging
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engines.page_image import as_page_image
+
+
+logger = logging.getLogger(__name__)
+
+
+PAD_MULTIPLE = 64   # images are padded up to a multiple of this to share a batch
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return max(0, int(value)) if value else default
+
+
+def batch_settings() -> Dict[str, int]:
+    """
+    Micro-batch settings, overridable by env for tuning
+    (see benchmark_easyocr.py):
+
+        OCR_EASYOCR_BATCH         images per detector batch (8)
+        OCR_EASYOCR_RECOG_BATCH   text crops per recognizer batch (32)
+        OCR_EASYOCR_WORKERS       recognizer DataLoader workers (0)
+    """
+    return {
+        "batch_images": max(1, _env_int("OCR_EASYOCR_BATCH", 8)),
+        "batch_size": max(1, _env_int("OCR_EASYOCR_RECOG_BATCH", 32)),
+        "workers": _env_int("OCR_EASYOCR_WORKERS", 0),
+    }
+
+
+def _prepare(image) -> np.ndarray:
+    # same input as the per-page path: 2-D for gray renders
+    page = as_page_image(image)
+    return page.gray() if page.channels == 1 else page.array
+
+
+def _bucket(arr: np.ndarray) -> Tuple[int, ...]:
+    h, w = arr.shape[:2]
+    return (
+        -(-h // PAD_MULTIPLE) * PAD_MULTIPLE,
+        -(-w // PAD_MULTIPLE) * PAD_MULTIPLE,
+        *arr.shape[2:]
+    )
+
+
+def _pad(arr: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    White padding on the bottom and right: word boxes keep their
+    coordinates, and the detector finds no text in the margin.
+    """
+    if arr.shape == shape:
+        return arr
+    out = np.full(shape, 255, dtype=np.uint8)
+    out[:arr.shape[0], :arr.shape[1]] = arr
+    return out
+
+
+# -----------------------------
+# Batched recognition
+# -----------------------------
+def readtext_stream(
+    reader,
+    items: Iterable[Tuple[Hashable, object]],
+    batch_images: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None
+) -> Iterator[Tuple[Hashable, list]]:
+    """
+    Recognize (key, image) pairs with reader.readtext_batched,
+    yielding (key, results) as micro-batches complete; results are
+    readtext's [(bbox, text, confidence), ...].
+
+    Images of similar size (pages of one document, or crops from
+    several) are padded to a common size and grouped, up to
+    `batch_images` per detector call; the recognizer then runs on
+    `batch_size` text crops at a time. Order across keys is not
+    preserved, so pages of several documents can share batches.
+    """
+    settings = batch_settings()
+    batch_images = batch_images or settings["batch_images"]
+    batch_size = batch_size or settings["batch_size"]
+    workers = settings["workers"] if workers is None else workers
+
+    buckets: Dict[Tuple[int, ...], List[Tuple[Hashable, np.ndarray]]] = {}
+
+    def flush(shape):
+        batch = buckets.pop(shape)
+        results = reader.readtext_batched(
+            [_pad(arr, shape) for _, arr in batch],
+            batch_size=batch_size,
+            workers=workers
+        )
+        for (key, _), res in zip(batch, results):
+            yield key, res
+
+    for key, image in items:
+        arr = _prepare(image)
+        shape = _bucket(arr)
+        buckets.setdefault(shape, []).append((key, arr))
+
+        if len(buckets[shape]) >= batch_images:
+            yield from flush(shape)
+
+    for shape in list(buckets):
+        yield from flush(shape)
+
+
+def readtext_batched(reader, images: Sequence, **kwargs) -> List[list]:
+    """
+    readtext results for `images`, in order.
+    """
+    results = dict(readtext_stream(reader, enumerate(images), **kwargs))
+    return [results[i] for i in range(len(images))]
@@ -0,0 +1,238 @@
+import logging
+from dataclasses import replace
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from engines.converter_pool import ConverterOptions, ConverterPool
+from engines.docling_cache import DoclingResultCache
+from engines.docling_chunks import Job, convert_jobs, merge_documents
+from engines.document import PdfDocument
+from engines.native_text_engine import extract_page, page_markdown, page_text
+from engines.progress import ProgressTracker
+from engines.regions import docling_region_boxes
+from engines.render import BBox, pixels_to_clip
+from engines.tesseract_layout import TesseractPage
+
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Shared layout pass
+# -----------------------------
+class LayoutPass:
+    """
+    One Docling conversion of a page selection, shared by the text
+    and table pipelines.
+
+    Chunk documents carry source page numbers, so every accessor
+    takes 1-based pages of the original PDF. `ocr_pages` lists the
+    pages Docling OCR'd; the text on every other page came from
+    the PDF text layer (empty on scanned pages converted without
+    OCR, which callers OCR themselves, region by region).
+
+    In table-only mode, `native` holds the text-layer layout
+    (engines.native_text_engine) of text pages Docling never saw.
+    Pages OCR'd outside Docling are added with add_ocr_page(); their
+    text then replaces Docling's in every accessor, data() included.
+    """
+
+    def __init__(
+        self,
+        docs: Sequence,
+        pages: Sequence[int],
+        ocr_pages: Iterable[int],
+        native: Optional[Dict[int, Dict]] = None
+    ):
+        self.docs = list(docs)
+        self.pages = list(pages)
+        self.ocr_pages = set(ocr_pages)
+        self.native = native or {}
+        self.ocr: Dict[int, Tuple[TesseractPage, int]] = {}
+
+        self._merged = None
+
+        self._by_page = {}
+        for doc in self.docs:
+            for page_no in doc.pages:
+                self._by_page[page_no] = doc
+
+    def doc(self, page_no: int):
+        return self._by_page.get(page_no)
+
+    def merged(self):
+        """
+        The chunk documents as one DoclingDocument (built once).
+        """
+        if self._merged is None:
+            from docling_core.types.doc import DoclingDocument
+            self._merged = merge_documents(self.docs) or DoclingDocument(name="empty")
+        return self._merged
+
+    def add_ocr_page(self, page_no: int, ocr: TesseractPage, dpi: int):
+        """
+        Words recognized on a `dpi` render of page_no (e.g. by
+        Tesseract), used instead of the page's Docling text.
+        """
+        self.ocr[page_no] = (ocr, dpi)
+
+    def page_text(self, page_no: int) -> str:
+        if page_no in self.ocr:
+            return self.ocr[page_no][0].text().strip()
+        if page_no in self.native:
+            return page_text(self.native[page_no]).strip()
+        doc = self.doc(page_no)
+        return doc.export_to_text(page_no=page_no).strip() if doc else ""
+
+    def page_markdown(self, page_no: int) -> str:
+        if page_no in self.ocr:
+            return self.ocr[page_no][0].markdown().strip()
+        if page_no in self.native:
+            return page_markdown(self.native[page_no]).strip()
+        doc = self.doc(page_no)
+        return doc.export_to_markdown(page_no=page_no).strip() if doc else ""
+
+    def text(self, pages: Optional[Iterable[int]] = None) -> str:
+        pages = self.pages if pages is None else pages
+        return "\n".join(t for t in (self.page_text(p) for p in pages) if t)
+
+    def markdown(self, pages: Optional[Iterable[int]] = None) -> str:
+        if pages is None and (self.native or self.ocr):
+            pages = self.pages
+        if pages is None:
+            return self.merged().export_to_markdown()
+        return "\n\n".join(t for t in (self.page_markdown(p) for p in pages) if t)
+
+    def region_boxes(self, labels: Iterable[str] = ("table",)) -> Dict[int, List[BBox]]:
+        boxes: Dict[int, List[BBox]] = {}
+        for doc in self.docs:
+            boxes.update(docling_region_boxes(doc, labels))
+        return boxes
+
+    def data(self) -> Dict:
+        merged = self.merged()
+
+        if self.ocr:
+            # OCR text goes into a copy; the chunk documents stay as converted
+            merged = merged.model_copy(deep=True)
+            for page_no in sorted(self.ocr):
+                _insert_ocr_text(merged, page_no, *self.ocr[page_no])
+
+        return merged.export_to_dict()
+
+
+def _insert_ocr_text(doc, page_no: int, ocr: TesseractPage, dpi: int):
+    """
+    One text item per OCR paragraph of page_no, placed before the
+    first top-level item of a later page so reading order follows
+    page order.
+    """
+    from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel, ProvenanceItem
+
+    following = next((
+        item for item, _ in doc.iterate_items()
+        if item.parent is not None and item.parent.cref == "#/body"
+        and getattr(item, "prov", None) and item.prov[0].page_no > page_no
+    ), None)
+
+    paragraphs = ocr.text().split("\n\n")
+    boxes = ocr.regions("par")["boxes"]
+
+    for text, box in zip(paragraphs, boxes):
+        l, t, r, b = pixels_to_clip(tuple(int(v) for v in box), dpi)
+        prov = ProvenanceItem(
+            page_no=page_no,
+            bbox=BoundingBox(l=l, t=t, r=r, b=b, coord_origin=CoordOrigin.TOPLEFT),
+            charspan=(0, len(text))
+        ) if page_no in doc.pages else None
+
+        if following is not None and hasattr(doc, "insert_text"):
+            doc.insert_text(following, DocItemLabel.TEXT, text, prov=prov, after=False)
+        else:
+            doc.add_text(DocItemLabel.TEXT, text, prov=prov)
+
+
+def _jobs(
+    pages: Sequence[int],
+    ocr_pages: set,
+    base: ConverterOptions,
+    table_pages: Optional[set] = None
+) -> List[Job]:
+    """
+    Contiguous runs sharing an option set, in page order. With
+    `table_pages`, TableFormer only runs on those pages.
+    """
+    runs: List[List] = []
+    for p in sorted(pages):
+        options = replace(base, do_ocr=p in ocr_pages)
+        if table_pages is not None and p not in table_pages:
+            options = replace(options, do_table_structure=False)
+
+        if runs and runs[-1][0] == options and runs[-1][1][-1] == p - 1:
+            runs[-1][1].append(p)
+        else:
+            runs.append([options, [p]])
+
+    return [(options, run_pages) for options, run_pages in runs]
+
+
+def run_layout_pass(
+    pdf_path: str,
+    document: PdfDocument,
+    pages: Optional[Sequence[int]] = None,
+    ocr_pages: Optional[Iterable[int]] = None,
+    table_pages: Optional[Iterable[int]] = None,
+    options: Optional[ConverterOptions] = None,
+    workers: Optional[int] = None,
+    pool: Optional[ConverterPool] = None,
+    cache: Optional[DoclingResultCache] = None,
+    progress_cb: Optional[Callable] = None,
+    notify: Optional[Callable[[str], None]] = None
+) -> LayoutPass:
+    """
+    Layout, table structure and (only on `ocr_pages`) OCR for
+    `pages` (default: all), in one Docling pass.
+
+    `ocr_pages` defaults to the pages whose text layer is unusable
+    (PdfDocument triage); pass an empty list for a layout-only pass.
+
+    Table-only mode: given `table_pages` (e.g. LayoutClassifier
+    "table" pages), layout + TableFormer run on those pages only.
+    Other pages take the cheaper path: the text layer, read without
+    Docling, or Docling OCR without table structure when scanned.
+    """
+    pages = list(pages or range(1, document.page_count + 1))
+
+    if ocr_pages is None:
+        ocr_pages = [p for p in pages if document.needs_ocr(p)]
+    ocr_pages = set(ocr_pages) & set(pages)
+
+    native = {}
+    docling_pages = pages
+
+    if table_pages is not None:
+        table_pages = set(table_pages)
+        docling_pages = [p for p in pages if p in table_pages or p in ocr_pages]
+
+        with document.lock:
+            for p in pages:
+                if p not in docling_pages:
+                    native[p] = extract_page(document.doc[p - 1])
+
+        (notify or logger.info)(
+            f"Table-only mode: Docling on {len(docling_pages)} of {len(pages)} pages "
+            f"({len(table_pages & set(pages))} with tables)"
+        )
+
+    base = options or ConverterOptions(do_table_structure=True, do_cell_matching=True)
+
+    docs = convert_jobs(
+        str(pdf_path), _jobs(docling_pages, ocr_pages, base, table_pages),
+        document=document,
+        workers=workers,
+        pool=pool,
+        cache=cache,
+        notify=notify,
+        progress=ProgressTracker(len(docling_pages), progress_cb, stage="layout")
+    ) if docling_pages else []
+
+    return LayoutPass(docs, pages, ocr_pages, native)
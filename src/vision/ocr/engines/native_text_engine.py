@@ -0,0 +1,233 @@
+import os
+import time
+import logging
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Callable, Dict, Any, List
+
+import fitz  # PyMuPDF
+
+from engines.base import BaseOCREngine
+from engines.document import PdfDocument, open_document
+
+
+logger = logging.getLogger(__name__)
+
+
+# below this many pages a process pool costs more than it saves
+PARALLEL_MIN_PAGES = 64
+
+
+# -----------------------------
+# Page extraction
+# -----------------------------
+def extract_page(page: "fitz.Page") -> Dict[str, Any]:
+    """
+    Words, lines and blocks of one page from its text layer.
+
+    Coordinates are PDF points with a top-left origin:
+
+    {
+        "page": int, "width": float, "height": float,
+        "blocks": [{"bbox", "lines": [{"bbox", "text",
+                    "words": [{"bbox", "text"}]}]}]
+    }
+    """
+    blocks: Dict[int, Dict[str, Any]] = {}
+    lines: Dict[tuple, Dict[str, Any]] = {}
+
+    # (x0, y0, x1, y1, word, block_no, line_no, word_no), content order
+    for x0, y0, x1, y1, word, block_no, line_no, _ in page.get_text("words"):
+
+        block = blocks.get(block_no)
+        if block is None:
+            block = blocks[block_no] = {"bbox": [x0, y0, x1, y1], "lines": []}
+
+        line = lines.get((block_no, line_no))
+        if line is None:
+            line = lines[(block_no, line_no)] = {"bbox": [x0, y0, x1, y1], "words": []}
+            block["lines"].append(line)
+
+        line["words"].append({"bbox": [x0, y0, x1, y1], "text": word})
+        _grow(line["bbox"], x0, y0, x1, y1)
+        _grow(block["bbox"], x0, y0, x1, y1)
+
+    for line in lines.values():
+        line["text"] = " ".join(w["text"] for w in line["words"])
+
+    return {
+        "page": page.number + 1,
+        "width": page.rect.width,
+        "height": page.rect.height,
+        "blocks": list(blocks.values()),
+    }
+
+
+def _grow(bbox: List[float], x0: float, y0: float, x1: float, y1: float):
+    if x0 < bbox[0]:
+        bbox[0] = x0
+    if y0 < bbox[1]:
+        bbox[1] = y0
+    if x1 > bbox[2]:
+        bbox[2] = x1
+    if y1 > bbox[3]:
+        bbox[3] = y1
+
+
+def page_text(page: Dict[str, Any]) -> str:
+    return "\n".join(
+        line["text"] for block in page["blocks"] for line in block["lines"]
+    )
+
+
+def page_markdown(page: Dict[str, Any]) -> str:
+    # one paragraph per block
+    return "\n\n".join(
+        "\n".join(line["text"] for line in block["lines"])
+        for block in page["blocks"]
+    )
+
+
+def _extract_range(pdf_path: str, first: int, last: int) -> List[Dict[str, Any]]:
+    """
+    Worker entry point: open the PDF once, extract first..last (1-based).
+    """
+    with fitz.open(pdf_path) as doc:
+        return [extract_page(doc[i]) for i in range(first - 1, last)]
+
+
+# -----------------------------
+# Native text engine
+# -----------------------------
+class NativeTextEngine(BaseOCREngine):
+    """
+    Reads born-digital pages straight from the PDF text layer.
+
+    No rendering and no OCR: PyMuPDF returns words with their
+    coordinates, grouped into lines and blocks. Long documents are
+    split into contiguous page chunks extracted in worker processes
+    (PyMuPDF is not thread-safe).
+
+    Pages without a text layer (scanned) come back empty and are
+    listed under "pages_without_text" so callers can OCR them.
+    """
+
+    def __init__(self, workers: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.workers = workers or os.cpu_count() or 1
+
+    def process_pdf(
+        self,
+        pdf_path: str,
+        output_dir: Optional[str] = None,
+        progress_cb: Optional[Callable[[str], None]] = None,
+        start_page: Optional[int] = None,
+        end_page: Optional[int] = None,
+        document: Optional[PdfDocument] = None
+    ) -> Dict[str, Any]:
+
+        pdf_path = Path(pdf_path).expanduser().resolve()
+
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+        own_document = document is None
+        if own_document:
+            document = open_document(str(pdf_path))
+
+        if not document.valid:
+            logger.error(f"Invalid or corrupted PDF: {pdf_path}")
+            return {
+                "success": False,
+                "error": "Invalid or corrupted PDF",
+                "pdf": str(pdf_path)
+            }
+
+        def notify(msg: str):
+            if progress_cb:
+                progress_cb(msg)
+            logger.info(msg)
+
+        try:
+            start = time.time()
+
+            first = start_page or 1
+            last = end_page or document.page_count
+            if first < 1 or last > document.page_count or first > last:
+                raise ValueError("Invalid page range")
+
+            n_pages = last - first + 1
+            notify(f"Native text extraction ({n_pages} pages)")
+
+            pages = self._extract(str(pdf_path), document, first, last, notify)
+
+            text = "\n\n".join(page_text(p) for p in pages)
+            markdown = "\n\n".join(page_markdown(p) for p in pages)
+            empty = [p["page"] for p in pages if not p["blocks"]]
+
+            elapsed = round(time.time() - start, 2)
+            notify(f"Native text extraction completed in {elapsed}s")
+
+            if output_dir:
+                out_path = Path(output_dir)
+                out_path.mkdir(parents=True, exist_ok=True)
+                (out_path / f"{pdf_path.stem}.md").write_text(markdown, encoding="utf-8")
+
+            return {
+                "success": True,
+                "text": text,
+                "markdown": markdown,
+                "layout": pages,
+                "pages_without_text": empty,
+                "pages": n_pages,
+                "time_sec": elapsed
+            }
+
+        except Exception as e:
+            logger.exception("Native text extraction failed")
+            return {
+                "success": False,
+                "error": str(e),
+                "pdf": str(pdf_path)
+            }
+
+        finally:
+            if own_document:
+                document.close()
+
+    # --------------------------------------------------
+    def _extract(
+        self,
+        pdf_path: str,
+        document: PdfDocument,
+        first: int,
+        last: int,
+        notify: Callable[[str], None]
+    ) -> List[Dict[str, Any]]:
+
+        n_pages = last - first + 1
+        workers = min(self.workers, n_pages // PARALLEL_MIN_PAGES or 1)
+
+        if workers <= 1:
+            with document.lock:
+                return [extract_page(document.doc[i]) for i in range(first - 1, last)]
+
+        # contiguous chunks keep reading order trivial to restore
+        size = -(-n_pages // workers)
+        chunks = [
+            (s, min(s + size - 1, last))
+            for s in range(first, last + 1, size)
+        ]
+
+        pages: List[Dict[str, Any]] = []
+        ctx = mp.get_context("spawn")
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = [pool.submit(_extract_range, pdf_path, s, e) for s, e in chunks]
+
+            for (s, e), fut in zip(chunks, futures):
+                pages.extend(fut.result())
+                notify(f"Extracted pages {s}-{e} of {first}-{last}")
+
+        return pages
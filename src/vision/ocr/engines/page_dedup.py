@@ -0,0 +1,198 @@
+import re
+import time
+import logging
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from engines.document import PdfDocument
+from engines.raster import PageRasterCache, get_page_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Thresholds
+# -----------------------------
+SIGNATURE_DPI = 50        # thumbnails rendered only for this stage
+HASH_SIZE = 32            # pages are area-averaged to 32 x 32 ...
+HASH_BITS = 8             # ... and the 8 x 8 lowest DCT terms hashed
+
+INK_LEVEL = 200           # gray below this counts as ink
+BLANK_INK = 0.002         # ink share under which a page is blank
+NEAR_DUP_BITS = 4         # pHash Hamming distance for a candidate
+NEAR_DUP_DELTA = 64       # gray change that counts a pixel as different
+NEAR_DUP_PIXELS = 0.0001  # share of different pixels still a duplicate
+
+_BLANK_TEXT = re.compile(
+    r"^(?:this page (?:has been |is )?)?(?:intentionally )?left blank"
+    r"(?: intentionally)?\.?$"
+)
+
+
+# -----------------------------
+# Page signatures
+# -----------------------------
+def _area_resize(gray: np.ndarray, n: int = HASH_SIZE) -> np.ndarray:
+    """
+    Area-average a 2-D uint8 page down to n x n floats.
+    """
+    h, w = gray.shape
+    ys = (np.arange(n) * h) // n
+    xs = (np.arange(n) * w) // n
+
+    rows = np.add.reduceat(gray, ys, axis=0, dtype=np.uint32)
+    block = np.add.reduceat(rows, xs, axis=1)
+
+    counts = np.diff(np.append(ys, h))[:, None] * np.diff(np.append(xs, w))[None, :]
+    return block / counts
+
+
+def _dct_basis(n: int = HASH_SIZE, k: int = HASH_BITS) -> np.ndarray:
+    i = np.arange(n)
+    return np.cos(np.pi * (2 * i[None, :] + 1) * np.arange(k)[:, None] / (2 * n))
+
+
+def phash(small: np.ndarray) -> np.ndarray:
+    """
+    Perceptual hashes of a (N, 32, 32) stack of area-averaged pages,
+    as (N, 64) booleans. One batched DCT for the whole document.
+    """
+    basis = _dct_basis(small.shape[1])
+    coeffs = np.einsum("ki,nij,lj->nkl", basis, small, basis).reshape(len(small), -1)
+
+    # median of the AC terms, as in the usual pHash
+    median = np.median(coeffs[:, 1:], axis=1, keepdims=True)
+    return coeffs > median
+
+
+def ink_coverage(gray: np.ndarray) -> float:
+    return float(np.count_nonzero(gray < INK_LEVEL)) / gray.size
+
+
+def _same_content(
+    a: np.ndarray,
+    b: np.ndarray,
+    text_a: Optional[str],
+    text_b: Optional[str]
+) -> bool:
+    if text_a is not None and text_b is not None:
+        return text_a == text_b
+    if a.shape != b.shape:
+        return False
+    changed = np.count_nonzero(np.abs(a.astype(np.int16) - b) > NEAR_DUP_DELTA)
+    return changed <= NEAR_DUP_PIXELS * a.size
+
+
+# -----------------------------
+# Page plan
+# -----------------------------
+def plan_pages(
+    pdf_path: str,
+    pages: Sequence[int],
+    document: Optional[PdfDocument] = None,
+    dpi: int = SIGNATURE_DPI,
+    cache: Optional[PageRasterCache] = None,
+) -> Dict:
+    """
+    Decide which of `pages` (1-based) need OCR.
+
+    Returns:
+        {
+            "process":      [pages to OCR],
+            "blank":        [blank pages],
+            "duplicate_of": {page: earlier page with the same content},
+            "time_sec":     cost of this stage
+        }
+
+    A page with a text layer is blank only when that text reads
+    "intentionally left blank"; a page without one is blank when
+    its thumbnail has almost no ink. A page is a
+    duplicate when its pHash is within NEAR_DUP_BITS of an earlier
+    page and the content agrees: identical text layers when both
+    pages have one, otherwise thumbnails that differ in almost no
+    pixels. Statement pages share a layout and differ only in their
+    figures, so the hash alone never decides.
+    """
+    start = time.time()
+    cache = cache or get_page_cache()
+    pdf_path = str(pdf_path)
+    pages = list(pages)
+
+    # thumbnails render from the caller's open handle, not a re-parse
+    if document is not None:
+        cache.attach(document)
+
+    grays = [
+        cache.get(pdf_path, p - 1, dpi=dpi, colorspace="gray").gray()
+        for p in pages
+    ]
+
+    # text layer first: a page with a few words of real text (a
+    # single total, a "Nil" note) has little ink but is not blank
+    texts: Dict[int, str] = {}
+    if document is not None:
+        for i, p in enumerate(pages):
+            if not document.has_text_layer(p):
+                continue
+            with document.lock:
+                text = " ".join(document.doc[p - 1].get_text("text").split())
+            if text:
+                texts[i] = text
+
+    blank = np.zeros(len(pages), dtype=bool)
+    for i, g in enumerate(grays):
+        if i in texts:
+            blank[i] = len(texts[i]) <= 60 and bool(_BLANK_TEXT.match(texts[i].lower()))
+        else:
+            blank[i] = ink_coverage(g) < BLANK_INK
+
+    hashes = phash(np.stack([_area_resize(g) for g in grays])) if grays else None
+
+    duplicate_of: Dict[int, int] = {}
+    originals: List[int] = []
+
+    for i, p in enumerate(pages):
+        if blank[i]:
+            continue
+
+        if originals:
+            prior = np.array(originals)
+            dist = np.count_nonzero(hashes[prior] != hashes[i], axis=1)
+
+            for j in prior[dist <= NEAR_DUP_BITS]:
+                if _same_content(grays[j], grays[i], texts.get(j), texts.get(i)):
+                    duplicate_of[p] = pages[j]
+                    break
+
+            if p in duplicate_of:
+                continue
+
+        originals.append(i)
+
+    plan = {
+        "process": [pages[i] for i in originals],
+        "blank": [p for i, p in enumerate(pages) if blank[i]],
+        "duplicate_of": duplicate_of,
+        "time_sec": round(time.time() - start, 3),
+    }
+
+    logger.info(
+        f"Page plan: {len(plan['process'])} to OCR, "
+        f"{len(plan['blank'])} blank, {len(duplicate_of)} duplicate"
+    )
+    return plan
+
+
+def skip_report(plan: Dict, sec_per_page: float) -> Dict:
+    """
+    Result-dict summary: skipped page counts and the OCR time they
+    would have cost, net of the planning stage.
+    """
+    skipped = len(plan["blank"]) + len(plan["duplicate_of"])
+    return {
+        "blank_pages": len(plan["blank"]),
+        "duplicate_pages": len(plan["duplicate_of"]),
+        "time_saved_sec": round(max(0.0, skipped * sec_per_page - plan["time_sec"]), 2),
+    }
@@ -0,0 +1,154 @@
+from typing import Optional, Union
+
+import numpy as np
+from PIL import Image
+
+
+# -----------------------------
+# Page image
+# -----------------------------
+class PageImage:
+    """
+    A rendered page backed by a single uint8 (H, W, C) buffer.
+
+    Pipeline stages (classifiers, EasyOCR, Tesseract, TrOCR) take
+    this instead of PIL images or ad-hoc numpy copies:
+
+    - array      → the buffer itself, no copy
+    - gray()     → 2-D uint8 luminance (a view for 1-channel pages,
+                   computed once and memoized for RGB)
+    - crop()     → a PageImage view over a sub-rectangle
+    - to_pil()   → PIL image; zero-copy for contiguous grayscale
+    """
+
+    __slots__ = ("data", "page_no", "dpi", "_gray")
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        page_no: Optional[int] = None,
+        dpi: Optional[int] = None
+    ):
+        if data.dtype != np.uint8:
+            raise TypeError(f"PageImage needs uint8 data, got {data.dtype}")
+        if data.ndim == 2:
+            data = data[:, :, None]
+
+        self.data = data
+        self.page_no = page_no
+        self.dpi = dpi
+        self._gray = None
+
+    # --------------------------------------------------
+    @property
+    def array(self) -> np.ndarray:
+        return self.data
+
+    @property
+    def height(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def channels(self) -> int:
+        return self.data.shape[2]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and dtype != self.data.dtype:
+            return self.data.astype(dtype)
+        return self.data
+
+    def __repr__(self):
+        return (
+            f"PageImage(page={self.page_no}, dpi={self.dpi}, "
+            f"{self.width}x{self.height}x{self.channels})"
+        )
+
+    # --------------------------------------------------
+    def gray(self) -> np.ndarray:
+        """
+        2-D uint8 luminance (ITU-R 601 integer weights).
+        """
+        if self.channels == 1:
+            return self.data[:, :, 0]
+
+        if self._gray is None:
+            d = self.data
+            luma = (
+                d[:, :, 0].astype(np.uint16) * 77
+                + d[:, :, 1].astype(np.uint16) * 150
+                + d[:, :, 2].astype(np.uint16) * 29
+            ) >> 8
+            self._gray = luma.astype(np.uint8)
+            self._gray.setflags(write=False)
+
+        return self._gray
+
+    def crop(self, x0: int, y0: int, x1: int, y1: int) -> "PageImage":
+        """
+        View of the pixel rectangle [x0, x1) x [y0, y1); no copy.
+        """
+        return PageImage(self.data[y0:y1, x0:x1], self.page_no, self.dpi)
+
+    def to_pil(self, gray: bool = False) -> Image.Image:
+        if gray or self.channels == 1:
+            g = self.gray()
+            if g.flags["C_CONTIGUOUS"]:
+                return Image.frombuffer(
+                    "L", (g.shape[1], g.shape[0]), g, "raw", "L", 0, 1
+                )
+            return Image.fromarray(g)
+
+        # PIL cannot share an RGB buffer; this is the one copy
+        return Image.fromarray(self.data)
+
+    # --------------------------------------------------
+    @classmethod
+    def from_pil(cls, img: Image.Image, page_no: Optional[int] = None, dpi: Optional[int] = None):
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        return cls(np.asarray(img), page_no, dpi)
+
+
+def as_page_image(image: Union["PageImage", np.ndarray, Image.Image]) -> PageImage:
+    """
+    Accept legacy PIL / numpy inputs at stage boundaries.
+    """
+    if isinstance(image, PageImage):
+        return image
+    if isinstance(image, Image.Image):
+        return PageImage.from_pil(image)
+    return PageImage(np.asarray(image, dtype=np.uint8))
+
+
+# -----------------------------
+# Cheap page statistics
+# -----------------------------
+def axis_std(gray: np.ndarray, axis: int) -> np.ndarray:
+    """
+    np.std(gray, axis=axis) for a 2-D uint8 page, using integer
+    reductions instead of a full-size float64 temporary.
+    """
+    n = gray.shape[axis]
+    spec = "ij,ij->i" if axis == 1 else "ij,ij->j"
+
+    s = gray.sum(axis=axis, dtype=np.uint64).astype(np.float64)
+    s2 = np.einsum(spec, gray, gray, dtype=np.uint64).astype(np.float64)
+
+    var = s2 / n - (s / n) ** 2
+    return np.sqrt(np.maximum(var, 0))
+
+
+def mean_abs_diff(gray: np.ndarray) -> float:
+    """
+    Mean absolute horizontal gradient of a 2-D uint8 page.
+    """
+    d = np.subtract(gray[:, 1:], gray[:, :-1], dtype=np.int16)
+    return float(np.abs(d, out=d).mean())
@@ -0,0 +1,227 @@
+import os
+import queue
+import logging
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engines.page_image import PageImage
+from engines.raster import PageRasterCache, get_page_cache, iter_pages
+
+
+logger = logging.getLogger(__name__)
+
+
+# pages to render per worker before a spawned process (interpreter,
+# numpy and PyMuPDF start-up) is cheaper than rendering in-process
+PARALLEL_MIN_PAGES = 64
+
+
+def default_workers() -> int:
+    """
+    OCR_RENDER_WORKERS env var, else 1 (in-process).
+    """
+    env_workers = os.getenv("OCR_RENDER_WORKERS")
+    if env_workers:
+        return max(1, int(env_workers))
+    return 1
+
+
+# -----------------------------
+# Worker process
+# -----------------------------
+def _render_worker(
+    worker_id: int,
+    pdf_path: str,
+    page_nos: List[int],
+    dpi: int,
+    colorspace: str,
+    slots,
+    out_q
+):
+    """
+    Open the PDF once and render this worker's interleaved share
+    of pages into shared-memory blocks. Only (page_no, block name,
+    shape) goes through the queue; pixels are never pickled.
+
+    `slots` bounds how many rendered-but-unconsumed pages this
+    worker may hold, so memory stays flat on long documents.
+    """
+    from engines.render import PyMuPDFRenderer, binarize_adaptive
+
+    try:
+        with PyMuPDFRenderer(pdf_path) as renderer:
+            for page_no in page_nos:
+                slots.acquire()
+
+                pix = renderer.pixmap(page_no - 1, dpi=dpi, colorspace=colorspace)
+                samples = pix.samples_mv
+                shape = (pix.h, pix.w, pix.n)
+
+                if colorspace == "binary":
+                    gray = np.frombuffer(samples, dtype=np.uint8).reshape(pix.h, pix.w)
+                    samples = memoryview(binarize_adaptive(gray)).cast("B")
+
+                shm = shared_memory.SharedMemory(create=True, size=len(samples))
+                shm.buf[:len(samples)] = samples
+                out_q.put(("page", page_no, shm.name, shape))
+                shm.close()
+
+    except Exception as e:
+        out_q.put(("error", worker_id, f"{type(e).__name__}: {e}", None))
+        return
+
+    out_q.put(("done", worker_id, None, None))
+
+
+def _take_block(name: str, shape: Tuple[int, int, int]) -> np.ndarray:
+    """
+    Copy a worker's shared-memory block into a private array and
+    release the block.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        data = view.copy()
+        del view
+    finally:
+        shm.close()
+        shm.unlink()
+    return data
+
+
+# -----------------------------
+# Parallel page iterator
+# -----------------------------
+def iter_pages_parallel(
+    pdf_path: str,
+    pages: Sequence[int],
+    dpi: int = 300,
+    colorspace: str = "rgb",
+    workers: Optional[int] = None,
+    window: int = 2,
+    cache: Optional[PageRasterCache] = None,
+) -> Iterator[Tuple[int, PageImage]]:
+    """
+    Yield (page_no, image) for `pages` (1-based) in order, rendering
+    with a pool of PyMuPDF worker processes.
+
+    Worker k renders pages[k::workers]. Pages already in the raster
+    cache are served from it; freshly rendered pages are inserted.
+    Workers are capped at the core count and at one per
+    PARALLEL_MIN_PAGES pages to render; below that, pages are
+    rendered in this process.
+    """
+    cache = cache or get_page_cache()
+    pdf_path = str(pdf_path)
+    pages = list(pages)
+    workers = workers or default_workers()
+
+    missing = [
+        p for p in pages
+        if cache.lookup(pdf_path, p - 1, dpi, colorspace) is None
+    ]
+    workers = max(1, min(
+        workers, os.cpu_count() or 1, len(missing) // PARALLEL_MIN_PAGES
+    ))
+
+    if workers <= 1:
+        yield from iter_pages(
+            pdf_path, dpi, colorspace,
+            pages=pages, prefetch=window, cache=cache
+        )
+        return
+
+    ctx = mp.get_context("spawn")
+    out_q = ctx.Queue()
+
+    owner: Dict[int, int] = {}
+    slots = []
+    procs = []
+
+    for k in range(workers):
+        share = missing[k::workers]
+        for p in share:
+            owner[p] = k
+
+        sem = ctx.Semaphore(window)
+        slots.append(sem)
+
+        proc = ctx.Process(
+            target=_render_worker,
+            args=(k, pdf_path, share, dpi, colorspace, sem, out_q),
+            daemon=True
+        )
+        proc.start()
+        procs.append(proc)
+
+    logger.info(f"Parallel render: {len(missing)} pages on {workers} workers")
+
+    ready: Dict[int, np.ndarray] = {}
+    finished = 0
+
+    def receive():
+        nonlocal finished
+        while True:
+            try:
+                kind, a, b, c = out_q.get(timeout=1.0)
+                break
+            except queue.Empty:
+                dead = [
+                    p for p in procs
+                    if not p.is_alive() and p.exitcode not in (0, None)
+                ]
+                if dead:
+                    raise RuntimeError(
+                        f"Render worker exited with code {dead[0].exitcode}"
+                    )
+
+        if kind == "page":
+            ready[a] = _take_block(b, c)
+        elif kind == "done":
+            finished += 1
+        else:
+            raise RuntimeError(f"Render worker {a} failed: {b}")
+
+    try:
+        for page_no in pages:
+            if page_no not in owner:
+                yield page_no, cache.get(pdf_path, page_no - 1, dpi, colorspace)
+                continue
+
+            while page_no not in ready:
+                receive()
+
+            img = cache.put(
+                pdf_path, page_no - 1, dpi, colorspace, ready.pop(page_no)
+            )
+            slots[owner[page_no]].release()
+
+            yield page_no, img
+
+        while finished < workers:
+            receive()
+
+    finally:
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+
+        # release blocks rendered but never consumed
+        while True:
+            try:
+                kind, _, name, _ = out_q.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                break
+            if kind == "page":
+                try:
+                    shm = shared_memory.SharedMemory(name=name)
+                    shm.close()
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+
+        out_q.close()
@@ -0,0 +1,76 @@
+import io
+import logging
+from pathlib import Path
+from typing import Optional, Sequence
+
+import fitz  # PyMuPDF
+
+from engines.document import PdfDocument
+
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# In-memory page subsets
+# -----------------------------
+def page_subset_bytes(
+    pdf_path: str,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None,
+    pages: Optional[Sequence[int]] = None,
+    document: Optional[PdfDocument] = None
+) -> bytes:
+    """
+    A new PDF holding start_page..end_page (1-based, inclusive) or
+    the explicit `pages` list, serialized to bytes.
+
+    Nothing touches the filesystem, so concurrent workers on the
+    same document cannot clobber each other's subsets. With an
+    opened `document` the file is not parsed again.
+    """
+    if document is not None:
+        with document.lock:
+            return _subset(document.doc, start_page, end_page, pages)
+
+    with fitz.open(str(pdf_path)) as src:
+        return _subset(src, start_page, end_page, pages)
+
+
+def _subset(src, start_page, end_page, pages) -> bytes:
+    if pages is None:
+        first = start_page or 1
+        last = end_page or len(src)
+        pages = range(first, last + 1)
+
+    with fitz.open() as out:
+        for page_no in pages:
+            out.insert_pdf(src, from_page=page_no - 1, to_page=page_no - 1)
+        return out.tobytes()
+
+
+def page_subset_stream(
+    pdf_path: str,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None,
+    pages: Optional[Sequence[int]] = None,
+    document: Optional[PdfDocument] = None
+):
+    """
+    Page subset as a Docling DocumentStream, ready for
+    DocumentConverter.convert().
+    """
+    from docling.datamodel.base_models import DocumentStream
+
+    data = page_subset_bytes(pdf_path, start_page, end_page, pages, document)
+
+    path = Path(pdf_path)
+    if pages is not None:
+        suffix = f"p{pages[0]}-{pages[-1]}" if pages else "empty"
+    else:
+        suffix = f"p{start_page or 1}-{end_page or 'end'}"
+
+    return DocumentStream(
+        name=f"{path.stem}_{suffix}.pdf",
+        stream=io.BytesIO(data)
+    )
@@ -0,0 +1,78 @@
+import time
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+
+# -----------------------------
+# Progress events
+# -----------------------------
+@dataclass(frozen=True)
+class ProgressEvent:
+    """
+    Completion of a page (or of the last page of a chunk).
+
+    Sent to progress_cb alongside the plain status strings; str()
+    gives a status line, so callbacks that only print keep working.
+    """
+    stage: str                 # "convert", "ocr", "extract", ...
+    page: int                  # 1-based page in the source PDF
+    done: int                  # pages completed so far
+    total: int                 # pages in this job
+    elapsed_sec: float
+    pages_per_sec: float
+    eta_sec: Optional[float]   # None until the first page completes
+
+    def __str__(self) -> str:
+        eta = f"{self.eta_sec:.0f}s" if self.eta_sec is not None else "?"
+        return (
+            f"{self.stage}: page {self.page} done ({self.done}/{self.total}, "
+            f"{self.pages_per_sec:.2f} pages/s, ETA {eta})"
+        )
+
+
+ProgressCallback = Callable[[Union[str, ProgressEvent]], None]
+
+
+class ProgressTracker:
+    """
+    Turns page completions into ProgressEvents with a running rate
+    and ETA. Safe to call from the threads collecting worker results.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        callback: Optional[ProgressCallback] = None,
+        stage: str = "convert"
+    ):
+        self.total = total
+        self.callback = callback
+        self.stage = stage
+        self.done = 0
+        self.start = time.time()
+        self._lock = threading.Lock()
+
+    def page_done(self, page: int, pages: int = 1, stage: Optional[str] = None) -> ProgressEvent:
+        """
+        Record `pages` completed pages, the last of them `page`.
+        """
+        with self._lock:
+            self.done = min(self.total, self.done + pages)
+            elapsed = time.time() - self.start
+            rate = self.done / elapsed if elapsed > 0 else 0.0
+            eta = (self.total - self.done) / rate if rate > 0 else None
+
+            event = ProgressEvent(
+                stage=stage or self.stage,
+                page=page,
+                done=self.done,
+                total=self.total,
+                elapsed_sec=round(elapsed, 2),
+                pages_per_sec=round(rate, 3),
+                eta_sec=round(eta, 1) if eta is not None else None
+            )
+
+        if self.callback:
+            self.callback(event)
+        return event
@@ -0,0 +1,500 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engines.page_image import PageImage
+from engines.render import (
+    COLORSPACES,
+    BBox,
+    PageRenderer,
+    default_backend,
+    downsample_area,
+    open_renderer,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Defaults
+# -----------------------------
+DEFAULT_MEMORY_BYTES = 512 * 1024 * 1024      # in-memory LRU budget
+DEFAULT_DISK_BYTES = 4 * 1024 * 1024 * 1024   # spill tier budget
+
+# (pdf content hash, page index, dpi, colorspace, clip or None)
+RasterKey = Tuple[str, int, int, str, Optional[BBox]]
+
+
+# -----------------------------
+# PDF content hash
+# -----------------------------
+_digest_memo: Dict[Tuple[str, int, int], str] = {}
+_digest_lock = threading.Lock()
+
+
+def pdf_digest(pdf_path: str) -> str:
+    """
+    SHA-256 of the PDF bytes.
+
+    Memoized on (path, size, mtime) so a long report is hashed
+    once per process, not once per page lookup.
+    """
+    path = Path(pdf_path).expanduser().resolve()
+    st = path.stat()
+    memo_key = (str(path), st.st_size, st.st_mtime_ns)
+
+    with _digest_lock:
+        cached = _digest_memo.get(memo_key)
+    if cached:
+        return cached
+
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+
+    with _digest_lock:
+        _digest_memo[memo_key] = digest
+    return digest
+
+
+# -----------------------------
+# Page raster cache
+# -----------------------------
+class PageRasterCache:
+    """
+    Two-tier cache of rendered PDF pages.
+
+    Keyed by (PDF content hash, page index, DPI, colorspace, clip),
+    so every engine asking for the same page at the same resolution
+    gets the same raster instead of rendering it again. Region clips
+    (e.g. a table at 300 DPI on an otherwise 72 DPI page) are cached
+    alongside full pages.
+
+    Tiers:
+        memory → LRU bounded by max_bytes
+        disk   → .npy spill files bounded by disk_max_bytes, LRU by
+                 an in-memory index (mtime refreshed on hits so the
+                 order survives restarts)
+
+    The disk tier is opt-in (disk_dir or env OCR_RASTER_CACHE_DIR):
+    spilling writes every evicted page synchronously, which only pays
+    off when pages are read again after eviction.
+
+    Returned PageImages wrap read-only uint8 (H, W, C) buffers
+    shared between callers; copy before mutating.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MEMORY_BYTES,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = DEFAULT_DISK_BYTES,
+        backend: Optional[str] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self.disk_max_bytes = disk_max_bytes
+
+        if disk_dir is None:
+            disk_dir = os.getenv("OCR_RASTER_CACHE_DIR", "")
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+
+        self._mem: "OrderedDict[RasterKey, PageImage]" = OrderedDict()
+        self._mem_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()   # file name → size, LRU first
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        # PyMuPDF is not thread-safe → one render at a time per cache
+        self._render_lock = threading.Lock()
+        self._renderers: "OrderedDict[str, PageRenderer]" = OrderedDict()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.derived = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+            # one scan at start-up; the index is kept current afterwards
+            files = []
+            for p in self.disk_dir.glob("*.npy"):
+                try:
+                    st = p.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((st.st_mtime, p.name, st.st_size))
+
+            for _, name, size in sorted(files):
+                self._disk[name] = size
+                self._disk_bytes += size
+
+    # --------------------------------------------------
+    def key(
+        self,
+        pdf_path: str,
+        page_index: int,
+        dpi: int,
+        colorspace: str = "rgb",
+        clip: Optional[BBox] = None
+    ) -> RasterKey:
+        if colorspace not in COLORSPACES:
+            raise ValueError(f"Unsupported colorspace: {colorspace}")
+        if clip is not None:
+            clip = tuple(round(float(v), 2) for v in clip)
+        return (pdf_digest(pdf_path), page_index, dpi, colorspace, clip)
+
+    # --------------------------------------------------
+    def get(
+        self,
+        pdf_path: str,
+        page_index: int,
+        dpi: int = 300,
+        colorspace: str = "rgb",
+        derive_from: Optional[int] = None,
+        clip: Optional[BBox] = None
+    ) -> PageImage:
+        """
+        Return page `page_index` (0-based) rendered at `dpi`.
+
+        With `derive_from` (a multiple of `dpi`), a miss is served by
+        area-downsampling the `derive_from` level instead of decoding
+        the PDF again, so one render feeds every pyramid level.
+
+        With `clip` (PDF points, top-left origin), only that region
+        is rasterized.
+        """
+        key = self.key(pdf_path, page_index, dpi, colorspace, clip)
+
+        if derive_from and derive_from % dpi:
+            raise ValueError(
+                f"derive_from ({derive_from}) must be a multiple of dpi ({dpi})"
+            )
+
+        img = self._lookup(key)
+        if img is not None:
+            return img
+
+        if derive_from and derive_from != dpi:
+            base = self.get(
+                pdf_path, page_index, derive_from, colorspace, clip=clip
+            )
+            img = self._wrap(key, downsample_area(base.data, derive_from // dpi))
+            with self._lock:
+                self.derived += 1
+        else:
+            img = self._render(pdf_path, key)
+            with self._lock:
+                self.misses += 1
+
+        self._put(key, img)
+        return img
+
+    # --------------------------------------------------
+    def lookup(
+        self,
+        pdf_path: str,
+        page_index: int,
+        dpi: int = 300,
+        colorspace: str = "rgb"
+    ) -> Optional[PageImage]:
+        """
+        Cached page from either tier, or None. Never renders.
+        """
+        return self._lookup(self.key(pdf_path, page_index, dpi, colorspace))
+
+    def put(
+        self,
+        pdf_path: str,
+        page_index: int,
+        dpi: int,
+        colorspace: str,
+        data: np.ndarray
+    ) -> PageImage:
+        """
+        Insert a raster produced outside the cache (e.g. by a
+        parallel render worker).
+        """
+        key = self.key(pdf_path, page_index, dpi, colorspace)
+        img = self._wrap(key, data)
+        with self._lock:
+            self.misses += 1
+        self._put(key, img)
+        return img
+
+    # --------------------------------------------------
+    def attach(self, document) -> None:
+        """
+        Render this PDF through an opened PdfDocument's renderer
+        instead of parsing the file again. Ignored when the cache
+        is configured for a non-PyMuPDF backend.
+        """
+        if self.backend not in (None, "pymupdf") or not document.valid:
+            return
+        if self.backend is None and default_backend() != "pymupdf":
+            return
+
+        digest = pdf_digest(str(document.path))
+        with self._render_lock:
+            old = self._renderers.pop(digest, None)
+            if old is not None and old is not document.renderer():
+                old.close()
+            self._renderers[digest] = document.renderer()
+
+    def page_count(self, pdf_path: str) -> int:
+        with self._render_lock:
+            return self._open(pdf_path, pdf_digest(pdf_path)).page_count()
+
+    # --------------------------------------------------
+    def clear(self):
+        with self._lock:
+            self._mem.clear()
+            self._mem_bytes = 0
+        with self._render_lock:
+            for renderer in self._renderers.values():
+                renderer.close()
+            self._renderers.clear()
+
+    # --------------------------------------------------
+    def _lookup(self, key: RasterKey) -> Optional[PageImage]:
+        with self._lock:
+            img = self._mem.get(key)
+            if img is not None:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return img
+
+        img = self._load_disk(key)
+        if img is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._put(key, img)
+        return img
+
+    def _open(self, pdf_path: str, digest: str) -> PageRenderer:
+        # caller holds _render_lock
+        renderer = self._renderers.get(digest)
+        if renderer is None:
+            renderer = open_renderer(pdf_path, self.backend)
+            self._renderers[digest] = renderer
+            while len(self._renderers) > 4:
+                _, old = self._renderers.popitem(last=False)
+                old.close()
+        else:
+            self._renderers.move_to_end(digest)
+        return renderer
+
+    def _wrap(self, key: RasterKey, data: np.ndarray) -> PageImage:
+        _, page_index, dpi, _, _ = key
+        data.setflags(write=False)
+        return PageImage(data, page_no=page_index + 1, dpi=dpi)
+
+    def _render(self, pdf_path: str, key: RasterKey) -> PageImage:
+        digest, page_index, dpi, colorspace, clip = key
+
+        with self._render_lock:
+            renderer = self._open(pdf_path, digest)
+            data = renderer.render(
+                page_index, dpi=dpi, colorspace=colorspace, clip=clip
+            )
+
+        return self._wrap(key, data)
+
+    # --------------------------------------------------
+    def _put(self, key: RasterKey, img: PageImage):
+        spilled = []
+
+        with self._lock:
+            if key in self._mem:
+                return
+            self._mem[key] = img
+            self._mem_bytes += img.nbytes
+
+            while self._mem_bytes > self.max_bytes and len(self._mem) > 1:
+                old_key, old_img = self._mem.popitem(last=False)
+                self._mem_bytes -= old_img.nbytes
+                spilled.append((old_key, old_img))
+
+        for old_key, old_img in spilled:
+            self._spill(old_key, old_img)
+
+    # --------------------------------------------------
+    def _disk_path(self, key: RasterKey) -> Path:
+        digest, page_index, dpi, colorspace, clip = key
+        name = f"{digest}_{page_index}_{dpi}_{colorspace}"
+        if clip:
+            name += "_clip_" + "_".join(f"{v:g}" for v in clip)
+        return self.disk_dir / f"{name}.npy"
+
+    def _load_disk(self, key: RasterKey) -> Optional[PageImage]:
+        if not self.disk_dir:
+            return None
+
+        path = self._disk_path(key)
+        with self._lock:
+            if path.name not in self._disk:
+                return None
+            self._disk.move_to_end(path.name)
+
+        try:
+            data = np.load(path)
+            os.utime(path)
+        except FileNotFoundError:
+            self._forget(path.name)
+            return None
+        except Exception:
+            logger.warning(f"Dropping unreadable raster cache file: {path}")
+            path.unlink(missing_ok=True)
+            self._forget(path.name)
+            return None
+
+        return self._wrap(key, data)
+
+    def _forget(self, name: str):
+        with self._lock:
+            self._disk_bytes -= self._disk.pop(name, 0)
+
+    def _spill(self, key: RasterKey, img: PageImage):
+        if not self.disk_dir:
+            return
+
+        path = self._disk_path(key)
+        with self._lock:
+            if path.name in self._disk:
+                self._disk.move_to_end(path.name)
+                return
+
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, img.data)
+        size = tmp.stat().st_size
+        os.replace(tmp, path)
+
+        with self._lock:
+            self._disk_bytes += size - self._disk.pop(path.name, 0)
+            self._disk[path.name] = size
+            over = self._disk_bytes > self.disk_max_bytes
+
+        if over:
+            self._trim_disk()
+
+    def _trim_disk(self):
+        # least recently used first, straight from the index
+        victims = []
+        with self._lock:
+            while self._disk_bytes > self.disk_max_bytes and len(self._disk) > 1:
+                name, size = self._disk.popitem(last=False)
+                self._disk_bytes -= size
+                victims.append(name)
+
+        for name in victims:
+            (self.disk_dir / name).unlink(missing_ok=True)
+
+
+# -----------------------------
+# Process-wide cache
+# -----------------------------
+_default_cache: Optional[PageRasterCache] = None
+_default_lock = threading.Lock()
+
+
+def get_page_cache() -> PageRasterCache:
+    """
+    Shared cache used by all engines and classifiers.
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = PageRasterCache()
+        return _default_cache
+
+
+# -----------------------------
+# Streaming page iterator
+# -----------------------------
+def iter_pages(
+    pdf_path: str,
+    dpi: int = 300,
+    colorspace: str = "rgb",
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    prefetch: int = 1,
+    cache: Optional[PageRasterCache] = None,
+    derive_from: Optional[int] = None,
+    pages: Optional[Sequence[int]] = None,
+    workers: int = 1,
+) -> Iterator[Tuple[int, PageImage]]:
+    """
+    Lazily yield (page_no, image) for first_page..last_page
+    (1-based, inclusive), or for the explicit `pages` list.
+
+    At most `prefetch` pages are rendered ahead of the consumer,
+    so peak memory does not grow with document length and OCR on
+    page 1 starts while later pages are still unrendered.
+
+    `derive_from` is forwarded to PageRasterCache.get. With
+    workers > 1, rendering is fanned out to a process pool
+    (see engines.parallel_render).
+    """
+    cache = cache or get_page_cache()
+    pdf_path = str(pdf_path)
+
+    if pages is None:
+        if last_page is None:
+            last_page = cache.page_count(pdf_path)
+        pages = range(first_page, last_page + 1)
+
+    if workers > 1 and not derive_from:
+        from engines.parallel_render import iter_pages_parallel
+
+        yield from iter_pages_parallel(
+            pdf_path,
+            pages,
+            dpi=dpi,
+            colorspace=colorspace,
+            workers=workers,
+            window=max(prefetch, 1),
+            cache=cache
+        )
+        return
+
+    if prefetch <= 0:
+        for page_no in pages:
+            yield page_no, cache.get(
+                pdf_path, page_no - 1, dpi, colorspace, derive_from
+            )
+        return
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch")
+    pending = deque()
+
+    try:
+        for page_no in pages:
+            pending.append((
+                page_no,
+                pool.submit(
+                    cache.get, pdf_path, page_no - 1, dpi, colorspace, derive_from
+                )
+            ))
+
+            if len(pending) > prefetch:
+                ready_no, fut = pending.popleft()
+                yield ready_no, fut.result()
+
+        while pending:
+            ready_no, fut = pending.popleft()
+            yield ready_no, fut.result()
+
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,111 @@
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from engines.page_image import PageImage
+from engines.raster import PageRasterCache, get_page_cache
+from engines.render import BBox
+
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Layout → region boxes
+# -----------------------------
+def docling_region_boxes(
+    doc,
+    labels: Iterable[str] = ("table",)
+) -> Dict[int, List[BBox]]:
+    """
+    Region boxes from a Docling document, grouped by 1-based page.
+
+    Docling stores provenance boxes in PDF points, usually with a
+    bottom-left origin; they are flipped to the top-left origin the
+    renderers use.
+    """
+    labels = set(labels)
+    boxes: Dict[int, List[BBox]] = {}
+
+    for item, _ in doc.iterate_items():
+        label = getattr(getattr(item, "label", None), "value", None)
+        if label not in labels:
+            continue
+
+        for prov in getattr(item, "prov", []):
+            page = doc.pages.get(prov.page_no)
+            if page is None:
+                continue
+
+            bbox = prov.bbox.to_top_left_origin(page_height=page.size.height)
+            boxes.setdefault(prov.page_no, []).append(
+                (bbox.l, bbox.t, bbox.r, bbox.b)
+            )
+
+    return boxes
+
+
+def classifier_region_boxes(
+    regions: Sequence[Dict],
+    labels: Iterable[str] = ("table",)
+) -> Dict[int, List[BBox]]:
+    """
+    Region boxes from LayoutClassifier output, grouped by page.
+    Pages labelled without a "bbox" are skipped.
+    """
+    labels = set(labels)
+    boxes: Dict[int, List[BBox]] = {}
+
+    for region in regions:
+        if region.get("label") in labels and region.get("bbox"):
+            boxes.setdefault(region["page"], []).append(tuple(region["bbox"]))
+
+    return boxes
+
+
+# -----------------------------
+# Region rendering
+# -----------------------------
+def pad_box(box: BBox, margin: float = 4.0) -> BBox:
+    """
+    Grow a box by `margin` points so ruling lines on the table
+    border survive the clip.
+    """
+    x0, y0, x1, y1 = box
+    return (max(0.0, x0 - margin), max(0.0, y0 - margin), x1 + margin, y1 + margin)
+
+
+def render_regions(
+    pdf_path: str,
+    page_no: int,
+    boxes: Sequence[BBox],
+    dpi: int = 300,
+    page_dpi: Optional[int] = 72,
+    colorspace: str = "gray",
+    margin: float = 4.0,
+    cache: Optional[PageRasterCache] = None,
+) -> Tuple[Optional[PageImage], List[PageImage]]:
+    """
+    Render page `page_no` (1-based) at the cheap `page_dpi` and only
+    the `boxes` (PDF points, top-left origin) at `dpi`.
+
+    Returns (page image or None when page_dpi is None, crops in box
+    order). Both go through the shared raster cache.
+    """
+    cache = cache or get_page_cache()
+    pdf_path = str(pdf_path)
+
+    page = None
+    if page_dpi:
+        page = cache.get(pdf_path, page_no - 1, dpi=page_dpi, colorspace=colorspace)
+
+    crops = [
+        cache.get(
+            pdf_path, page_no - 1,
+            dpi=dpi,
+            colorspace=colorspace,
+            clip=pad_box(box, margin)
+        )
+        for box in boxes
+    ]
+
+    return page, crops
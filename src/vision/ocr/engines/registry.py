@@ -0,0 +1,19 @@
+import importlib
+from functools import lru_cache
+
+
+# -----------------------------
+# Lazy engine registry
+# -----------------------------
+@lru_cache(maxsize=None)
+def load_engine(spec: str):
+    """
+    Engine class from a "package.module.ClassName" path.
+
+    CLI registries hold these paths rather than classes, so importing
+    a script does not pull in torch, transformers or Docling; only
+    the engine actually chosen is imported, on first use.
+    """
+    module_path, class_name = spec.rsplit(".", 1)
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
@@ -0,0 +1,390 @@
+import os
+import sys
+import logging
+import contextlib
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple, Type
+
+import numpy as np
+import fitz  # PyMuPDF
+
+
+logger = logging.getLogger(__name__)
+
+
+# rgb → 3 channels; gray → 8-bit luminance straight from the rasterizer;
+# binary → gray + adaptive threshold (0 = ink, 255 = paper)
+COLORSPACES = ("rgb", "gray", "binary")
+
+# Render pyramid: one decode at PYRAMID_BASE_DPI, lower levels derived
+PYRAMID_BASE_DPI = 300
+THUMBNAIL_DPI = 75
+
+# Page region in PDF points (1/72"), top-left origin: (x0, y0, x1, y1)
+BBox = Tuple[float, float, float, float]
+
+
+# -----------------------------
+# Renderer interface
+# -----------------------------
+class PageRenderer(ABC):
+    """
+    Abstract base class for PDF page rasterizers.
+
+    A renderer is bound to one PDF and hands back pages as
+    uint8 numpy arrays shaped (H, W, C), C = 3 for "rgb" and
+    1 for "gray" / "binary". Page indices are 0-based.
+
+    `clip` restricts the render to one page region (see BBox).
+    """
+
+    name = "base"
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = str(pdf_path)
+
+    @abstractmethod
+    def page_count(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def render(
+        self,
+        page_index: int,
+        dpi: int = 300,
+        colorspace: str = "rgb",
+        clip: Optional[BBox] = None
+    ) -> np.ndarray:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# -----------------------------
+# PyMuPDF (in-process, default)
+# -----------------------------
+class PyMuPDFRenderer(PageRenderer):
+    """
+    Renders in-process with PyMuPDF.
+
+    No subprocess and no temporary files: the pixmap buffer is
+    viewed as a numpy array and copied out once.
+
+    Pass `doc` to render from an already-open fitz.Document (e.g. a
+    PdfDocument handle) and the `lock` guarding it; the renderer then
+    leaves the document open on close.
+    """
+
+    name = "pymupdf"
+
+    _CS = {
+        "rgb": fitz.csRGB,
+        "gray": fitz.csGRAY,
+        "binary": fitz.csGRAY,
+    }
+
+    def __init__(
+        self,
+        pdf_path: str,
+        doc: Optional["fitz.Document"] = None,
+        lock=None
+    ):
+        super().__init__(pdf_path)
+        self._owns_doc = doc is None
+        self._lock = lock or contextlib.nullcontext()
+        self.doc = fitz.open(self.pdf_path) if doc is None else doc
+
+    def _document(self) -> "fitz.Document":
+        if self.doc.is_closed:
+            # borrowed document was closed by its owner → reopen
+            self.doc = fitz.open(self.pdf_path)
+            self._owns_doc = True
+        return self.doc
+
+    def page_count(self) -> int:
+        with self._lock:
+            return len(self._document())
+
+    def pixmap(
+        self,
+        page_index: int,
+        dpi: int = 300,
+        colorspace: str = "rgb",
+        clip: Optional[BBox] = None
+    ) -> "fitz.Pixmap":
+        # with clip, only the region's pixels are rasterized
+        with self._lock:
+            return self._document()[page_index].get_pixmap(
+                dpi=dpi,
+                colorspace=self._CS[colorspace],
+                alpha=False,
+                clip=fitz.Rect(clip) if clip else None
+            )
+
+    def render(
+        self,
+        page_index: int,
+        dpi: int = 300,
+        colorspace: str = "rgb",
+        clip: Optional[BBox] = None
+    ) -> np.ndarray:
+        pix = self.pixmap(page_index, dpi, colorspace, clip)
+        img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(
+            pix.h, pix.w, pix.n
+        )
+
+        if colorspace == "binary":
+            return binarize_adaptive(img[:, :, 0])[:, :, None]
+        return img.copy()
+
+    def close(self):
+        if self._owns_doc:
+            self.doc.close()
+
+
+# -----------------------------
+# pdf2image / poppler (legacy)
+# -----------------------------
+def resolve_poppler_path() -> Optional[str]:
+    """
+    Poppler binaries for pdf2image.
+    Priority:
+    1. Environment variable POPPLER_PATH
+    2. Legacy Windows install location
+    3. System PATH (None)
+    """
+    env_path = os.getenv("POPPLER_PATH")
+    if env_path:
+        return env_path
+
+    legacy = r"C:\poppler\Library\bin"
+    if sys.platform == "win32" and os.path.isdir(legacy):
+        return legacy
+
+    return None
+
+
+class Pdf2ImageRenderer(PageRenderer):
+    """
+    Renders through poppler's pdftoppm via pdf2image.
+
+    Kept for platforms without a working PyMuPDF build and for
+    benchmarking against the in-process renderer. pdftoppm has no
+    region mode here, so clips are cut from a full-page render.
+    """
+
+    name = "pdf2image"
+
+    def __init__(self, pdf_path: str):
+        super().__init__(pdf_path)
+
+        import pdf2image
+        self._pdf2image = pdf2image
+        self.poppler_path = resolve_poppler_path()
+        self._pages = None
+
+    def page_count(self) -> int:
+        if self._pages is None:
+            info = self._pdf2image.pdfinfo_from_path(
+                self.pdf_path,
+                poppler_path=self.poppler_path
+            )
+            self._pages = int(info["Pages"])
+        return self._pages
+
+    def render(
+        self,
+        page_index: int,
+        dpi: int = 300,
+        colorspace: str = "rgb",
+        clip: Optional[BBox] = None
+    ) -> np.ndarray:
+        images = self._pdf2image.convert_from_path(
+            self.pdf_path,
+            dpi=dpi,
+            first_page=page_index + 1,
+            last_page=page_index + 1,
+            grayscale=(colorspace != "rgb"),
+            poppler_path=self.poppler_path
+        )
+        img = np.asarray(images[0], dtype=np.uint8)
+
+        if clip:
+            x0, y0, x1, y1 = clip_to_pixels(clip, dpi, img.shape[1], img.shape[0])
+            img = np.ascontiguousarray(img[y0:y1, x0:x1])
+
+        if colorspace == "binary":
+            img = binarize_adaptive(img)
+        if img.ndim == 2:
+            img = img[:, :, None]
+        return img
+
+
+# -----------------------------
+# Region geometry
+# -----------------------------
+def clip_to_pixels(
+    clip: BBox,
+    dpi: int,
+    width: Optional[int] = None,
+    height: Optional[int] = None
+) -> Tuple[int, int, int, int]:
+    """
+    Pixel rectangle covered by a PDF-point clip at `dpi`, rounded
+    outwards and optionally clamped to a width x height raster.
+    """
+    scale = dpi / 72.0
+    x0, y0, x1, y1 = clip
+
+    px = [
+        int(np.floor(x0 * scale)),
+        int(np.floor(y0 * scale)),
+        int(np.ceil(x1 * scale)),
+        int(np.ceil(y1 * scale)),
+    ]
+    if width is not None:
+        px[0], px[2] = max(0, px[0]), min(width, px[2])
+    if height is not None:
+        px[1], px[3] = max(0, px[1]), min(height, px[3])
+    return tuple(px)
+
+
+def pixels_to_clip(box: Tuple[int, int, int, int], dpi: int) -> BBox:
+    """
+    Inverse of clip_to_pixels: a pixel box on a `dpi` raster
+    in PDF points.
+    """
+    scale = 72.0 / dpi
+    return tuple(round(v * scale, 2) for v in box)
+
+
+# -----------------------------
+# Pyramid levels
+# -----------------------------
+def downsample_area(img: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Integer-factor area (box) downsampling of a uint8 (H, W, C) raster.
+
+    Each output pixel is the rounded mean of a factor x factor block,
+    computed in one vectorized reduction; trailing rows/columns that
+    do not fill a block are dropped.
+    """
+    if factor == 1:
+        return img
+
+    h = img.shape[0] // factor
+    w = img.shape[1] // factor
+    c = img.shape[2]
+
+    blocks = img[:h * factor, :w * factor].reshape(h, factor, w, factor, c)
+    area = factor * factor
+
+    out = (blocks.sum(axis=(1, 3), dtype=np.uint32) + area // 2) // area
+    return out.astype(np.uint8)
+
+
+# -----------------------------
+# Binarization
+# -----------------------------
+def _window_sums(cs: np.ndarray, r: int, out: np.ndarray):
+    """
+    Sums over windows of 2r+1 rows (clipped at the edges), from
+    cumulative sums `cs` with a leading zero row, written into `out`
+    through slices so no full-page temporary is made.
+    """
+    n = out.shape[0]
+    k = max(0, n - r)
+    out[:k] = cs[r + 1:r + 1 + k]
+    out[k:] = cs[n]
+    if n > r:
+        out[r:] -= cs[:n - r]
+
+
+def binarize_adaptive(
+    gray: np.ndarray,
+    window: Optional[int] = None,
+    t: float = 0.15
+) -> np.ndarray:
+    """
+    Bradley-Roth adaptive threshold of a 2-D uint8 page.
+
+    A pixel is ink when it is more than `t` darker than the mean
+    of its window x window neighbourhood. Box sums come from
+    separable cumulative sums, so the whole page is thresholded
+    in a handful of vectorized passes.
+
+    Sums are uint32 (a window sum is far below 2**32, so the
+    wrap-around of very large pages cancels out) and the threshold
+    is built in place, so no int64 page-sized temporaries are made.
+
+    Returns uint8 with 0 = ink, 255 = paper.
+    """
+    h, w = gray.shape
+    if window is None:
+        window = max(15, (min(h, w) // 16) | 1)
+    r = window // 2
+
+    # vertical window sums, then horizontal window sums of those
+    box = np.empty((h, w), dtype=np.uint32)
+
+    cs = np.zeros((h + 1, w), dtype=np.uint32)
+    np.cumsum(gray, axis=0, dtype=np.uint32, out=cs[1:])
+    _window_sums(cs, r, box)
+
+    cs = np.zeros((h, w + 1), dtype=np.uint32)
+    np.cumsum(box, axis=1, out=cs[:, 1:])
+    _window_sums(cs.T, r, box.T)
+    del cs
+
+    # ink: gray * count < box * (1 - t), with count the clipped window area
+    count_y = np.minimum(np.arange(h) + r + 1, h) - np.maximum(np.arange(h) - r, 0)
+    count_x = np.minimum(np.arange(w) + r + 1, w) - np.maximum(np.arange(w) - r, 0)
+
+    scaled = np.multiply(gray, count_y[:, None], dtype=np.float32)
+    scaled *= count_x[None, :]
+    scaled /= 1.0 - t
+
+    paper = np.greater_equal(scaled, box)
+    del scaled, box
+
+    out = paper.view(np.uint8)
+    out *= 255
+    return out
+
+
+# -----------------------------
+# Registry
+# -----------------------------
+RENDERERS: Dict[str, Type[PageRenderer]] = {
+    "pymupdf": PyMuPDFRenderer,
+    "pdf2image": Pdf2ImageRenderer,
+}
+
+
+def default_backend() -> str:
+    """
+    OCR_RENDERER env var, else PyMuPDF everywhere except
+    Windows, which keeps the existing poppler setup.
+    """
+    env_backend = os.getenv("OCR_RENDERER")
+    if env_backend:
+        return env_backend
+    return "pdf2image" if sys.platform == "win32" else "pymupdf"
+
+
+def open_renderer(pdf_path: str, backend: Optional[str] = None) -> PageRenderer:
+    backend = backend or default_backend()
+
+    if backend not in RENDERERS:
+        raise ValueError(
+            f"Unknown renderer '{backend}'. Available: {', '.join(RENDERERS)}"
+        )
+
+    return RENDERERS[backend](pdf_path)
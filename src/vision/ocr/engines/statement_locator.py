@@ -0,0 +1,251 @@
+import re
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import fitz  # PyMuPDF
+
+from engines.document import PdfDocument
+
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Sections
+# -----------------------------
+# keys match structure_builder.classify_table where they overlap
+SECTION_PATTERNS: Dict[str, re.Pattern] = {
+    "balance_sheet": re.compile(
+        r"balance sheet|statement of financial position"
+    ),
+    "profit_loss": re.compile(
+        r"statement of profit (?:and|&) loss|profit (?:and|&) loss (?:account|statement)"
+        r"|income statement|statement of (?:comprehensive )?income"
+    ),
+    "cash_flow": re.compile(
+        r"cash flow statement|statement of cash flows?"
+    ),
+    "notes": re.compile(
+        r"notes (?:to|forming part of) (?:the )?(?:standalone |consolidated )?"
+        r"financial statements"
+    ),
+    "auditor_report": re.compile(
+        # apostrophe may be any glyph (or lost) in the text layer
+        r"auditors?\W?s?\W? ?report|report of the (?:independent )?auditors?"
+    ),
+}
+
+SECTIONS = tuple(SECTION_PATTERNS)
+
+HEADING_ZONE = 0.30    # top share of the page searched for headings
+MAX_GAP = 1            # untitled pages bridged inside one section
+CONTENTS_HITS = 3      # a page naming this many sections is a contents page
+
+# continuation pages: a statement runs on while pages stay tabular
+MIN_AMOUNTS = 8        # amount-like words on a tabular page
+AMOUNT_SHARE = 0.15    # ... and their share of the page's words
+
+AMOUNT = re.compile(r"^\(?[-+]?[\d.,]*\d[\d.,]*\)?%?$")
+
+PageRange = Tuple[int, int]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _match(text: str, sections: Iterable[str]) -> List[str]:
+    text = _normalize(text)
+    return [s for s in sections if SECTION_PATTERNS[s].search(text)]
+
+
+# -----------------------------
+# Sources
+# -----------------------------
+def _toc_ranges(
+    document: PdfDocument,
+    sections: Iterable[str]
+) -> Dict[str, List[PageRange]]:
+    """
+    Ranges from the PDF outline: an entry runs until the next entry
+    at the same or a higher level.
+    """
+    with document.lock:
+        toc = document.doc.get_toc(simple=True)
+
+    ranges: Dict[str, List[PageRange]] = {}
+
+    for i, (level, title, page) in enumerate(toc):
+        if page < 1:
+            continue
+
+        hits = _match(title, sections)
+        if not hits:
+            continue
+
+        end = document.page_count
+        for next_level, _, next_page in toc[i + 1:]:
+            if next_level <= level and next_page >= 1:
+                end = max(page, next_page - 1)
+                break
+
+        for section in hits:
+            ranges.setdefault(section, []).append((page, end))
+
+    return ranges
+
+
+def _heading_hits(
+    document: PdfDocument,
+    sections: Iterable[str],
+    pages: Iterable[int]
+) -> Dict[str, List[int]]:
+    """
+    Pages whose heading zone (top of the page, text layer only)
+    names a section. Contents pages are skipped.
+    """
+    sections = list(sections)
+    hits: Dict[str, List[int]] = {}
+
+    for page_no in pages:
+        if not document.has_text_layer(page_no):
+            continue
+
+        with document.lock:
+            page = document.doc[page_no - 1]
+            zone = fitz.Rect(page.rect)
+            zone.y1 = zone.y0 + zone.height * HEADING_ZONE
+            heading = page.get_text("text", clip=zone)
+
+        found = _match(heading, sections)
+        if len(found) >= CONTENTS_HITS:
+            continue
+
+        for section in found:
+            hits.setdefault(section, []).append(page_no)
+
+    return hits
+
+
+def _is_tabular(document: PdfDocument, page_no: int) -> bool:
+    """
+    Whether the text layer reads like a statement page: enough of its
+    words are amounts. Pages without a text layer are not judged.
+    """
+    if not document.has_text_layer(page_no):
+        return False
+
+    with document.lock:
+        words = [w[4] for w in document.doc[page_no - 1].get_text("words")]
+
+    amounts = sum(1 for w in words if AMOUNT.match(w))
+    return amounts >= MIN_AMOUNTS and amounts >= AMOUNT_SHARE * len(words)
+
+
+def _extend(
+    document: PdfDocument,
+    ranges: List[PageRange],
+    headings: Set[int],
+    last_page: int
+) -> List[PageRange]:
+    """
+    Carry each range over the continuation pages after it: headings
+    usually appear on a statement's first page only. A range stops
+    before the next page with any statement heading, or at the first
+    page that is not tabular.
+    """
+    extended: List[PageRange] = []
+    for start, end in ranges:
+        page_no = end + 1
+        while (page_no <= last_page and page_no not in headings
+               and _is_tabular(document, page_no)):
+            end = page_no
+            page_no += 1
+        extended.append((start, end))
+    return extended
+
+
+def _to_ranges(pages: List[int], max_gap: int = MAX_GAP) -> List[PageRange]:
+    ranges: List[PageRange] = []
+    for p in sorted(set(pages)):
+        if ranges and p - ranges[-1][1] <= max_gap + 1:
+            ranges[-1] = (ranges[-1][0], p)
+        else:
+            ranges.append((p, p))
+    return ranges
+
+
+def _merge(ranges: List[PageRange]) -> List[PageRange]:
+    merged: List[PageRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+# -----------------------------
+# Locator
+# -----------------------------
+def locate_statements(
+    document: PdfDocument,
+    sections: Optional[Iterable[str]] = None,
+    first_page: int = 1,
+    last_page: Optional[int] = None
+) -> Dict[str, List[PageRange]]:
+    """
+    Page ranges (1-based, inclusive) of the financial statements:
+
+        {"balance_sheet": [(112, 113)], "cash_flow": [(116, 117)], ...}
+
+    Uses the PDF outline when there is one and a keyword scan of
+    each page's heading zone in the text layer. A heading range runs
+    on through the tabular pages after it, up to the next statement
+    heading. Nothing is rendered or OCR'd, so scanned pages are only
+    found through the outline. Sections that cannot be located are
+    omitted.
+    """
+    sections = list(sections or SECTIONS)
+    last_page = last_page or document.page_count
+
+    found: Dict[str, List[PageRange]] = {}
+
+    for section, ranges in _toc_ranges(document, sections).items():
+        found.setdefault(section, []).extend(ranges)
+
+    # every section's headings bound a range, not only the requested ones
+    hits = _heading_hits(document, SECTIONS, range(first_page, last_page + 1))
+    headings = {p for pages in hits.values() for p in pages}
+    for section in sections:
+        if section in hits:
+            ranges = _extend(document, _to_ranges(hits[section]), headings, last_page)
+            found.setdefault(section, []).extend(ranges)
+
+    located = {}
+    for section in sections:
+        ranges = [
+            (max(s, first_page), min(e, last_page))
+            for s, e in found.get(section, [])
+            if e >= first_page and s <= last_page
+        ]
+        if ranges:
+            located[section] = _merge(ranges)
+
+    logger.info(f"Located statements: {located}")
+    return located
+
+
+def statement_pages(
+    located: Dict[str, List[PageRange]],
+    sections: Optional[Iterable[str]] = None
+) -> List[int]:
+    """
+    Sorted page selection covering `sections` (default: all located).
+    """
+    sections = sections or located.keys()
+    pages = set()
+    for section in sections:
+        for start, end in located.get(section, []):
+            pages.update(range(start, end + 1))
+    return sorted(pages)
@@ -3,38 +3,12 @@ import logging
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any
 
-import pytesseract
-from pdf2image import convert_from_path
-from PyPDF2 import PdfReader
-
 from engines.base import BaseOCREngine
-import os
-import shutil
-
-
-# -----------------------------
-# Tesseract binary path (Windows)
-# -----------------------------
-
-def resolve_tesseract_path() -> str:
-    """
-    Resolve Tesseract executable path in a portable way.
-    Priority:
-    1. Environment variable TESSERACT_PATH
-    2. System PATH lookup
-    """
-    env_path = os.getenv("TESSERACT_PATH")
-    if env_path and os.path.exists(env_path):
-        return env_path
-
-    system_path = shutil.which("tesseract")
-    if system_path:
-        return system_path
-
-    raise RuntimeError(
-        "Tesseract OCR not found. Please install Tesseract and add it to PATH "
-        "or set the TESSERACT_PATH environment variable."
-    )
+from engines.document import open_document
+from engines.native_text_engine import extract_page, page_markdown, page_text
+from engines.page_dedup import plan_pages, skip_report
+from engines.raster import get_page_cache, iter_pages
+from engines.tesseract_pool import TesseractPool, get_tesseract_pool
 
 
 # -----------------------------
@@ -48,28 +22,45 @@ logger = logging.getLogger(__name__)
 
 
 # -----------------------------
-# PDF validation
-# -----------------------------
-def is_valid_pdf(pdf_path: str) -> bool:
-    try:
-        PdfReader(pdf_path)
-        return True
-    except Exception:
-        return False
-
-
-# -----------------------------s
 # Tesseract OCR Engine
 # -----------------------------
 class TesseractEngine(BaseOCREngine):
 
     
 
-    def __init__(self, dpi: int = 300, **kwargs):
+    def __init__(
+        self,
+        dpi: int = 300,
+        render_workers: int = 1,
+        colorspace: str = "gray",
+        skip_duplicates: bool = True,
+        use_text_layer: bool = True,
+        pool: Optional[TesseractPool] = None,
+        min_confidence: Optional[float] = None,
+        **kwargs
+    ):
         super().__init__(**kwargs)
         self.dpi = dpi
+        self.render_workers = render_workers
+
+        # blank and repeated pages are detected up front and not OCR'd
+        self.skip_duplicates = skip_duplicates
+
+        # pages whose text layer is usable (PdfDocument triage) are
+        # read from it; only scanned and mixed pages are OCR'd
+        self.use_text_layer = use_text_layer
+
+        # Tesseract only uses luminance: "gray" (8-bit) or "binary"
+        # (adaptive threshold) avoid rendering 3-channel pages
+        self.colorspace = colorspace
+
+        # persistent recognizers, one worker per core (engines.tesseract_pool)
+        self.pool = pool or get_tesseract_pool()
+        self.pool.check()
 
-        pytesseract.pytesseract.tesseract_cmd = resolve_tesseract_path()
+        # words below this Tesseract confidence (0-100) are dropped
+        # from text and markdown; None keeps everything
+        self.min_confidence = min_confidence
 
     def process_pdf(
         self,
@@ -84,7 +75,9 @@ class TesseractEngine(BaseOCREngine):
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        if not is_valid_pdf(str(pdf_path)):
+        document = open_document(str(pdf_path))
+
+        if not document.valid:
             logger.error(f"Invalid or corrupted PDF: {pdf_path}")
             return {
                 "success": False,
@@ -95,40 +88,84 @@ class TesseractEngine(BaseOCREngine):
         try:
             start = time.time()
 
-            images = convert_from_path(
-                str(pdf_path),
-                dpi=self.dpi
-            )
+            total_pages = document.page_count
+            all_pages = list(range(1, total_pages + 1))
+
+            # page renders below reuse the handle's open document
+            get_page_cache().attach(document)
+
+            native = {}
+            ocr_pages = all_pages
+            if self.use_text_layer:
+                ocr_pages = [p for p in all_pages if document.needs_ocr(p)]
+                with document.lock:
+                    for p in all_pages:
+                        if not document.needs_ocr(p):
+                            native[p] = extract_page(document.doc[p - 1])
+
+            if self.skip_duplicates and ocr_pages:
+                plan = plan_pages(str(pdf_path), ocr_pages, document=document)
+            else:
+                plan = {"process": ocr_pages, "blank": [], "duplicate_of": {}, "time_sec": 0.0}
+
+            layouts = {}
+
+            if native:
+                logger.info(f"Text layer used for {len(native)} of {total_pages} pages")
 
-            texts = []
-            total_pages = len(images)
+            logger.info(f"Starting Tesseract OCR ({len(plan['process'])} of {total_pages} pages)")
 
-            logger.info(f"Starting Tesseract OCR ({total_pages} pages)")
+            ocr_start = time.time()
 
-            for i, img in enumerate(images, start=1):
-                msg = f"Tesseract OCR: processing page {i}/{total_pages}"
+            # pages are recognized while later ones are still rendering
+            rendered = iter_pages(
+                str(pdf_path),
+                dpi=self.dpi,
+                colorspace=self.colorspace,
+                pages=plan["process"],
+                workers=self.render_workers
+            )
+
+            # one recognition per page: words, boxes and confidences
+            for i, layout in self.pool.imap(rendered, lang="eng", psm=6):
+                msg = f"Tesseract OCR: processed page {i}/{total_pages}"
                 if progress_cb:
                     progress_cb(msg)
                 logger.info(msg)
 
-                texts.append(
-                    pytesseract.image_to_string(
-                        img,
-                        lang="eng",
-                        config="--oem 3 --psm 6"
-                    )
-                )
+                layouts[i] = layout.filter(self.min_confidence) if self.min_confidence is not None else layout
+
+            ocr_time = time.time() - ocr_start
+
+            for page, original in plan["duplicate_of"].items():
+                layouts[page] = layouts[original]
 
             elapsed = round(time.time() - start, 2)
+            texts, markdowns = [], []
+            for p in all_pages:
+                if p in native:
+                    texts.append(page_text(native[p]))
+                    markdowns.append(page_markdown(native[p]))
+                elif p in layouts:
+                    texts.append(layouts[p].text())
+                    markdowns.append(layouts[p].markdown())
+                else:
+                    texts.append("")
+
             full_text = "\n\n".join(texts)
+            markdown = "\n\n".join(markdowns)
 
             logger.info("Tesseract OCR completed successfully")
 
             return {
                 "success": True,
                 "text": full_text,
-                "markdown": full_text,
+                "markdown": markdown,
                 "pages": total_pages,
+                "confidence": {p: round(l.mean_conf(), 2) for p, l in layouts.items()},
+                "layout": {p: l.to_dict() for p, l in layouts.items()},
+                "text_layer_pages": sorted(native),
+                "skipped": skip_report(plan, ocr_time / max(1, len(plan["process"]))),
                 "time_sec": elapsed
             }
 
@@ -139,3 +176,6 @@ class TesseractEngine(BaseOCREngine):
                 "error": str(e),
                 "pdf": str(pdf_path)
             }
+
+        finally:
+            document.close()
@@ -0,0 +1,161 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+# TSV columns (tesseract ... tsv / image_to_data)
+_LEVEL, _PAGE, _BLOCK, _PAR, _LINE, _WORD, _LEFT, _TOP, _WIDTH, _HEIGHT, _CONF, _TEXT = range(12)
+_WORD_LEVEL = 5
+
+
+# -----------------------------
+# Tesseract page layout
+# -----------------------------
+class TesseractPage:
+    """
+    Words of one recognized image, with geometry and confidence, from
+    a single Tesseract call (TSV output).
+
+    Column-oriented: `boxes` (N x 4, x0 y0 x1 y1 in pixels), `conf`
+    (0-100), and `block` / `par` / `line` ids are numpy arrays
+    parallel to `words`, so filtering and grouping are array
+    operations. Lines and blocks are derived from the ids; text and
+    markdown are rebuilt from the words, optionally dropping those
+    below a confidence threshold.
+    """
+
+    def __init__(
+        self,
+        words: List[str],
+        boxes: np.ndarray,
+        conf: np.ndarray,
+        block: np.ndarray,
+        par: np.ndarray,
+        line: np.ndarray
+    ):
+        self.words = words
+        self.boxes = boxes
+        self.conf = conf
+        self.block = block
+        self.par = par
+        self.line = line
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __repr__(self):
+        return f"TesseractPage({len(self)} words, mean conf {self.mean_conf():.1f})"
+
+    # --------------------------------------------------
+    @classmethod
+    def from_tsv(cls, tsv: str) -> "TesseractPage":
+        """
+        Parse Tesseract TSV (with or without the header row). Only
+        word rows with text are kept.
+        """
+        words, nums = [], []
+
+        for row in tsv.splitlines():
+            cols = row.split("\t")
+            if len(cols) < 12 or not cols[_LEVEL].isdigit():
+                continue
+            if int(cols[_LEVEL]) != _WORD_LEVEL or not cols[_TEXT].strip():
+                continue
+
+            words.append(cols[_TEXT].strip())
+            nums.append([float(c) for c in cols[_BLOCK:_TEXT]])
+
+        arr = np.array(nums, dtype=np.float32).reshape(-1, 9)
+        ids = arr[:, :4].astype(np.int32)            # block, par, line, word
+        x, y, w, h = arr[:, 4:8].astype(np.int32).T
+
+        return cls(
+            words=words,
+            boxes=np.stack([x, y, x + w, y + h], axis=1),
+            conf=arr[:, 8],
+            block=ids[:, 0],
+            par=ids[:, 1],
+            line=ids[:, 2]
+        )
+
+    # --------------------------------------------------
+    def filter(self, min_conf: float) -> "TesseractPage":
+        """
+        Words with confidence >= min_conf.
+        """
+        keep = self.conf >= min_conf
+        return TesseractPage(
+            words=[w for w, k in zip(self.words, keep) if k],
+            boxes=self.boxes[keep],
+            conf=self.conf[keep],
+            block=self.block[keep],
+            par=self.par[keep],
+            line=self.line[keep]
+        )
+
+    def mean_conf(self) -> float:
+        return float(self.conf.mean()) if len(self) else 0.0
+
+    def _groups(self, keys: np.ndarray):
+        """
+        (start, end) spans of consecutive rows sharing `keys`.
+        Tesseract emits words in reading order, so groups are runs.
+        """
+        if not len(keys):
+            return []
+        cuts = np.flatnonzero(np.any(keys[1:] != keys[:-1], axis=1)) + 1
+        edges = [0, *cuts.tolist(), len(keys)]
+        return list(zip(edges[:-1], edges[1:]))
+
+    def _ids(self, level: str) -> np.ndarray:
+        cols = {"block": [self.block], "par": [self.block, self.par]}
+        return np.stack(cols.get(level, [self.block, self.par, self.line]), axis=1)
+
+    def regions(self, level: str = "line") -> Dict[str, np.ndarray]:
+        """
+        Lines, paragraphs ("par") or blocks: union boxes and mean
+        word confidence, one row per region.
+        """
+        spans = self._groups(self._ids(level))
+        boxes = np.array([
+            [*self.boxes[a:b, :2].min(axis=0), *self.boxes[a:b, 2:].max(axis=0)]
+            for a, b in spans
+        ], dtype=np.int32).reshape(-1, 4)
+        conf = np.array([self.conf[a:b].mean() for a, b in spans], dtype=np.float32)
+        return {"boxes": boxes, "conf": conf, "spans": np.array(spans, dtype=np.int32).reshape(-1, 2)}
+
+    # --------------------------------------------------
+    def text(self, min_conf: Optional[float] = None) -> str:
+        """
+        One line per OCR line, a blank line between paragraphs (the
+        layout of image_to_string).
+        """
+        page = self if min_conf is None else self.filter(min_conf)
+        paragraphs = []
+        for a, b in page._groups(page._ids("par")):
+            lines = [
+                " ".join(page.words[a + i:a + j])
+                for i, j in page._groups(page._ids("line")[a:b])
+            ]
+            paragraphs.append("\n".join(lines))
+        return "\n\n".join(paragraphs)
+
+    def markdown(self, min_conf: Optional[float] = None) -> str:
+        """
+        Paragraphs as markdown paragraphs. Tesseract finds no headings
+        or tables, so lines are kept as hard breaks for row-wise
+        statement parsing.
+        """
+        return "\n\n".join(
+            p.replace("\n", "  \n") for p in self.text(min_conf).split("\n\n")
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "words": self.words,
+            "boxes": self.boxes.tolist(),
+            "conf": np.round(self.conf, 2).tolist(),
+            "block": self.block.tolist(),
+            "par": self.par.tolist(),
+            "line": self.line.tolist(),
+        }
@@ -0,0 +1,260 @@
+import os
+import sys
+import atexit
+import importlib.util
+import shutil
+import logging
+import threading
+import multiprocessing as mp
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from engines.page_image import as_page_image
+from engines.tesseract_layout import TesseractPage
+
+
+logger = logging.getLogger(__name__)
+
+
+WINDOWS_TESSERACT = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+
+
+def default_workers() -> int:
+    """
+    OCR_TESSERACT_WORKERS env var, else one worker per core.
+    """
+    env_workers = os.getenv("OCR_TESSERACT_WORKERS")
+    if env_workers:
+        return max(1, int(env_workers))
+    return os.cpu_count() or 1
+
+
+# -----------------------------
+# Tesseract binary path
+# -----------------------------
+def resolve_tesseract_path() -> str:
+    """
+    Resolve Tesseract executable path in a portable way.
+    Priority:
+    1. Environment variable TESSERACT_PATH
+    2. System PATH lookup
+    3. Default install location on Windows
+    """
+    env_path = os.getenv("TESSERACT_PATH")
+    if env_path and os.path.exists(env_path):
+        return env_path
+
+    system_path = shutil.which("tesseract")
+    if system_path:
+        return system_path
+
+    if sys.platform == "win32" and os.path.exists(WINDOWS_TESSERACT):
+        return WINDOWS_TESSERACT
+
+    raise RuntimeError(
+        "Tesseract OCR not found. Please install Tesseract and add it to PATH "
+        "or set the TESSERACT_PATH environment variable."
+    )
+
+
+# -----------------------------
+# Worker process
+# -----------------------------
+_apis: Dict[Tuple[str, int], object] = {}
+_tesserocr = None
+
+
+def _init_worker():
+    global _tesserocr
+
+    # one thread per recognizer; parallelism comes from the workers.
+    # Must be set before libtesseract is loaded in this process.
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+    try:
+        import tesserocr
+        _tesserocr = tesserocr
+    except ImportError:
+        import pytesseract
+        pytesseract.pytesseract.tesseract_cmd = resolve_tesseract_path()
+
+
+def _api(lang: str, psm: int):
+    """
+    This worker's recognizer for (lang, psm), loaded once: the
+    traineddata stays in memory for every later page.
+    """
+    key = (lang, psm)
+    api = _apis.get(key)
+    if api is None:
+        kwargs = {"lang": lang, "psm": _tesserocr.PSM(psm), "oem": _tesserocr.OEM.DEFAULT}
+        if os.getenv("TESSDATA_PREFIX"):
+            kwargs["path"] = os.environ["TESSDATA_PREFIX"]
+        api = _apis[key] = _tesserocr.PyTessBaseAPI(**kwargs)
+    return api
+
+
+def _recognize(image: np.ndarray, lang: str, psm: int) -> TesseractPage:
+    """
+    Worker entry point: OCR one uint8 page or crop (HxW or HxWxC).
+    One recognition, read back as TSV: words with boxes and
+    confidences, from which text is rebuilt.
+    """
+    if _tesserocr is None:
+        # no libtesseract binding: the CLI, still one call per page.
+        # PIL has no (H, W, 1) mode → gray and binary pages go in 2-D
+        if image.ndim == 3 and image.shape[2] == 1:
+            image = image[:, :, 0]
+
+        import pytesseract
+        tsv = pytesseract.image_to_data(
+            image, lang=lang, config=f"--oem 3 --psm {psm}"
+        )
+        return TesseractPage.from_tsv(tsv)
+
+    image = np.ascontiguousarray(image)
+    height, width = image.shape[:2]
+    channels = 1 if image.ndim == 2 else image.shape[2]
+
+    api = _api(lang, psm)
+    api.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+    return TesseractPage.from_tsv(api.GetTSVText(0))
+
+
+_fallback_warned = False
+
+
+def has_tesserocr() -> bool:
+    """
+    Whether workers get the in-process binding (pip install
+    ai-frc[tesseract]); checked without importing libtesseract here.
+    """
+    global _fallback_warned
+    found = importlib.util.find_spec("tesserocr") is not None
+
+    if not found and not _fallback_warned:
+        _fallback_warned = True
+        logger.warning(
+            "tesserocr not installed: Tesseract workers fall back to pytesseract, "
+            "one tesseract process and temp file per page "
+            "(pip install 'ai-frc[tesseract]' for in-process recognizers)"
+        )
+    return found
+
+
+# -----------------------------
+# Recognizer pool
+# -----------------------------
+class TesseractPool:
+    """
+    Long-lived Tesseract recognizers, one per worker process.
+
+    With tesserocr installed each worker keeps a loaded
+    PyTessBaseAPI per (lang, psm) and receives pages as raw pixel
+    buffers: no process spawn, temp file or traineddata reload per
+    page. Without it, workers fall back to pytesseract (one CLI call
+    per page, but still spread across cores).
+
+    Workers run with OMP_THREAD_LIMIT=1 so N workers use N cores.
+    Size with env OCR_TESSERACT_WORKERS (default: one per core).
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or default_workers()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                has_tesserocr()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=mp.get_context("spawn"),
+                    initializer=_init_worker
+                )
+                logger.info(f"Started {self.workers} Tesseract workers")
+            return self._executor
+
+    def check(self):
+        """
+        Raise in the caller, not in a worker, when there is neither
+        tesserocr nor a tesseract binary.
+        """
+        if not has_tesserocr():
+            resolve_tesseract_path()
+
+    def submit(self, image, lang: str = "eng", psm: int = 3) -> Future:
+        """
+        Queue one image (PageImage, ndarray or PIL); the Future
+        resolves to its TesseractPage.
+        """
+        return self._pool().submit(_recognize, as_page_image(image).array, lang, psm)
+
+    def recognize(self, image, lang: str = "eng", psm: int = 3) -> TesseractPage:
+        return self.submit(image, lang, psm).result()
+
+    def image_to_string(self, image, lang: str = "eng", psm: int = 3) -> str:
+        return self.recognize(image, lang, psm).text()
+
+    def imap(
+        self,
+        items: Iterable[Tuple[Hashable, object]],
+        lang: str = "eng",
+        psm: int = 3,
+        window: Optional[int] = None
+    ) -> Iterator[Tuple[Hashable, TesseractPage]]:
+        """
+        OCR (key, image) pairs, yielding (key, TesseractPage) in
+        input order.
+
+        At most `window` images (default 2 per worker) are in flight,
+        so a lazily rendered page iterator is consumed while earlier
+        pages are still being recognized, with bounded memory.
+        """
+        window = window or 2 * self.workers
+        pending = deque()
+
+        for key, image in items:
+            pending.append((key, self.submit(image, lang, psm)))
+            if len(pending) >= window:
+                key, fut = pending.popleft()
+                yield key, fut.result()
+
+        while pending:
+            key, fut = pending.popleft()
+            yield key, fut.result()
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# -----------------------------
+# Shared pool
+# -----------------------------
+_default_pool: Optional[TesseractPool] = None
+_default_lock = threading.Lock()
+
+
+def get_tesseract_pool() -> TesseractPool:
+    """
+    Shared pool used by all Tesseract engines.
+    """
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = TesseractPool()
+        return _default_pool
+
+
+@atexit.register
+def shutdown_workers():
+    with _default_lock:
+        if _default_pool is not None:
+            _default_pool.shutdown()
@@ -1,8 +1,8 @@
 import time
 import torch
 from transformers import TrOCRProcessor, VisionEncoderDecoderModel
-from pdf2image import convert_from_path
 from engines.base import BaseOCREngine
+from engines.raster import get_page_cache, iter_pages
 
 class TrOCREngine(BaseOCREngine):
 
@@ -19,12 +19,12 @@ class TrOCREngine(BaseOCREngine):
 
     def process_pdf(self, pdf_path: str):
         start = time.time()
-        images = convert_from_path(pdf_path, dpi=300)
+        total_pages = get_page_cache().page_count(pdf_path)
 
         texts = []
-        for img in images:
+        for _, img in iter_pages(pdf_path, dpi=300, last_page=total_pages):
             pixel_values = self.processor(
-                images=img,
+                images=img.to_pil(),
                 return_tensors="pt"
             ).pixel_values.to(self.device)
 
@@ -41,6 +41,6 @@ class TrOCREngine(BaseOCREngine):
         return {
             "text": full_text,
             "markdown": full_text,
-            "pages": len(images),
+            "pages": total_pages,
             "time_sec": elapsed
         }
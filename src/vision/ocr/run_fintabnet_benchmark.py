@@ -2,7 +2,8 @@ import json
 import argparse
 from pathlib import Path
 
-from engines.docling_engine import OCREngine
+from engines.docling_cache import enable_docling_cache
+from engines.registry import load_engine
 
 
 from metrics.accuracy import accuracy_report
@@ -13,8 +14,7 @@ from metrics.accuracy_financial import financial_accuracy_report
 # Engine Registry
 # --------------------------------
 ENGINES = {
-    "docling": OCREngine,
-    
+    "docling": "engines.docling_engine.OCREngine",
 }
 
 
@@ -99,7 +99,10 @@ def run_fintabnet_benchmark(dataset_dir: Path, engine_name: str):
         print("❌ Unknown engine")
         return
 
-    engine = ENGINES[engine_name]()
+    # same PDFs every run: reuse conversions when only metrics changed
+    enable_docling_cache()
+
+    engine = load_engine(ENGINES[engine_name])()
     agg = FinTabNetAggregator()
 
     pdfs = list(dataset_dir.glob("*.pdf"))
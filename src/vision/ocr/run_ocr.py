@@ -3,9 +3,7 @@ import json
 import sys
 from pathlib import Path
 
-from engines.docling_engine import OCREngine
-from engines.tesseract_engine import TesseractEngine
-from engines.trocr_engine import TrOCREngine
+from engines.registry import load_engine
 
 from metrics.accuracy import accuracy_report
 from metrics.accuracy_financial import financial_accuracy_report
@@ -16,9 +14,10 @@ from metrics.compliance_rules import validate_compliance
 # Engine registry
 # -----------------------------
 ENGINES = {
-    "docling": OCREngine,
-    "tesseract": TesseractEngine,
-    "trocr": TrOCREngine,
+    "docling": "engines.docling_engine.OCREngine",
+    "native": "engines.native_text_engine.NativeTextEngine",
+    "tesseract": "engines.tesseract_engine.TesseractEngine",
+    "trocr": "engines.trocr_engine.TrOCREngine",
 }
 
 
@@ -117,6 +116,20 @@ def main():
 
     parser.add_argument("--output", help="Optional output path")
 
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=1,
+        help="Page rasterization processes (tesseract)",
+    )
+
+    parser.add_argument(
+        "--render-mode",
+        choices=["rgb", "gray", "binary"],
+        default="gray",
+        help="Page raster format (tesseract)",
+    )
+
     parser.add_argument("--start-page", type=int, default=None)
     parser.add_argument("--end-page", type=int, default=None)
 
@@ -128,9 +141,12 @@ def main():
     engine_kwargs = {}
     if args.engine in {"tesseract", "trocr"}:
         engine_kwargs["dpi"] = 150 if args.strategy == "fast" else 300
+    if args.engine == "tesseract":
+        engine_kwargs["render_workers"] = args.render_workers
+        engine_kwargs["colorspace"] = args.render_mode
 
     try:
-        engine = ENGINES[args.engine](**engine_kwargs)
+        engine = load_engine(ENGINES[args.engine])(**engine_kwargs)
 
         result = engine.process_pdf(
             args.pdf,
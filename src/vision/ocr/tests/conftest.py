@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+# stands in for the tesseract CLI: answers --version and writes one word
+STUB_TESSERACT = """#!/bin/sh
+if [ "$1" = "--version" ]; then
+    echo "tesseract 5.3.0"
+    exit 0
+fi
+printf 'level\\tpage_num\\tblock_num\\tpar_num\\tline_num\\tword_num\\tleft\\ttop\\twidth\\theight\\tconf\\ttext\\n' > "$2.tsv"
+printf '5\\t1\\t1\\t1\\t1\\t1\\t10\\t12\\t40\\t16\\t96.5\\tRevenue\\n' >> "$2.tsv"
+"""
+
+
+@pytest.fixture
+def tesseract_stub(tmp_path):
+    if sys.platform == "win32":
+        pytest.skip("shell stub for the tesseract CLI")
+
+    stub = tmp_path / "tesseract"
+    stub.write_text(STUB_TESSERACT)
+    stub.chmod(0o755)
+    return stub
@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines.render import binarize_adaptive  # noqa: E402
+
+
+def _reference(gray, window, t):
+    # per-pixel Bradley-Roth over the clipped window, in float64
+    h, w = gray.shape
+    r = window // 2
+    out = np.empty_like(gray)
+    for y in range(h):
+        for x in range(w):
+            block = gray[max(0, y - r):y + r + 1, max(0, x - r):x + r + 1].astype(np.float64)
+            ink = int(gray[y, x]) * block.size < block.sum() * (1.0 - t)
+            out[y, x] = 0 if ink else 255
+    return out
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (5, 40), (33, 21)])
+@pytest.mark.parametrize("window", [3, 15, 101])
+def test_matches_per_pixel_threshold(shape, window):
+    gray = np.random.default_rng(window).integers(0, 256, shape, dtype=np.uint8)
+
+    result = binarize_adaptive(gray, window=window, t=0.15)
+
+    assert result.dtype == np.uint8
+    assert np.array_equal(result, _reference(gray, window, 0.15))
+
+
+def test_text_on_paper():
+    gray = np.full((400, 300), 235, dtype=np.uint8)
+    gray[100:104, 50:250] = 30
+
+    result = binarize_adaptive(gray)
+
+    assert (result[100:104, 50:250] == 0).all()
+    assert np.count_nonzero(result == 0) == 4 * 200
@@ -0,0 +1,67 @@
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines.converter_pool import ConverterOptions, ConverterPool  # noqa: E402
+
+
+def _pool(per_config, built):
+    pool = ConverterPool(per_config=per_config)
+    pool._build = lambda options: built.append(options) or object()
+    return pool
+
+
+def test_concurrent_requests_get_their_own_converter():
+    built = []
+    pool = _pool(2, built)
+    options = ConverterOptions()
+
+    with pool.checkout(options) as first, pool.checkout(options) as second:
+        assert first is not second
+    assert len(built) == 2
+
+
+def test_serial_requests_reuse_one_converter():
+    built = []
+    pool = _pool(4, built)
+    options = ConverterOptions()
+
+    for _ in range(3):
+        with pool.checkout(options):
+            pass
+    assert len(built) == 1
+
+
+def test_requests_beyond_the_cap_wait():
+    built = []
+    pool = _pool(1, built)
+    options = ConverterOptions()
+    waiting = threading.Event()
+    got = []
+
+    def second():
+        waiting.set()
+        with pool.checkout(options) as converter:
+            got.append(converter)
+
+    with pool.checkout(options) as first:
+        thread = threading.Thread(target=second)
+        thread.start()
+        waiting.wait()
+        thread.join(0.2)
+        assert thread.is_alive()
+
+    thread.join()
+    assert got == [first]
+    assert len(built) == 1
+
+
+def test_configurations_do_not_share_converters():
+    built = []
+    pool = _pool(1, built)
+
+    with pool.checkout(ConverterOptions()) as a, \
+            pool.checkout(ConverterOptions(table_mode="fast")) as b:
+        assert a is not b
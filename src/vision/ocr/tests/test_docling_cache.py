@@ -0,0 +1,107 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines.converter_pool import ConverterOptions  # noqa: E402
+from engines.docling_cache import DoclingResultCache  # noqa: E402
+
+
+def _pdf(path, text):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    doc.new_page()
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def pdfs(tmp_path):
+    return {
+        "a": _pdf(tmp_path / "a.pdf", "Balance Sheet"),
+        "b": _pdf(tmp_path / "b.pdf", "Cash Flow Statement"),
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DoclingResultCache(str(tmp_path / "cache"))
+
+
+def test_key_follows_content_pages_and_options(tmp_path, pdfs, cache):
+    options = ConverterOptions()
+    key = cache.key(pdfs["a"], [1, 2], options)
+
+    # same bytes under another name → same key
+    copy = shutil.copy(pdfs["a"], tmp_path / "renamed.pdf")
+    assert cache.key(str(copy), [1, 2], options) == key
+
+    assert cache.key(pdfs["b"], [1, 2], options) != key
+    assert cache.key(pdfs["a"], [1], options) != key
+    assert cache.key(pdfs["a"], [1, 2], ConverterOptions(do_ocr=True)) != key
+    assert cache.key(pdfs["a"], [1, 2], ConverterOptions(table_mode="fast")) != key
+
+
+def test_round_trip(pdfs, cache):
+    options = ConverterOptions()
+    data = {"name": "a", "texts": [{"text": "Balance Sheet"}]}
+
+    assert cache.get_dict(pdfs["a"], [1, 2], options) is None
+    cache.put_dict(pdfs["a"], [1, 2], options, data)
+
+    assert cache.get_dict(pdfs["a"], [1, 2], options) == data
+    assert cache.get_dict(pdfs["a"], [1], options) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_trim_evicts_least_recently_used(tmp_path, pdfs):
+    options = ConverterOptions()
+    payload = {"texts": [os.urandom(512).hex()]}
+
+    probe = DoclingResultCache(str(tmp_path / "probe"))
+    probe.put_dict(pdfs["a"], [1], options, payload)
+    size = probe._bytes
+
+    cache = DoclingResultCache(str(tmp_path / "cache"), max_bytes=2 * size + size // 2)
+    cache.put_dict(pdfs["a"], [1], options, payload)
+    cache.put_dict(pdfs["a"], [2], options, payload)
+    assert cache.get_dict(pdfs["a"], [1], options) is not None   # [2] is now LRU
+
+    cache.put_dict(pdfs["b"], [1], options, payload)
+
+    assert cache.get_dict(pdfs["a"], [2], options) is None
+    assert cache.get_dict(pdfs["a"], [1], options) is not None
+    assert cache.get_dict(pdfs["b"], [1], options) is not None
+    assert len(list(cache.cache_dir.glob("*.json.gz"))) == 2
+
+    # a new process rebuilds the same index from the files
+    reopened = DoclingResultCache(str(cache.cache_dir), max_bytes=cache.max_bytes)
+    assert reopened._bytes == cache._bytes
+    assert set(reopened._files) == set(cache._files)
+
+
+def test_unreadable_file_is_dropped(pdfs, cache):
+    options = ConverterOptions()
+    cache.put_dict(pdfs["a"], [1], options, {"name": "a"})
+
+    path = cache._path(cache.key(pdfs["a"], [1], options))
+    path.write_bytes(b"not gzip")
+
+    assert cache.get_dict(pdfs["a"], [1], options) is None
+    assert not path.exists()
+    assert cache._bytes == 0
+
+
+def test_disabled_without_directory(pdfs, monkeypatch):
+    monkeypatch.delenv("OCR_DOCLING_CACHE_DIR", raising=False)
+    cache = DoclingResultCache()
+
+    assert not cache.enabled
+    cache.put_dict(pdfs["a"], [1], ConverterOptions(), {"name": "a"})
+    assert cache.get_dict(pdfs["a"], [1], ConverterOptions()) is None
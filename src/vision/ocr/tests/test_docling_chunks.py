@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines.docling_chunks import merge_documents, plan_chunks, renumber_pages  # noqa: E402
+
+doc_types = pytest.importorskip("docling_core.types.doc")
+
+
+def _prov(page_no):
+    return doc_types.ProvenanceItem(
+        page_no=page_no,
+        bbox=doc_types.BoundingBox(l=10, t=10, r=100, b=30),
+        charspan=(0, 1)
+    )
+
+
+def _chunk(name, pages, figure):
+    """
+    A chunk converted from a page subset: pages numbered 1..len(pages),
+    a heading and a captioned one-cell table on each page.
+    """
+    doc = doc_types.DoclingDocument(name=name)
+    for page_no in range(1, len(pages) + 1):
+        doc.add_page(page_no=page_no, size=doc_types.Size(width=600, height=800))
+        doc.add_text(label=doc_types.DocItemLabel.SECTION_HEADER,
+                     text=f"{name} page {page_no}", prov=_prov(page_no))
+        caption = doc.add_text(label=doc_types.DocItemLabel.CAPTION,
+                               text=f"{name} table {page_no}", prov=_prov(page_no))
+        cell = doc_types.TableCell(
+            text=str(figure + page_no),
+            start_row_offset_idx=0, end_row_offset_idx=1,
+            start_col_offset_idx=0, end_col_offset_idx=1
+        )
+        data = doc_types.TableData(num_rows=1, num_cols=1, table_cells=[cell])
+        doc.add_table(data=data, caption=caption, prov=_prov(page_no))
+    return renumber_pages(doc, pages)
+
+
+def test_plan_chunks_keeps_order_and_options():
+    jobs = [("ocr", [1, 2, 3, 4, 5]), ("text", [8, 9])]
+
+    assert plan_chunks(jobs, chunk_pages=2) == [
+        ("ocr", [1, 2]), ("ocr", [3, 4]), ("ocr", [5]), ("text", [8, 9])
+    ]
+
+
+def test_renumber_pages_maps_subset_back_to_source_pages():
+    doc = _chunk("a", [7, 9], 100)
+
+    assert sorted(doc.pages) == [7, 9]
+    assert [p.page_no for p in doc.pages.values()] == [7, 9]
+    assert [t.prov[0].page_no for t in doc.texts] == [7, 7, 9, 9]
+    assert [t.prov[0].page_no for t in doc.tables] == [7, 9]
+
+
+def test_renumber_pages_leaves_full_documents_alone():
+    doc = _chunk("a", [1, 2], 100)
+
+    assert sorted(doc.pages) == [1, 2]
+
+
+def test_merge_documents_shifts_item_references():
+    first, second = _chunk("a", [1, 2], 100), _chunk("b", [3], 200)
+
+    merged = merge_documents([first, second])
+
+    assert sorted(merged.pages) == [1, 2, 3]
+    assert len(merged.texts) == 6
+    assert [t.self_ref for t in merged.tables] == ["#/tables/0", "#/tables/1", "#/tables/2"]
+
+    # each table keeps its own caption and page, across the chunk seam
+    for table in merged.tables:
+        caption = table.captions[0].resolve(merged)
+        assert caption.prov[0].page_no == table.prov[0].page_no
+    assert merged.tables[2].captions[0].resolve(merged).text == "b table 1"
+    assert merged.tables[2].data.table_cells[0].text == "201"
+
+    # body follows page order and every child resolves to its item
+    children = [ref.resolve(merged) for ref in merged.body.children]
+    assert [c.self_ref for c in children] == [ref.cref for ref in merged.body.children]
+    pages = [c.prov[0].page_no for c in children]
+    assert pages == sorted(pages)
+
+
+def test_merge_documents_single_and_empty():
+    doc = _chunk("a", [1], 100)
+
+    assert merge_documents([doc]) is doc
+    assert merge_documents([]) is None
@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from check_import_time import DEFAULT_BUDGET_MS, HEAVY_MODULES, MODULES, measure  # noqa: E402
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_cli_import_time(module):
+    # missing light dependencies are stubbed by the probe, so this
+    # never skips; only the frameworks below may be absent
+    report = measure(module)
+
+    assert "error" not in report, f"{module} failed to import: {report['error']}"
+    assert not report["heavy"], (
+        f"{module} imports {report['heavy']} at import time "
+        f"(none of {HEAVY_MODULES} may load before an engine is chosen)"
+    )
+    assert report["ms"] <= DEFAULT_BUDGET_MS, (
+        f"{module} took {report['ms']} ms to import (budget {DEFAULT_BUDGET_MS:.0f} ms)"
+    )
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines import native_text_engine  # noqa: E402
+from engines.native_text_engine import NativeTextEngine, extract_page, page_markdown, page_text  # noqa: E402
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    # page 1: heading block and a two-line table block; page 2: no text
+    path = tmp_path / "statement.pdf"
+    doc = fitz.open()
+    page = doc.new_page(width=612, height=792)
+    page.insert_text((72, 72), "Balance Sheet", fontsize=14)
+    page.insert_text((72, 300), "Total assets 1,234\nTotal equity 567", fontsize=10)
+    doc.new_page(width=612, height=792)
+    page = doc.new_page(width=612, height=792)
+    page.insert_text((72, 72), "Notes", fontsize=14)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_extract_page_groups_words_into_lines_and_blocks(pdf):
+    with fitz.open(pdf) as doc:
+        page = extract_page(doc[0])
+
+    assert (page["page"], page["width"], page["height"]) == (1, 612, 792)
+
+    lines = [[line["text"] for line in block["lines"]] for block in page["blocks"]]
+    assert lines == [["Balance Sheet"], ["Total assets 1,234", "Total equity 567"]]
+
+    table = page["blocks"][1]
+    words = [w["text"] for line in table["lines"] for w in line["words"]]
+    assert words == ["Total", "assets", "1,234", "Total", "equity", "567"]
+
+    # line and block boxes enclose their words, top-left origin
+    first_line = table["lines"][0]
+    x0, y0, x1, y1 = first_line["bbox"]
+    assert all(
+        x0 <= w["bbox"][0] and y0 <= w["bbox"][1] and w["bbox"][2] <= x1 and w["bbox"][3] <= y1
+        for w in first_line["words"]
+    )
+    assert table["bbox"][1] == first_line["bbox"][1] > 250
+    assert table["bbox"][3] == table["lines"][1]["bbox"][3]
+
+    assert page_text(page) == "Balance Sheet\nTotal assets 1,234\nTotal equity 567"
+    assert page_markdown(page) == "Balance Sheet\n\nTotal assets 1,234\nTotal equity 567"
+
+
+def test_process_pdf_reports_pages_without_text(pdf):
+    result = NativeTextEngine(workers=1).process_pdf(str(pdf))
+
+    assert result["success"]
+    assert result["pages"] == 3
+    assert result["pages_without_text"] == [2]
+    assert [p["page"] for p in result["layout"]] == [1, 2, 3]
+    assert result["text"].endswith("\n\n\n\nNotes")
+
+
+def test_page_range(pdf):
+    result = NativeTextEngine(workers=1).process_pdf(str(pdf), start_page=2, end_page=3)
+
+    assert [p["page"] for p in result["layout"]] == [2, 3]
+    assert not NativeTextEngine().process_pdf(str(pdf), start_page=3, end_page=4)["success"]
+
+
+def test_worker_processes_keep_page_order(pdf, monkeypatch):
+    serial = NativeTextEngine(workers=1).process_pdf(str(pdf))
+
+    monkeypatch.setattr(native_text_engine, "PARALLEL_MIN_PAGES", 1)
+    parallel = NativeTextEngine(workers=2).process_pdf(str(pdf))
+
+    assert parallel["layout"] == serial["layout"]
+    assert parallel["text"] == serial["text"]
@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines import raster  # noqa: E402
+from engines.document import PdfDocument  # noqa: E402
+from engines.page_dedup import plan_pages  # noqa: E402
+from engines.raster import PageRasterCache  # noqa: E402
+
+
+def _statement(page, figure):
+    page.insert_text((72, 60), "Balance Sheet", fontsize=14)
+    for row in range(20):
+        page.insert_text((72, 100 + 18 * row), f"Line item {row}")
+        page.insert_text((400, 100 + 18 * row), f"{figure + row:,}")
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    # 1 and 2 identical, 3 same layout with other figures, 4 empty,
+    # 5 "left blank" notice
+    path = tmp_path / "report.pdf"
+    doc = fitz.open()
+    _statement(doc.new_page(), 1200)
+    _statement(doc.new_page(), 1200)
+    _statement(doc.new_page(), 9800)
+    doc.new_page()
+    doc.new_page().insert_text((200, 400), "This page is intentionally left blank")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def cache():
+    return PageRasterCache(max_bytes=64 * 1024 * 1024, disk_dir=None)
+
+
+def test_duplicates_and_blank_pages(pdf, cache):
+    with PdfDocument(str(pdf)) as document:
+        plan = plan_pages(str(pdf), [1, 2, 3, 4, 5], document=document, cache=cache)
+
+    assert plan["process"] == [1, 3]
+    assert plan["duplicate_of"] == {2: 1}
+    assert plan["blank"] == [4, 5]
+
+
+def test_same_layout_without_text_layer_is_not_a_duplicate(pdf, cache):
+    # thumbnails only: figures differ in pixels, so the hash does not decide
+    plan = plan_pages(str(pdf), [1, 2, 3], cache=cache)
+
+    assert plan["duplicate_of"] == {2: 1}
+    assert plan["process"] == [1, 3]
+
+
+def test_thumbnails_render_from_the_open_document(pdf, cache, monkeypatch):
+    def reopen(*args, **kwargs):
+        raise AssertionError("PDF parsed again")
+
+    monkeypatch.setattr(raster, "open_renderer", reopen)
+
+    with PdfDocument(str(pdf)) as document:
+        plan = plan_pages(str(pdf), [1, 2], document=document, cache=cache)
+
+    assert plan["duplicate_of"] == {2: 1}
@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+
+import fitz
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines.raster import PageRasterCache  # noqa: E402
+
+DPI = 36   # 612 x 792 pt → 306 x 396 px
+PAGE_BYTES = 306 * 396
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "four.pdf"
+    doc = fitz.open()
+    for i in range(4):
+        doc.new_page(width=612, height=792).insert_text((72, 72), f"Page {i + 1}")
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+def _cached(cache):
+    return [key[1] for key in cache._mem]
+
+
+def test_memory_tier_evicts_least_recently_used(pdf):
+    cache = PageRasterCache(max_bytes=3 * PAGE_BYTES, disk_dir=None)
+
+    for i in range(3):
+        assert cache.get(pdf, i, dpi=DPI, colorspace="gray").data.nbytes == PAGE_BYTES
+    cache.get(pdf, 0, dpi=DPI, colorspace="gray")   # page 0 is now most recent
+    cache.get(pdf, 3, dpi=DPI, colorspace="gray")
+
+    assert _cached(cache) == [2, 0, 3]
+    assert cache._mem_bytes == 3 * PAGE_BYTES
+    assert (cache.hits, cache.misses) == (1, 4)
+    assert cache.lookup(pdf, 1, dpi=DPI, colorspace="gray") is None
+
+
+def test_keys_separate_dpi_and_colorspace(pdf):
+    cache = PageRasterCache(max_bytes=64 * PAGE_BYTES, disk_dir=None)
+
+    gray = cache.get(pdf, 0, dpi=DPI, colorspace="gray")
+    assert cache.get(pdf, 0, dpi=DPI, colorspace="gray") is gray
+    assert cache.get(pdf, 0, dpi=DPI, colorspace="rgb").data.shape == (396, 306, 3)
+    assert cache.get(pdf, 0, dpi=2 * DPI, colorspace="gray").data.shape == (792, 612, 1)
+    assert cache.misses == 3
+
+
+def test_evicted_pages_spill_to_disk(pdf, tmp_path):
+    cache = PageRasterCache(max_bytes=PAGE_BYTES, disk_dir=str(tmp_path / "spill"))
+
+    first = cache.get(pdf, 0, dpi=DPI, colorspace="gray")
+    cache.get(pdf, 1, dpi=DPI, colorspace="gray")
+    assert _cached(cache) == [1]
+
+    again = cache.get(pdf, 0, dpi=DPI, colorspace="gray")
+
+    assert cache.disk_hits == 1
+    assert np.array_equal(again.data, first.data)
+
+
+def test_disk_tier_is_bounded(pdf, tmp_path):
+    spill = tmp_path / "spill"
+    cache = PageRasterCache(max_bytes=PAGE_BYTES, disk_dir=str(spill), disk_max_bytes=int(2.5 * PAGE_BYTES))
+
+    for i in range(4):
+        cache.get(pdf, i, dpi=DPI, colorspace="gray")
+
+    # pages 0-2 were spilled, 0 was dropped again: oldest first
+    names = sorted(p.name.split("_")[1] for p in spill.glob("*.npy"))
+    assert names == ["1", "2"]
+    assert cache._disk_bytes == sum(p.stat().st_size for p in spill.glob("*.npy"))
@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines.document import PdfDocument  # noqa: E402
+from engines.statement_locator import locate_statements, statement_pages  # noqa: E402
+
+
+def _table(page, top):
+    for row in range(12):
+        y = top + 18 * row
+        page.insert_text((72, y), f"Line item {row}")
+        page.insert_text((320, y), f"{1200 + row:,}")
+        page.insert_text((420, y), f"({800 + row:,})")
+
+
+def _narrative(page, top):
+    for row in range(12):
+        page.insert_text((72, top + 18 * row), "The directors present their report on the year.")
+
+
+# page 1: contents   2: narrative   3-5: balance sheet (heading on 3 only)
+# 6: profit and loss   7: narrative
+PAGES = [
+    ("Contents: Balance Sheet, Statement of Profit and Loss, Cash Flow Statement", _narrative),
+    ("Directors' review", _narrative),
+    ("Balance Sheet as at 31 March 2024", _table),
+    ("", _table),
+    ("", _table),
+    ("Statement of Profit and Loss", _table),
+    ("Corporate governance", _narrative),
+]
+
+
+@pytest.fixture
+def document(tmp_path):
+    path = tmp_path / "annual_report.pdf"
+    pdf = fitz.open()
+    for heading, body in PAGES:
+        page = pdf.new_page()
+        if heading:
+            page.insert_text((72, 60), heading, fontsize=14)
+        body(page, 300)
+    pdf.save(path)
+    pdf.close()
+
+    doc = PdfDocument(str(path))
+    yield doc
+    doc.close()
+
+
+def test_statement_runs_through_continuation_pages(document):
+    located = locate_statements(document, ["balance_sheet"])
+
+    # stops before the next statement heading, not after page 3
+    assert located == {"balance_sheet": [(3, 5)]}
+
+
+def test_statement_stops_at_first_non_tabular_page(document):
+    located = locate_statements(document)
+
+    assert located["profit_loss"] == [(6, 6)]
+    assert "cash_flow" not in located
+
+
+def test_statement_pages_selects_located_sections(document):
+    located = locate_statements(document)
+
+    assert statement_pages(located) == [3, 4, 5, 6]
+    assert statement_pages(located, ["profit_loss"]) == [6]
@@ -0,0 +1,63 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines import raster  # noqa: E402
+from engines.tesseract_engine import TesseractEngine  # noqa: E402
+from engines.tesseract_pool import TesseractPool  # noqa: E402
+
+pytest.importorskip("pytesseract")
+
+if importlib.util.find_spec("tesserocr") is not None:
+    pytest.skip("workers would use tesserocr, not the stub CLI", allow_module_level=True)
+
+
+@pytest.fixture
+def pool(tesseract_stub, monkeypatch):
+    monkeypatch.setenv("TESSERACT_PATH", str(tesseract_stub))
+    pool = TesseractPool(workers=1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    # page 1 born-digital, page 2 a scanned image without text layer
+    path = tmp_path / "mixed.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Statement of cash flows for the year")
+
+    scan = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 200, 100), False)
+    scan.clear_with(90)
+    doc.new_page().insert_image(fitz.Rect(50, 50, 550, 400), pixmap=scan)
+
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_only_scanned_pages_are_ocrd(pool, pdf, monkeypatch):
+    def reopen(*args, **kwargs):
+        raise AssertionError("PDF parsed again")
+
+    # renders go through the engine's own open document
+    monkeypatch.setattr(raster, "open_renderer", reopen)
+
+    result = TesseractEngine(pool=pool).process_pdf(str(pdf))
+
+    assert result["success"], result.get("error")
+    assert result["text_layer_pages"] == [1]
+    assert list(result["layout"]) == [2]
+    assert result["text"] == "Statement of cash flows for the year\n\nRevenue"
+
+
+def test_text_layer_can_be_ignored(pool, pdf):
+    result = TesseractEngine(pool=pool, use_text_layer=False).process_pdf(str(pdf))
+
+    assert result["text_layer_pages"] == []
+    assert sorted(result["layout"]) == [1, 2]
@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines.tesseract_layout import TesseractPage  # noqa: E402
+
+
+HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext"
+
+
+def _row(level, block, par, line, word, box, conf, text):
+    left, top, width, height = box
+    return "\t".join(map(str, [level, 1, block, par, line, word, left, top, width, height, conf, text]))
+
+
+# two paragraphs: "Revenue 1,234" / "Costs (56)" in one, "Notes" in the next
+TSV = "\n".join([
+    HEADER,
+    _row(1, 0, 0, 0, 0, (0, 0, 600, 800), -1, ""),
+    _row(4, 1, 1, 1, 0, (10, 10, 200, 20), -1, ""),
+    _row(5, 1, 1, 1, 1, (10, 10, 80, 20), 96.0, "Revenue"),
+    _row(5, 1, 1, 1, 2, (100, 10, 60, 20), 91.5, "1,234"),
+    _row(5, 1, 1, 2, 1, (10, 40, 60, 20), 88.0, "Costs"),
+    _row(5, 1, 1, 2, 2, (100, 40, 40, 20), 35.0, "(56)"),
+    _row(5, 1, 1, 2, 3, (150, 40, 10, 20), 95.0, " "),
+    _row(5, 1, 2, 1, 1, (10, 90, 70, 20), 90.0, "Notes"),
+])
+
+
+def test_from_tsv_keeps_word_rows_with_text():
+    page = TesseractPage.from_tsv(TSV)
+
+    assert page.words == ["Revenue", "1,234", "Costs", "(56)", "Notes"]
+    assert page.boxes[0].tolist() == [10, 10, 90, 30]
+    assert page.conf.tolist() == [96.0, 91.5, 88.0, 35.0, 90.0]
+    assert page.par.tolist() == [1, 1, 1, 1, 2]
+    assert page.line.tolist() == [1, 1, 2, 2, 1]
+
+
+def test_from_tsv_without_header_or_words():
+    assert TesseractPage.from_tsv(TSV.split("\n", 1)[1]).words == TesseractPage.from_tsv(TSV).words
+
+    empty = TesseractPage.from_tsv(HEADER)
+    assert len(empty) == 0
+    assert empty.boxes.shape == (0, 4)
+    assert empty.text() == ""
+    assert empty.mean_conf() == 0.0
+
+
+def test_text_rebuilds_lines_and_paragraphs():
+    page = TesseractPage.from_tsv(TSV)
+
+    assert page.text() == "Revenue 1,234\nCosts (56)\n\nNotes"
+    assert page.markdown() == "Revenue 1,234  \nCosts (56)\n\nNotes"
+
+
+def test_confidence_filter():
+    page = TesseractPage.from_tsv(TSV)
+
+    assert page.text(min_conf=50) == "Revenue 1,234\nCosts\n\nNotes"
+    assert page.filter(50).words == ["Revenue", "1,234", "Costs", "Notes"]
+
+
+def test_regions_union_boxes():
+    page = TesseractPage.from_tsv(TSV)
+
+    lines = page.regions("line")
+    assert lines["boxes"].tolist() == [[10, 10, 160, 30], [10, 40, 140, 60], [10, 90, 80, 110]]
+    assert lines["spans"].tolist() == [[0, 2], [2, 4], [4, 5]]
+
+    pars = page.regions("par")
+    assert pars["boxes"].tolist() == [[10, 10, 160, 60], [10, 90, 80, 110]]
+    assert pars["conf"][1] == 90.0
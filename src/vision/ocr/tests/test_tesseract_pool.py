@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engines import tesseract_pool  # noqa: E402
+from engines.render import PyMuPDFRenderer  # noqa: E402
+
+pytesseract = pytest.importorskip("pytesseract")
+
+
+@pytest.fixture
+def cli_fallback(tesseract_stub, monkeypatch):
+    monkeypatch.setattr(tesseract_pool, "_tesserocr", None)
+    monkeypatch.setattr(pytesseract.pytesseract, "tesseract_cmd", str(tesseract_stub))
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "page.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Revenue 1,234")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.mark.parametrize("colorspace", ["gray", "binary", "rgb"])
+def test_fallback_accepts_every_colorspace(cli_fallback, pdf, colorspace):
+    with PyMuPDFRenderer(str(pdf)) as renderer:
+        image = renderer.render(0, dpi=72, colorspace=colorspace)
+
+    page = tesseract_pool._recognize(image, "eng", 3)
+
+    assert page.words == ["Revenue"]
+    assert page.boxes.tolist() == [[10, 12, 50, 28]]
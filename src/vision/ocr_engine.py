@@ -1,5 +1,6 @@
 import logging
 import json
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Optional, Dict, Any
 from typing import Callable
@@ -7,24 +8,20 @@ from docling.document_converter import DocumentConverter
 from docling.datamodel.base_models import InputFormat
 from docling.document_converter import PdfFormatOption
 from docling.datamodel.pipeline_options import PdfPipelineOptions, LayoutModelConfig
-from PyPDF2 import PdfReader
-import time
-import threading
 
-
-
-    
-def is_valid_pdf(pdf_path: str) -> bool:
-            try:
-                PdfReader(pdf_path)
-                return True
-            except Exception:
-                return False      
+from src.vision.ocr.engines.document import PdfDocument, open_document
+from src.vision.ocr.engines.progress import ProgressCallback, ProgressTracker
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# tracker of the conversion running in this thread (or task), so
+# concurrent process_pdf calls on one engine report separately
+_active_tracker: ContextVar[Optional[ProgressTracker]] = ContextVar(
+    "ocr_progress_tracker", default=None
+)
+
 class OCREngine:
     """
     Wrapper for Docling to provide high-fidelity OCR and document structure extraction.
@@ -75,6 +72,36 @@ class OCREngine:
         )
         logger.info("OCREngine initialized.")
 
+        # per-page progress, reported to the caller's tracker
+        self._install_page_hook()
+
+    def _install_page_hook(self) -> bool:
+        """
+        Report each page as Docling's PDF pipeline finishes it, by
+        wrapping the pipeline's per-page stage. False when this Docling
+        version has no such stage. Pipelines that bypass it (threaded
+        ones) fire no page events; process_pdf then reports the
+        remaining pages once the document is done.
+        """
+        try:
+            pipeline = self.converter._get_pipeline(InputFormat.PDF)
+        except Exception:
+            return False
+
+        apply_on_pages = getattr(pipeline, "_apply_on_pages", None)
+        if apply_on_pages is None:
+            return False
+
+        def counted(conv_res, page_batch):
+            for page in apply_on_pages(conv_res, page_batch):
+                tracker = _active_tracker.get()
+                if tracker:
+                    tracker.page_done(page.page_no + 1)
+                yield page
+
+        pipeline._apply_on_pages = counted
+        return True
+
     
 
     
@@ -84,7 +111,8 @@ class OCREngine:
                 self,
                 pdf_path: str,
                 output_dir: Optional[str] = None,
-                progress_cb: Optional[Callable[[str], None]] = None
+                progress_cb: Optional[ProgressCallback] = None,
+                document: Optional[PdfDocument] = None
                     ) -> Dict[str, Any]:
         """
         Convert a PDF to structured Markdown and JSON.
@@ -92,6 +120,7 @@ class OCREngine:
         Args:
             pdf_path: Path to the input PDF file.
             output_dir: Directory to save the outputs.
+            document: Already-opened handle for pdf_path, if the caller has one.
             
         Returns:
             Dictionary containing paths to generated files or result data.
@@ -104,7 +133,12 @@ class OCREngine:
         logger.info(f"Processing PDF: {pdf_path}")
 
         
-        if not is_valid_pdf(pdf_path):
+        # parsed once; validity and page count come from the handle
+        own_document = document is None
+        if own_document:
+            document = open_document(pdf_path)
+
+        if not document.valid:
             logger.error(f"Corrupted or invalid PDF detected: {pdf_path}")
             return {
                 "success": False,
@@ -118,37 +152,29 @@ class OCREngine:
             logger.info(message)
 
         try:
-            reader = PdfReader(pdf_path)
-            total_pages = len(reader.pages)
+            total_pages = document.page_count
 
             notify(f"PDF loaded successfully ({total_pages} pages detected)")
 
-            # ---- Estimated per-page progress ----
-            progress = {"page": 0}
-            stop_flag = {"done": False}
-
-            def progress_simulator():
-                while not stop_flag["done"] and progress["page"] < total_pages:
-                    time.sleep(1.5)  # adjust based on system speed
-                    progress["page"] += 1
-                    notify(f"Processing page {progress['page']} of {total_pages}")
-
             notify("OCR started — processing pages (this may take some time)...")
 
-            t = threading.Thread(target=progress_simulator, daemon=True)
-            t.start()
-
-            result = self.converter.convert(pdf_path)
+            # ---- Real progress: one event per page Docling completes ----
+            tracker = ProgressTracker(total_pages, progress_cb, stage="convert")
+            token = _active_tracker.set(tracker)
+            try:
+                result = self.converter.convert(pdf_path)
+            finally:
+                _active_tracker.reset(token)
 
-            stop_flag["done"] = True
-            t.join()
+            # hook missing or never called → complete in one event
+            if tracker.done < total_pages:
+                tracker.page_done(total_pages, pages=total_pages - tracker.done)
 
             notify(f"OCR completed successfully ({total_pages} pages processed)")
 
             # Export to Markdown and Dict (JSON-serializable)
             notify("Exporting structured data (Markdown & JSON)...")
             markdown_content = result.document.export_to_markdown()
-
             json_dict = result.document.export_to_dict()
             
             output_paths = {}
@@ -193,6 +219,10 @@ class OCREngine:
                 "pdf": pdf_path
             }
 
+        finally:
+            if own_document:
+                document.close()
+
 
 if __name__ == "__main__":
     # Quick test if run directly